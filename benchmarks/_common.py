@@ -0,0 +1,68 @@
+"""Shared helpers for the benchmark scripts.
+
+Run any benchmark from the repository root, e.g.::
+
+    python -m benchmarks.bench_threads
+
+A display is required; as in ``tests/conftest.py`` an Xvfb server is
+started when ``DISPLAY`` is unset.
+"""
+
+import os
+import statistics
+import subprocess
+import time
+import tkinter
+
+
+def _setup_display():
+    if os.environ.get("DISPLAY"):
+        return
+    try:
+        subprocess.Popen(
+            ["Xvfb", ":99", "-screen", "0", "1024x768x24", "-ac"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return
+    os.environ["DISPLAY"] = ":99"
+    time.sleep(0.5)
+
+
+def make_root():
+    """Return a withdrawn Tk root with the fluent patch applied."""
+    _setup_display()
+    import fluent_tkinter  # noqa: F401
+    root = tkinter.Tk()
+    root.withdraw()
+    return root
+
+
+def timeit(func, repeat=5):
+    """Return the best wall time of *repeat* calls of *func*, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def percentile(values, pct):
+    """Return the *pct* percentile of *values*, as used by
+    :class:`fluent_tkinter.LatencyReport`."""
+    from fluent_tkinter._replay import _percentile
+    return _percentile(values, pct)
+
+
+def report(title, rows):
+    """Print a table of ``(label, value, unit)`` rows."""
+    print(f"\n{title}")
+    width = max(len(label) for label, _, _ in rows)
+    for label, value, unit in rows:
+        print(f"  {label:<{width}}  {value:12.3f} {unit}")
+
+
+def mean(values):
+    return statistics.fmean(values) if values else float("nan")
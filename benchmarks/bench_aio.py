@@ -0,0 +1,69 @@
+"""Idle CPU and event latency of the Tk-driven asyncio loop.
+
+Compares :func:`fluent_tkinter.run` with the common pattern of calling
+``root.update()`` from an asyncio task every 5 ms.
+"""
+
+import asyncio
+import time
+import tkinter
+
+import fluent_tkinter
+from benchmarks._common import make_root, mean, percentile, report
+
+IDLE_SECONDS = 2.0
+EVENTS = 200
+
+
+async def measure(root, frame):
+    start = time.process_time()
+    await asyncio.sleep(IDLE_SECONDS)
+    idle_cpu = (time.process_time() - start) / IDLE_SECONDS
+
+    latencies = []
+    for _ in range(EVENTS):
+        future = asyncio.get_running_loop().create_future()
+        funcid = frame.bind('<<Ping>>', lambda e: future.set_result(None))
+        sent = time.perf_counter()
+        frame.event_generate('<<Ping>>', when='tail')
+        await future
+        # Time from queuing the event until the coroutine resumes.
+        latencies.append(time.perf_counter() - sent)
+        frame.unbind('<<Ping>>', funcid)
+        await asyncio.sleep(0.002)
+    return idle_cpu, latencies
+
+
+async def polling(root, frame):
+    async def pump():
+        while True:
+            root.update()
+            await asyncio.sleep(0.005)
+    task = asyncio.create_task(pump())
+    try:
+        return await measure(root, frame)
+    finally:
+        task.cancel()
+
+
+def main():
+    root = make_root()
+    frame = tkinter.Frame(root).pack()
+    root.update()
+    for name, result in [
+            ("fluent_tkinter.run", fluent_tkinter.run(
+                measure(root, frame), root)),
+            ("asyncio.run + update() every 5 ms", asyncio.run(
+                polling(root, frame))),
+    ]:
+        idle_cpu, latencies = result
+        report(name, [
+            ("idle CPU", idle_cpu * 100, "%"),
+            ("event latency mean", mean(latencies) * 1e3, "ms"),
+            ("event latency p99", percentile(latencies, 99) * 1e3, "ms"),
+        ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Scheduler overhead for 10,000 concurrent awaiters.
+
+Measures how long it takes to create and resume 10k coroutines waiting on
+``after_async`` timers and on a single ``wait_event`` sequence, and compares
+the latter with the nested ``wait_variable`` approach.
+"""
+
+import asyncio
+import time
+import tkinter
+
+import fluent_tkinter
+from benchmarks._common import make_root, report
+
+AWAITERS = 10_000
+
+
+async def timers(root):
+    start = time.perf_counter()
+    futures = [root.after_async(10) for _ in range(AWAITERS)]
+    created = time.perf_counter()
+    await asyncio.gather(*futures)
+    return created - start, time.perf_counter() - created
+
+
+async def events(frame):
+    async def waiter():
+        return await frame.wait_event('<<Ping>>')
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(waiter()) for _ in range(AWAITERS)]
+    await asyncio.sleep(0)
+    created = time.perf_counter()
+    frame.event_generate('<<Ping>>', when='tail')
+    await asyncio.gather(*tasks)
+    return created - start, time.perf_counter() - created
+
+
+def nested_wait_variable(root, count):
+    # The classic approach: each waiter spins a nested event loop.
+    var = tkinter.IntVar(root)
+    start = time.perf_counter()
+
+    def wait(depth):
+        if depth:
+            root.after_idle(wait, depth - 1)
+        root.wait_variable(var)
+
+    root.after(10, var.set, 1)
+    wait(count)
+    return time.perf_counter() - start
+
+
+def main():
+    root = make_root()
+    frame = tkinter.Frame(root).pack()
+    root.update()
+    create, resume = fluent_tkinter.run(timers(root), root)
+    report(f"after_async: {AWAITERS} awaiters", [
+        ("create", create * 1e3, "ms"),
+        ("resume all (incl. 10 ms timer)", resume * 1e3, "ms"),
+    ])
+    create, resume = fluent_tkinter.run(events(frame), root)
+    report(f"wait_event: {AWAITERS} awaiters", [
+        ("create", create * 1e3, "ms"),
+        ("resume all", resume * 1e3, "ms"),
+    ])
+    # Deep nested event loops hit the recursion limit long before 10k.
+    depth = 200
+    report(f"nested wait_variable: {depth} waiters", [
+        ("total", nested_wait_variable(root, depth) * 1e3, "ms"),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
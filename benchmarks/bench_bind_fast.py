@@ -0,0 +1,56 @@
+"""Motion event throughput with ``bind`` versus ``bind_fast``.
+
+Generates ``<Motion>`` events on a frame whose handler reads only the
+pointer position, bound with ``bind`` (a full ``tkinter.Event`` per event)
+and with ``bind_fast`` (an ``(x, y)`` named tuple).  Reported is the time
+per delivered event.
+"""
+
+import tkinter
+
+from benchmarks._common import make_root, report, timeit
+
+EVENTS = 20_000
+
+
+def workload(frame):
+    positions = []
+    handler = lambda event: positions.append((event.x, event.y))
+    generate = frame.event_generate
+
+    def send():
+        for i in range(EVENTS):
+            generate('<Motion>', x=i % 100, y=i % 50)
+
+    return handler, send
+
+
+def main():
+    root = make_root()
+    frame = tkinter.Frame(root, width=100, height=50)
+    frame.pack()
+    root.update()
+
+    handler, send = workload(frame)
+    baseline = timeit(send, repeat=3)
+    frame.bind('<Motion>', handler)
+    bound = timeit(send, repeat=3)
+    frame.unbind('<Motion>')
+    frame.bind_fast('<Motion>', handler, fields=('x', 'y'))
+    fast = timeit(send, repeat=3)
+    frame.unbind('<Motion>')
+
+    report(f'{EVENTS} <Motion> events', [
+        ('event_generate, no binding', baseline / EVENTS * 1e6, 'us/event'),
+        ('bind', bound / EVENTS * 1e6, 'us/event'),
+        ('bind_fast', fast / EVENTS * 1e6, 'us/event'),
+        ('bind: handler overhead', (bound - baseline) / EVENTS * 1e6,
+         'us/event'),
+        ('bind_fast: handler overhead', (fast - baseline) / EVENTS * 1e6,
+         'us/event'),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Registering callbacks as Tcl commands versus shared callback handles.
+
+Registers 100,000 callbacks on one widget, as a long-lived application
+accumulating bindings and ``after`` calls does, with one Tcl command per
+callback and with ``use_shared_callbacks``.  Reported are the registration
+time, the Python memory allocated (tracemalloc) and the cost of invoking
+and releasing the callbacks.
+"""
+
+import time
+import tracemalloc
+import tkinter
+
+from benchmarks._common import make_root, report
+
+COUNT = 100_000
+
+
+def run(root, shared):
+    root.use_shared_callbacks(shared)
+    widget = tkinter.Frame(root)
+    funcs = [(lambda i=i: i) for i in range(COUNT)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    names = [widget._register(func) for func in funcs]
+    registered = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for name in names[:10_000]:
+        root.tk.eval(name)
+    invoked = (time.perf_counter() - start) / 10_000
+    start = time.perf_counter()
+    widget.destroy()
+    released = time.perf_counter() - start
+    return registered, memory, invoked, released
+
+
+def main():
+    root = make_root()
+    rows = []
+    for label, shared in [('one command each', False),
+                          ('shared handles', True)]:
+        registered, memory, invoked, released = run(root, shared)
+        rows.append((f'{label}: register', registered * 1e3, 'ms'))
+        rows.append((f'{label}: Python memory', memory / 2**20, 'MiB'))
+        rows.append((f'{label}: invoke', invoked * 1e6, 'us'))
+        rows.append((f'{label}: destroy', released * 1e3, 'ms'))
+    report(f'{COUNT} callbacks', rows)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Handler invocations and CPU time with and without event coalescing.
+
+Simulates a drag: 200 frames of 25 ``<B1-Motion>`` events each, generated
+with ``event_generate`` and followed by an idle cycle, as a fast pointer
+produces between two redraws.  The handler moves a canvas item to the
+pointer.  Reported are the handler calls and the process CPU time for
+``bind``, ``bind_fast`` and ``bind_coalesced``.
+"""
+
+import time
+import tkinter
+
+from benchmarks._common import make_root, report
+
+FRAMES = 200
+EVENTS_PER_FRAME = 25
+
+
+def drag(root, canvas):
+    calls = 0
+    item = canvas.create_rectangle(0, 0, 10, 10)
+
+    def handler(event):
+        nonlocal calls
+        calls += 1
+        canvas.coords(item, event.x, event.y, event.x + 10, event.y + 10)
+
+    def run():
+        start = time.process_time()
+        for frame in range(FRAMES):
+            for i in range(EVENTS_PER_FRAME):
+                canvas.event_generate('<B1-Motion>', x=i, y=frame % 100,
+                                      state=0x100)
+            root.update_idletasks()
+        return time.process_time() - start
+
+    return handler, run, lambda: calls
+
+
+def main():
+    root = make_root()
+    canvas = tkinter.Canvas(root, width=200, height=200)
+    canvas.pack()
+    root.update()
+
+    rows = []
+    for label, bind in [
+        ('bind', lambda h: canvas.bind('<B1-Motion>', h)),
+        ('bind_fast', lambda h: canvas.bind_fast('<B1-Motion>', h)),
+        ('bind_coalesced', lambda h: canvas.bind_coalesced(
+            '<B1-Motion>', h, fields=('x', 'y'))),
+    ]:
+        handler, run, calls = drag(root, canvas)
+        bind(handler)
+        cpu = run()
+        canvas.unbind('<B1-Motion>')
+        rows.append((f'{label}: handler calls', calls(), ''))
+        rows.append((f'{label}: CPU', cpu * 1e3, 'ms'))
+    report(f'{FRAMES} frames x {EVENTS_PER_FRAME} motion events', rows)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Soak test: registered Tcl commands over 1,000,000 rebinds.
+
+With the cleanup wrappers the command count stays flat; the stock tkinter
+behaviour (one leaked command per rebind) is shown for a short run by
+calling the unwrapped ``_bind`` directly.
+"""
+
+import time
+import tkinter
+
+from benchmarks._common import make_root, report
+
+REBINDS = 1_000_000
+CHECKPOINTS = 5
+
+
+def handler(event):
+    pass
+
+
+def main():
+    root = make_root()
+    frame = tkinter.Frame(root)
+    rows = []
+    start = time.perf_counter()
+    step = REBINDS // CHECKPOINTS
+    for done in range(step, REBINDS + 1, step):
+        for _ in range(step):
+            frame.bind('<Motion>', handler)
+        rows.append((f"commands after {done} rebinds",
+                     root.command_report().total, ""))
+    elapsed = time.perf_counter() - start
+    rows.append(("rebind cost", elapsed / REBINDS * 1e6, "us/rebind"))
+    report("fluent bind (superseded commands deleted)", rows)
+
+    leaky = tkinter.Frame(root)
+    before = root.command_report().total
+    for _ in range(10_000):
+        leaky._bind(('bind', leaky._w), '<Motion>', handler, None)
+    report("stock _bind", [
+        ("commands leaked by 10000 rebinds",
+         root.command_report().total - before, ""),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Geometry of a 1,000-widget tree: per-widget ``winfo`` calls versus
+``geometry_snapshot``.
+
+The tree is 20 frames of 49 labels each, gridded and mapped.  A layout
+overlay reads the root position, size and mapped state of every widget.
+"""
+
+import tkinter
+
+from benchmarks._common import make_root, report, timeit
+
+FRAMES = 20
+LABELS = 49
+
+
+def per_widget(widgets):
+    return {w: (w.winfo_rootx(), w.winfo_rooty(), w.winfo_width(),
+                w.winfo_height(), w.winfo_ismapped()) for w in widgets}
+
+
+def main():
+    root = make_root()
+    root.deiconify()
+    top = tkinter.Frame(root)
+    top.pack()
+    widgets = [top]
+    for f in range(FRAMES):
+        frame = tkinter.Frame(top).grid(row=f // 5, column=f % 5)
+        widgets.append(frame)
+        for i in range(LABELS):
+            widgets.append(tkinter.Label(frame, text=i, font='TkFixedFont 6')
+                           .grid(row=i // 7, column=i % 7))
+    root.update()
+
+    calls = timeit(lambda: per_widget(widgets))
+    snapshot = timeit(lambda: top.geometry_snapshot())
+    report(f'geometry of {len(widgets)} widgets', [
+        ('winfo_* per widget', calls * 1e3, 'ms'),
+        ('geometry_snapshot', snapshot * 1e3, 'ms'),
+        ('speedup', calls / snapshot, 'x'),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
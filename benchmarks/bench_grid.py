@@ -0,0 +1,54 @@
+"""Laying out a 100x30 matrix of Entry widgets.
+
+Compares one ``grid_configure`` per cell plus one ``grid_columnconfigure``
+per column with a single ``grid_many`` and ``grid_weights`` call.  The
+timing includes the ``update_idletasks`` that computes the layout.
+"""
+
+import tkinter
+
+from benchmarks._common import make_root, report, timeit
+
+ROWS = 100
+COLUMNS = 30
+
+
+def make_matrix(frame):
+    return [[tkinter.Entry(frame, width=6) for _ in range(COLUMNS)]
+            for _ in range(ROWS)]
+
+
+def main():
+    root = make_root()
+    frame = tkinter.Frame(root)
+    frame.pack()
+    matrix = make_matrix(frame)
+    slaves = [entry for row in matrix for entry in row]
+
+    def reset():
+        root.tk.call('grid', 'forget', *slaves)
+        root.update_idletasks()
+
+    def per_cell():
+        reset()
+        for r, row in enumerate(matrix):
+            for c, entry in enumerate(row):
+                entry.grid_configure(row=r, column=c, sticky='ew')
+        for c in range(COLUMNS):
+            frame.grid_columnconfigure(c, weight=1)
+        root.update_idletasks()
+
+    def bulk():
+        reset()
+        frame.grid_many(matrix, sticky='ew').grid_weights(columns=1)
+        root.update_idletasks()
+
+    report(f'{ROWS}x{COLUMNS} grid layout', [
+        ('grid_configure per cell', timeit(per_cell) * 1e3, 'ms'),
+        ('grid_many + grid_weights', timeit(bulk) * 1e3, 'ms'),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Input latency while filling a Treeview with 200,000 rows.
+
+A Tcl timer probe scheduled every 5 ms records how late it runs, which is
+how long an input event would wait for the event loop.  The rows are
+inserted once in a plain loop and once as an ``idle_work`` generator with
+an 8 ms budget.  Reported are the total fill time and the p50 and max
+lateness of the probe.
+"""
+
+import time
+import tkinter.ttk as ttk
+
+from benchmarks._common import make_root, percentile, report
+
+ROWS = 200_000
+
+# Reschedules itself every 5 ms and records the lateness in microseconds.
+PROBE = """
+proc probe {due} {
+    set now [clock microseconds]
+    lappend ::lateness [expr {$now - $due}]
+    set ::probe [after 5 [list probe [expr {$now + 5000}]]]
+}
+"""
+
+
+def fill(tree):
+    insert = tree.insert
+    for i in range(ROWS):
+        insert('', 'end', values=(i, f'row {i}', i * 7 % 1000))
+        yield
+
+
+def run(root, tree, incremental):
+    tree.delete(*tree.get_children())
+    root.update()
+    root.tk.eval('set ::lateness {}; probe [clock microseconds]')
+    start = time.perf_counter()
+    if incremental:
+        future = root.idle_work(fill(tree), budget_ms=8)
+        while not future.done():
+            root.update()
+    else:
+        for _ in fill(tree):
+            pass
+        root.update()
+    elapsed = time.perf_counter() - start
+    root.tk.eval('after cancel $::probe')
+    lateness = [int(v) / 1000 for v in
+                root.tk.splitlist(root.tk.eval('set ::lateness'))]
+    return elapsed, lateness
+
+
+def main():
+    root = make_root()
+    root.tk.eval(PROBE)
+    tree = ttk.Treeview(root, columns=('id', 'name', 'value'),
+                        show='headings')
+    tree.pack()
+    rows = []
+    for label, incremental in [('plain loop', False),
+                               ('idle_work', True)]:
+        elapsed, lateness = run(root, tree, incremental)
+        rows.append((f'{label}: fill time', elapsed, 's'))
+        rows.append((f'{label}: input latency p50',
+                     percentile(lateness, 50), 'ms'))
+        rows.append((f'{label}: input latency max', max(lateness), 'ms'))
+    report(f'{ROWS} Treeview rows', rows)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Repeatedly loading the images in ``imghdrdata/``.
+
+Compares constructing ``PhotoImage(file=...)`` for every use against
+``fluent_tkinter.images.load``.  Formats Tk cannot decode are skipped.
+"""
+
+import os
+import time
+import tkinter
+
+from fluent_tkinter import images
+from benchmarks._common import make_root, report
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'imghdrdata')
+ROUNDS = 200
+
+
+def readable_files(root):
+    files = []
+    for name in sorted(os.listdir(DATA_DIR)):
+        path = os.path.join(DATA_DIR, name)
+        try:
+            tkinter.PhotoImage(master=root, file=path)
+        except tkinter.TclError:
+            continue
+        files.append(path)
+    return files
+
+
+def main():
+    root = make_root()
+    files = readable_files(root)
+    print("formats:", ", ".join(os.path.basename(f) for f in files))
+    labels = [tkinter.Label(root) for _ in files]
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for label, path in zip(labels, files):
+            image = tkinter.PhotoImage(master=root, file=path)
+            label.configure(image=image)
+            label.image = image
+    uncached = time.perf_counter() - start
+
+    cache = images.cache(root)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for label, path in zip(labels, files):
+            label.configure(image=images.load(path, master=root))
+    cached = time.perf_counter() - start
+    stats = cache.stats()
+
+    loads = ROUNDS * len(files)
+    report(f"{loads} loads of {len(files)} files", [
+        ("PhotoImage(file=...)", uncached / loads * 1e6, "us/load"),
+        ("images.load", cached / loads * 1e6, "us/load"),
+        ("cache hits", stats.hits, ""),
+        ("decoded bytes held", stats.nbytes / 1024, "KiB"),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Repopulating a panel of 500 children with and without ``layout_batch``.
+
+Each round destroys the children of a packed frame and packs 500 new
+labels, processing events every 50 children as a long-running handler
+that keeps the UI alive would.  Reported are the wall time per round and
+the number of ``<Configure>`` and ``<Expose>`` events the panel received,
+i.e. how often it was laid out and redrawn.
+"""
+
+import tkinter
+
+from benchmarks._common import make_root, report, timeit
+
+CHILDREN = 500
+UPDATE_EVERY = 50
+
+
+def main():
+    root = make_root()
+    root.deiconify()
+    panel = tkinter.Frame(root)
+    panel.pack(fill='both', expand=True)
+    counts = {'Configure': 0, 'Expose': 0}
+
+    def count(event):
+        counts[str(event.type)] += 1
+
+    panel.bind('<Configure>', count)
+    panel.bind('<Expose>', count)
+
+    def repopulate():
+        for child in panel.winfo_children():
+            child.destroy()
+        for i in range(CHILDREN):
+            tkinter.Label(panel, text=f'row {i}').pack(anchor='w')
+            if i % UPDATE_EVERY == 0:
+                root.update()
+
+    def plain():
+        repopulate()
+        root.update()
+
+    def batched():
+        with panel.layout_batch():
+            repopulate()
+        root.update()
+
+    rows = []
+    for label, func in [('plain', plain), ('layout_batch', batched)]:
+        root.update()
+        counts.update(Configure=0, Expose=0)
+        rounds = 5
+        elapsed = timeit(func, repeat=rounds)
+        rows.append((f'{label}: time', elapsed * 1e3, 'ms'))
+        rows.append((f'{label}: <Configure>', counts['Configure'] / rounds,
+                     'per round'))
+        rows.append((f'{label}: <Expose>', counts['Expose'] / rounds,
+                     'per round'))
+    report(f'repopulating {CHILDREN} children', rows)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Building a menu of 5,000 entries.
+
+The menu has 50 cascades of 100 command entries each.  Compared are
+``add_cascade``/``add_command`` per entry and a single ``Menu.build``;
+also reported is how many Tcl commands each approach registers.
+"""
+
+import tkinter
+
+from benchmarks._common import make_root, report, timeit
+
+CASCADES = 50
+ENTRIES = 100
+
+
+def noop():
+    pass
+
+
+def spec():
+    return [(f'Group {g}', [(f'Item {g}.{i}', noop, {'accelerator': str(i)})
+                            for i in range(ENTRIES)])
+            for g in range(CASCADES)]
+
+
+def commands(root):
+    return root.command_report().total
+
+
+def main():
+    root = make_root()
+    counts = {}
+
+    def per_entry():
+        before = commands(root)
+        menu = tkinter.Menu(root, tearoff=0)
+        for g in range(CASCADES):
+            sub = tkinter.Menu(menu, tearoff=0)
+            for i in range(ENTRIES):
+                sub.add_command(label=f'Item {g}.{i}', command=noop,
+                                accelerator=str(i))
+            menu.add_cascade(label=f'Group {g}', menu=sub)
+        counts['per entry'] = commands(root) - before
+        menu.destroy()
+
+    def built():
+        before = commands(root)
+        menu = tkinter.Menu(root, tearoff=0).build(spec())
+        counts['build'] = commands(root) - before
+        menu.destroy()
+
+    report(f'{CASCADES * ENTRIES} menu entries', [
+        ('add_command per entry', timeit(per_entry) * 1e3, 'ms'),
+        ('Menu.build', timeit(built) * 1e3, 'ms'),
+        ('Tcl commands, per entry', counts['per entry'], ''),
+        ('Tcl commands, build', counts['build'], ''),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
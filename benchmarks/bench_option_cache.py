@@ -0,0 +1,48 @@
+"""Refreshing a property inspector: cached versus stock option queries.
+
+The inspector shows ``keys()`` and the ``configure()`` description of 40
+widgets of mixed Tk and ttk classes and is refreshed 50 times.  The stock
+tkinter code path (``Misc._getconfigure``) is timed against the cached
+``configure()``.
+"""
+
+import tkinter
+import tkinter.ttk as ttk
+
+from benchmarks._common import make_root, report, timeit
+
+REFRESHES = 50
+
+
+def stock_refresh(widgets):
+    for widget in widgets:
+        splitlist = widget.tk.splitlist
+        [splitlist(x)[0][1:]
+         for x in splitlist(widget.tk.call(widget._w, 'configure'))]
+        widget._getconfigure(widget._w, 'configure')
+
+
+def cached_refresh(widgets):
+    for widget in widgets:
+        widget.keys()
+        widget.configure()
+
+
+def main():
+    root = make_root()
+    classes = [tkinter.Button, tkinter.Label, tkinter.Entry, tkinter.Canvas,
+               tkinter.Text, ttk.Button, ttk.Entry, ttk.Treeview]
+    widgets = [classes[i % len(classes)](root) for i in range(40)]
+    rows = []
+    for label, refresh in [('stock tkinter', stock_refresh),
+                           ('cached option tables', cached_refresh)]:
+        elapsed = timeit(lambda: [refresh(widgets)
+                                  for _ in range(REFRESHES)])
+        rows.append((f'{label}: per refresh', elapsed / REFRESHES * 1e3,
+                     'ms'))
+    report(f'inspector refresh of {len(widgets)} widgets', rows)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Frames per second pushing 1080p frames into a PhotoImage.
+
+Compares ``PhotoImage.put`` with Tcl-formatted colour strings against
+``put_buffer`` with raw RGB and RGBA bytes.
+"""
+
+import os
+import time
+import tkinter
+
+from benchmarks._common import make_root, report
+
+WIDTH, HEIGHT = 1920, 1080
+FRAMES = 10
+
+
+def frames(channels):
+    # A few distinct random frames, so Tk cannot skip identical data.
+    return [os.urandom(WIDTH * HEIGHT * channels) for _ in range(3)]
+
+
+def put_strings(image, frame):
+    rows = []
+    for y in range(HEIGHT):
+        row = frame[y * WIDTH * 3:(y + 1) * WIDTH * 3]
+        rows.append('{' + ' '.join(
+            '#%02x%02x%02x' % (row[i], row[i + 1], row[i + 2])
+            for i in range(0, len(row), 3)) + '}')
+    image.put(' '.join(rows))
+
+
+def fps(root, upload, data, count):
+    start = time.perf_counter()
+    for i in range(count):
+        upload(data[i % len(data)])
+        root.update_idletasks()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    root = make_root()
+    image = tkinter.PhotoImage(master=root, width=WIDTH, height=HEIGHT)
+    tkinter.Label(root, image=image).pack()
+    rgb, rgba = frames(3), frames(4)
+    report(f"{WIDTH}x{HEIGHT} frames per second", [
+        ("put with colour strings",
+         fps(root, lambda f: put_strings(image, f), rgb, 2), "fps"),
+        ("put_buffer RGB",
+         fps(root, lambda f: image.put_buffer(f, WIDTH, HEIGHT), rgb,
+             FRAMES), "fps"),
+        ("put_buffer RGBA",
+         fps(root, lambda f: image.put_buffer(f, WIDTH, HEIGHT, 'RGBA'),
+             rgba, FRAMES), "fps"),
+        ("put_buffer RGB, 320x240 dirty box",
+         fps(root, lambda f: image.put_buffer(
+             f, WIDTH, HEIGHT, box=(800, 400, 1120, 640)), rgb,
+             FRAMES * 10), "fps"),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
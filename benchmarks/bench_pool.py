@@ -0,0 +1,82 @@
+"""Recycling result rows with ``WidgetPool`` versus recreating them.
+
+Each round shows 50 rows (a frame with an icon label, a text label and two
+buttons) and then removes them, as a search-as-you-type list does.
+Reported are the latency per round and the growth of the Tcl command
+table over all rounds.
+"""
+
+import time
+import tkinter
+
+from fluent_tkinter import WidgetPool
+from benchmarks._common import make_root, percentile, report
+
+ROWS = 50
+ROUNDS = 200
+
+
+class Row(tkinter.Frame):
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.icon = tkinter.Label(self, text='*').pack(side='left')
+        self.text = tkinter.Label(self).pack(side='left', fill='x')
+        self.open = tkinter.Button(self, text='Open').pack(side='right')
+        self.close = tkinter.Button(self, text='x').pack(side='right')
+
+    def show(self, text):
+        self.text.configure(text=text)
+        self.open.configure(command=lambda: print('open', text))
+        self.close.configure(command=lambda: print('close', text))
+
+
+def make_row(master, text):
+    row = Row(master)
+    row.show(text)
+    return row
+
+
+def run(root, show, hide):
+    count = lambda: len(root.tk.splitlist(root.tk.call('info', 'commands')))
+    before = count()
+    latencies = []
+    for r in range(ROUNDS):
+        start = time.perf_counter()
+        rows = [show(f'result {r}.{i}') for i in range(ROWS)]
+        root.update_idletasks()
+        for row in rows:
+            hide(row)
+        latencies.append(time.perf_counter() - start)
+    root.update()
+    return latencies, count() - before
+
+
+def main():
+    root = make_root()
+    panel = tkinter.Frame(root)
+    panel.pack()
+
+    created, growth = run(
+        root,
+        lambda text: make_row(panel, text).pack(fill='x'),
+        lambda row: row.destroy())
+    pool = WidgetPool(lambda: Row(panel), reset=Row.show, maxsize=ROWS)
+    pooled, pooled_growth = run(
+        root,
+        lambda text: pool.acquire(text).pack(fill='x'),
+        pool.release)
+
+    rows = []
+    for label, latencies, commands in [('destroy/create', created, growth),
+                                       ('WidgetPool', pooled, pooled_growth)]:
+        rows.append((f'{label}: p50', percentile(latencies, 50) * 1e3, 'ms'))
+        rows.append((f'{label}: p99', percentile(latencies, 99) * 1e3, 'ms'))
+        rows.append((f'{label}: Tcl commands added', commands, ''))
+    report(f'{ROUNDS} rounds of {ROWS} rows', rows)
+    pool.clear()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
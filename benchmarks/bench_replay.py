@@ -0,0 +1,76 @@
+"""Input-to-redraw latency of a busy canvas, measured with ``InputReplay``.
+
+A canvas holds 2,000 items; dragging moves all of them.  A drag of 300
+motion events is replayed at 120 Hz, once on an idle application and once
+while a timer does 5 ms of work every 10 ms.  Reported are the p50 and p99
+latency between handler entry and the end of the following redraw.
+
+Passing ``--max-p99 MS`` turns the run into a regression gate that exits
+with an error when the loaded p99 exceeds MS milliseconds.
+"""
+
+import sys
+import time
+import tkinter
+
+from fluent_tkinter import InputReplay
+from benchmarks._common import make_root, report
+
+ITEMS = 2000
+MOTIONS = 300
+
+
+def busy_timer(root, work_ms, every_ms):
+    def tick():
+        end = time.perf_counter() + work_ms / 1000
+        while time.perf_counter() < end:
+            pass
+        timer[0] = root.after(every_ms, tick)
+    timer = [root.after(every_ms, tick)]
+    return lambda: root.after_cancel(timer[0])
+
+
+def main():
+    max_p99 = None
+    if '--max-p99' in sys.argv:
+        max_p99 = float(sys.argv[sys.argv.index('--max-p99') + 1])
+    root = make_root()
+    root.deiconify()
+    canvas = tkinter.Canvas(root, width=400, height=400)
+    canvas.pack()
+    for i in range(ITEMS):
+        x, y = i % 40 * 10, i // 40 * 8
+        canvas.create_rectangle(x, y, x + 6, y + 6, fill='gray')
+    last = [0, 0]
+
+    def press(event):
+        last[:] = event.x, event.y
+
+    def drag(event):
+        canvas.move('all', event.x - last[0], event.y - last[1])
+        last[:] = event.x, event.y
+
+    canvas.bind('<ButtonPress-1>', press)
+    canvas.bind('<B1-Motion>', drag)
+    root.update()
+    replay = InputReplay(canvas).drag(
+        [(100 + i % 100, 100 + i % 37) for i in range(MOTIONS)])
+
+    idle = replay.run(rate_hz=120, warmup=10)
+    stop = busy_timer(root, 5, 10)
+    loaded = replay.run(rate_hz=120, warmup=10)
+    stop()
+
+    rows = []
+    for label, result in [('idle', idle), ('5 ms timer every 10 ms', loaded)]:
+        rows.append((f'{label}: p50', result.p50, 'ms'))
+        rows.append((f'{label}: p99', result.p99, 'ms'))
+        rows.append((f'{label}: missed events', result.missed, ''))
+    report(f'drag of {MOTIONS} motions over {ITEMS} canvas items', rows)
+    root.destroy()
+    if max_p99 is not None:
+        loaded.check(p99=max_p99)
+
+
+if __name__ == "__main__":
+    main()
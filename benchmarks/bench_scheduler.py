@@ -0,0 +1,74 @@
+"""100,000 timers: ``Misc.after`` versus the multiplexing scheduler.
+
+Reports insert, cancel and fire times and the number of Tcl commands alive
+while the timers are pending.
+"""
+
+import time
+
+from benchmarks._common import make_root, report
+
+TIMERS = 100_000
+
+
+def commands(root):
+    return len(root.tk.call('info', 'commands'))
+
+
+def wait_until(root, predicate):
+    while not predicate():
+        root.tk.dooneevent()
+
+
+def bench_after(root):
+    base = commands(root)
+    fired = []
+    start = time.perf_counter()
+    ids = [root.after(1000 + i % 500, fired.append, i) for i in range(TIMERS)]
+    insert = time.perf_counter() - start
+    alive = commands(root) - base
+    start = time.perf_counter()
+    for after_id in ids[::2]:
+        root.after_cancel(after_id)
+    cancel = time.perf_counter() - start
+    start = time.perf_counter()
+    wait_until(root, lambda: len(fired) == TIMERS // 2)
+    fire = time.perf_counter() - start
+    return insert, cancel, fire, alive
+
+
+def bench_scheduler(root):
+    sched = root.scheduler()
+    base = commands(root)
+    fired = []
+    start = time.perf_counter()
+    handles = [sched.call_later(1000 + i % 500, fired.append, i)
+               for i in range(TIMERS)]
+    insert = time.perf_counter() - start
+    alive = commands(root) - base
+    start = time.perf_counter()
+    for handle in handles[::2]:
+        handle.cancel()
+    cancel = time.perf_counter() - start
+    start = time.perf_counter()
+    wait_until(root, lambda: len(fired) == TIMERS // 2)
+    fire = time.perf_counter() - start
+    return insert, cancel, fire, alive
+
+
+def main():
+    root = make_root()
+    for name, bench in [("Misc.after", bench_after),
+                        ("Scheduler.call_later", bench_scheduler)]:
+        insert, cancel, fire, alive = bench(root)
+        report(f"{name}: {TIMERS} timers", [
+            ("insert", insert * 1e3, "ms"),
+            (f"cancel {TIMERS // 2}", cancel * 1e3, "ms"),
+            ("fire remaining (incl. ~1.5 s wait)", fire * 1e3, "ms"),
+            ("Tcl commands while pending", alive, "commands"),
+        ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Theme switching with 200 styled widgets alive.
+
+Each switch selects a theme and restyles 40 custom styles (configure, map
+and layout), then runs the 400 ``lookup`` queries a custom widget library
+might make to size its widgets.  Compared are one ``Style`` call per
+setting with ``Style.apply`` plus cached lookups.
+"""
+
+from tkinter import ttk
+
+from benchmarks._common import make_root, report, timeit
+
+STYLES = 40
+WIDGETS = 200
+
+
+def make_settings(theme):
+    colour = 'navy' if theme == 'clam' else 'darkred'
+    return {
+        f'S{i}.TButton': {
+            'configure': {'padding': (4, 2), 'foreground': colour},
+            'map': {'foreground': [('active', 'red'), ('disabled', 'grey')]},
+            'layout': [('Button.border', {'sticky': 'nswe', 'children': [
+                ('Button.padding', {'sticky': 'nswe', 'children': [
+                    ('Button.label', {'sticky': 'nswe'})]})]})],
+        }
+        for i in range(STYLES)
+    }
+
+
+def main():
+    root = make_root()
+    style = ttk.Style(root)
+    themes = [t for t in ('clam', 'alt') if t in style.theme_names()]
+    for i in range(WIDGETS):
+        ttk.Button(root, text=str(i), style=f'S{i % STYLES}.TButton').pack()
+    settings = {theme: make_settings(theme) for theme in themes}
+    lookup = ttk.Style.lookup.__wrapped__
+
+    def per_call():
+        for theme in themes:
+            style.theme_use(theme)
+            for name, opts in settings[theme].items():
+                style.configure(name, **opts['configure'])
+                style.map(name, **opts['map'])
+                style.layout(name, opts['layout'])
+            for i in range(WIDGETS):
+                for option in ('padding', 'foreground'):
+                    lookup(style, f'S{i % STYLES}.TButton', option)
+            root.update_idletasks()
+
+    def batched():
+        for theme in themes:
+            style.theme_use(theme)
+            style.apply(settings[theme])
+            for i in range(WIDGETS):
+                for option in ('padding', 'foreground'):
+                    style.lookup(f'S{i % STYLES}.TButton', option)
+            root.update_idletasks()
+
+    report(f'switching {len(themes)} themes, {WIDGETS} widgets', [
+        ('per-call configure/map/layout', timeit(per_call) * 1e3, 'ms'),
+        ('Style.apply + cached lookup', timeit(batched) * 1e3, 'ms'),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Building a 50-widget dialog 100 times, directly and from a Template.
+
+The dialog is a frame holding 24 label/entry rows and an OK button, all
+gridded; half of the labels take their text from a parameter.
+"""
+
+import tkinter
+
+from fluent_tkinter import Param, Template
+from benchmarks._common import make_root, report, timeit
+
+ROWS = 24
+COUNT = 100
+
+
+def build_direct(master, title, on_ok):
+    frame = tkinter.Frame(master, padx=8, pady=8)
+    for i in range(ROWS):
+        text = title if i % 2 else f'Field {i}'
+        tkinter.Label(frame, text=text, anchor='w').grid(
+            row=i, column=0, sticky='w')
+        tkinter.Entry(frame, width=20).grid(row=i, column=1, sticky='ew',
+                                            padx=(4, 0))
+    tkinter.Button(frame, text='OK', command=on_ok).grid(
+        row=ROWS, column=1, sticky='e')
+    return frame
+
+
+def make_template(root):
+    form = Template(root)
+    frame = form.widget(tkinter.Frame, padx=8, pady=8)
+    for i in range(ROWS):
+        text = Param('title') if i % 2 else f'Field {i}'
+        form.widget(tkinter.Label, frame, text=text, anchor='w').grid(
+            row=i, column=0, sticky='w')
+        form.widget(tkinter.Entry, frame, width=20).grid(
+            row=i, column=1, sticky='ew', padx=(4, 0))
+    form.widget(tkinter.Button, frame, text='OK',
+                command=Param('on_ok')).grid(row=ROWS, column=1, sticky='e')
+    return form
+
+
+def main():
+    root = make_root()
+    form = make_template(root)
+
+    def direct():
+        frames = [build_direct(root, 'Title', root.bell)
+                  for _ in range(COUNT)]
+        for frame in frames:
+            frame.destroy()
+
+    def templated():
+        frames = [form.instantiate(root, title='Title', on_ok=root.bell).root
+                  for _ in range(COUNT)]
+        for frame in frames:
+            frame.destroy()
+
+    report(f'{COUNT} dialogs of {2 * ROWS + 2} widgets', [
+        ('direct construction', timeit(direct) * 1e3, 'ms'),
+        ('Template.instantiate', timeit(templated) * 1e3, 'ms'),
+    ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
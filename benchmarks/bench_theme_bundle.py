@@ -0,0 +1,69 @@
+"""Cold versus warm start of a 150-style theme with ``load_theme``.
+
+Each start creates a fresh Tk interpreter and loads the theme: the cold
+start builds the settings in Python and writes the cache file, the warm
+start only sources that file.  ``theme_create`` with the same settings is
+shown for reference.
+"""
+
+import shutil
+import tempfile
+import tkinter
+from tkinter import ttk
+
+from benchmarks._common import make_root, report, timeit
+
+STYLES = 150
+
+
+def build():
+    palette = ['#%02x%02x%02x' % (i, 255 - i, (i * 7) % 256)
+               for i in range(0, 256, 16)]
+    settings = {}
+    for i in range(STYLES):
+        colour = palette[i % len(palette)]
+        for base in ('TButton', 'TLabel', 'TEntry'):
+            settings[f'S{i}.{base}'] = {
+                'configure': {'foreground': colour, 'padding': (4, 2),
+                              'font': ('Helvetica', 10 + i % 4)},
+                'map': {'foreground': [('disabled', 'grey'),
+                                       ('active', '!pressed', colour)]},
+            }
+    return settings
+
+
+def main():
+    root = make_root()
+    cache_dir = tempfile.mkdtemp()
+    try:
+        def start(load):
+            interp = tkinter.Tk()
+            interp.withdraw()
+            load(ttk.Style(interp))
+            interp.destroy()
+
+        def plain(style):
+            style.theme_create('bench', 'default', build())
+
+        def cold(style):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            style.load_theme('bench', build, 'default', cache_dir=cache_dir)
+
+        def warm(style):
+            style.load_theme('bench', build, 'default', cache_dir=cache_dir)
+
+        startup = timeit(lambda: start(lambda style: None))
+        rows = [('empty interpreter', startup * 1e3, 'ms')]
+        for label, load in [('theme_create', plain),
+                            ('load_theme, cold', cold),
+                            ('load_theme, warm', warm)]:
+            elapsed = timeit(lambda: start(load)) - startup
+            rows.append((label, elapsed * 1e3, 'ms'))
+        report(f'theme with {3 * STYLES} styles', rows)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
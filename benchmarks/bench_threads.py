@@ -0,0 +1,87 @@
+"""Cross-thread update throughput and latency.
+
+Compares ``widget.from_thread()`` against the hand-rolled pattern of a
+``queue.Queue`` drained by an ``after(10)`` polling loop.
+"""
+
+import queue
+import threading
+import time
+import tkinter
+
+from benchmarks._common import make_root, mean, percentile, report
+
+UPDATES = 20_000
+
+
+def run_fluent(root, label):
+    latencies = []
+    done = threading.Event()
+
+    def apply(sent, last):
+        label.configure(text=sent)
+        latencies.append(time.perf_counter() - sent)
+        if last:
+            done.set()
+
+    def worker():
+        for i in range(UPDATES):
+            label.call_from_thread(apply, time.perf_counter(),
+                                   i == UPDATES - 1)
+
+    start = time.perf_counter()
+    threading.Thread(target=worker).start()
+    while not done.is_set():
+        root.tk.dooneevent()
+    return time.perf_counter() - start, latencies
+
+
+def run_polling(root, label):
+    latencies = []
+    pending = queue.Queue()
+    done = threading.Event()
+
+    def poll():
+        try:
+            while True:
+                sent, last = pending.get_nowait()
+                label.configure(text=sent)
+                latencies.append(time.perf_counter() - sent)
+                if last:
+                    done.set()
+                    return
+        except queue.Empty:
+            pass
+        root.after(10, poll)
+
+    def worker():
+        for i in range(UPDATES):
+            pending.put((time.perf_counter(), i == UPDATES - 1))
+
+    root.after(10, poll)
+    start = time.perf_counter()
+    threading.Thread(target=worker).start()
+    while not done.is_set():
+        root.tk.dooneevent()
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    root = make_root()
+    label = tkinter.Label(root).pack()
+    # Create the dispatcher on the Tk thread before the workers start.
+    label.from_thread()
+    for name, run in [("from_thread", run_fluent),
+                      ("Queue + after(10)", run_polling)]:
+        elapsed, latencies = run(root, label)
+        report(f"{name}: {UPDATES} updates", [
+            ("throughput", UPDATES / elapsed, "updates/s"),
+            ("latency mean", mean(latencies) * 1e3, "ms"),
+            ("latency p50", percentile(latencies, 50) * 1e3, "ms"),
+            ("latency p99", percentile(latencies, 99) * 1e3, "ms"),
+        ])
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
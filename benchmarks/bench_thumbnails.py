@@ -0,0 +1,85 @@
+"""Loading 1,000 thumbnails on the Tk thread versus in the background.
+
+Reports the time until the first thumbnail is shown and until all of them
+are, for ``PhotoImage(file=...)`` plus ``subsample`` on the Tk thread and
+for :class:`fluent_tkinter.images.ThumbnailLoader`.  The files are copies
+of ``imghdrdata/python.png`` and ``python.ppm`` in a temporary directory.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import tkinter
+
+from fluent_tkinter import images
+from benchmarks._common import make_root, report
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'imghdrdata')
+COUNT = 1000
+SUBSAMPLE = 2
+
+
+def make_files(directory):
+    paths = []
+    for i in range(COUNT):
+        ext = ('png', 'ppm')[i % 2]
+        path = os.path.join(directory, f'thumb{i:04d}.{ext}')
+        shutil.copy(os.path.join(DATA_DIR, f'python.{ext}'), path)
+        paths.append(path)
+    return paths
+
+
+def synchronous(root, labels, paths):
+    start = time.perf_counter()
+    first = None
+    for label, path in zip(labels, paths):
+        image = tkinter.PhotoImage(master=root, file=path)
+        image = image.subsample(SUBSAMPLE)
+        label.configure(image=image)
+        label.image = image
+        root.update_idletasks()
+        if first is None:
+            first = time.perf_counter() - start
+    root.update()
+    return first, time.perf_counter() - start
+
+
+def background(root, labels, paths, **kwargs):
+    images.clear(root)
+    shown = []
+    start = time.perf_counter()
+    with images.ThumbnailLoader(root, **kwargs) as loader:
+        futures = [loader.load(path, label, subsample=SUBSAMPLE)
+                   for label, path in zip(labels, paths)]
+        futures[0].add_done_callback(
+            lambda f: shown.append(time.perf_counter() - start))
+        while not all(f.done() for f in futures):
+            root.tk.dooneevent(0)
+    root.update()
+    return min(shown or [float('nan')]), time.perf_counter() - start
+
+
+def main():
+    root = make_root()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_files(directory)
+        rows = []
+        for label, run in [
+            ('Tk thread', lambda: synchronous(root, labels, paths)),
+            ('ThumbnailLoader', lambda: background(root, labels, paths)),
+            ('ThumbnailLoader(use_mmap)',
+             lambda: background(root, labels, paths, use_mmap=True)),
+        ]:
+            labels = [tkinter.Label(root) for _ in paths]
+            first, total = run()
+            rows.append((f'{label}: first', first * 1e3, 'ms'))
+            rows.append((f'{label}: all', total * 1e3, 'ms'))
+            for widget in labels:
+                widget.destroy()
+        report(f'{COUNT} thumbnails', rows)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Walking a 10,000-widget tree: ``winfo_children`` recursion versus
+``walk``, ``descendants`` and ``find_widget``.
+
+The tree is 10 panels of 10 groups of 99 labels and buttons.  Timed are a
+full walk, collecting the buttons, and looking up the last widget by name.
+"""
+
+import tkinter
+
+from benchmarks._common import make_root, report, timeit
+
+PANELS = 10
+GROUPS = 10
+LEAVES = 99
+
+
+def recurse(widget):
+    yield widget
+    for child in widget.winfo_children():
+        yield from recurse(child)
+
+
+def main():
+    root = make_root()
+    top = tkinter.Frame(root)
+    for p in range(PANELS):
+        panel = tkinter.Frame(top)
+        for g in range(GROUPS):
+            group = tkinter.Frame(panel)
+            for i in range(LEAVES):
+                cls = tkinter.Button if i % 3 == 0 else tkinter.Label
+                cls(group, name=f'w{p}_{g}_{i}')
+    last = f'w{PANELS - 1}_{GROUPS - 1}_{LEAVES - 1}'
+    count = sum(1 for _ in top.walk())
+
+    rows = []
+    for label, func in [
+        ('winfo_children walk', lambda: sum(1 for _ in recurse(top))),
+        ('walk()', lambda: sum(1 for _ in top.walk())),
+        ('winfo_children filter', lambda: [
+            w for w in recurse(top) if isinstance(w, tkinter.Button)]),
+        ('descendants(Button)', lambda: list(
+            top.descendants(tkinter.Button))),
+        ('winfo_children find', lambda: next(
+            w for w in recurse(top) if w.winfo_name() == last)),
+        ('find_widget(name)', lambda: top.find_widget(last)),
+    ]:
+        rows.append((label, timeit(func) * 1e3, 'ms'))
+    report(f'tree of {count} widgets', rows)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,46 @@ After importing, any tkinter method that normally returns None will return
     (tk.Label(root, text="Hello")
         .pack(padx=10, pady=10)
         .configure(fg="blue"))
+
+Worker threads can update widgets through a proxy that replays the chain on
+the Tk thread::
+
+    label.from_thread().configure(text="done").pack()
+
+Large widget matrices can be gridded in one go::
+
+    frame.grid_many(entry_rows, sticky="ew").grid_weights(columns=1)
+
+Coroutines can run alongside Tk without polling via :func:`run`::
+
+    fluent_tkinter.run(main(), root)
 """
 
+from fluent_tkinter._aio import TkEventLoop, new_event_loop, run
+from fluent_tkinter._animation import AnimationLoop
+from fluent_tkinter._commands import CommandReport
 from fluent_tkinter._patch import patch
+from fluent_tkinter._pool import WidgetPool
+from fluent_tkinter._replay import InputReplay, LatencyReport
+from fluent_tkinter._scheduler import (
+    Debounced, Scheduler, Throttled, TimerHandle,
+)
+from fluent_tkinter._template import Param, Template, TemplateInstance
+from fluent_tkinter._threads import ThreadProxy
+from fluent_tkinter._tree import WidgetGeometry
+
+from fluent_tkinter import images
+
+# Modules that only add methods to tkinter classes.
+from fluent_tkinter import (  # noqa: F401
+    _callbacks, _events, _idle, _layout, _menu, _options, _photo, _style,
+)
+
+__all__ = [
+    "patch", "ThreadProxy", "TkEventLoop", "new_event_loop", "run",
+    "Scheduler", "TimerHandle", "Debounced", "Throttled", "CommandReport",
+    "images", "WidgetPool", "Template", "TemplateInstance", "Param",
+    "InputReplay", "LatencyReport", "AnimationLoop", "WidgetGeometry",
+]
 
 patch()
@@ -0,0 +1,289 @@
+"""asyncio event loop driven by the Tk event loop.
+
+The loop is an ordinary :class:`asyncio.SelectorEventLoop` whose selector
+waits inside ``Tcl_DoOneEvent``.  File descriptors registered by asyncio are
+handed to Tcl with ``createfilehandler`` and select timeouts become Tcl timer
+handlers, so a single blocking wait serves both Tk (including its X
+connection) and asyncio.  Nothing polls: an idle application sleeps in the
+Tcl notifier until input, a timer or a socket becomes ready.
+
+Where Tcl has no file handlers (Windows) the selector falls back to slicing
+a regular select with short non-blocking Tk passes.
+
+Widgets gain awaitable helpers, :meth:`wait_event` and :meth:`after_async`,
+so coroutines can wait for Tk without nested ``wait_variable`` or
+``update`` loops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import selectors
+import tkinter
+from collections.abc import Mapping
+
+import _tkinter
+
+from fluent_tkinter._patch import extension
+from fluent_tkinter._threads import _dispatcher
+
+# Upper bound on Tk events handled per select(0) so that a flood of
+# input cannot starve ready asyncio callbacks.
+_MAX_EVENTS_PER_POLL = 100
+
+# Select slice used by the fallback selector, in seconds.
+_FALLBACK_SLICE = 0.01
+
+
+def _fileobj_to_fd(fileobj):
+    if isinstance(fileobj, int):
+        fd = fileobj
+    else:
+        try:
+            fd = int(fileobj.fileno())
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError(f"Invalid file object: {fileobj!r}") from None
+    if fd < 0:
+        raise ValueError(f"Invalid file descriptor: {fd}")
+    return fd
+
+
+class _SelectorMapping(Mapping):
+
+    def __init__(self, keys):
+        self._keys = keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getitem__(self, fileobj):
+        return self._keys[_fileobj_to_fd(fileobj)]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+
+class TkSelector(selectors.BaseSelector):
+    """Selector that waits for I/O inside the Tcl event loop."""
+
+    def __init__(self, tk):
+        self._tk = tk
+        self._keys = {}
+        self._ready = {}
+        self._map = _SelectorMapping(self._keys)
+
+    def register(self, fileobj, events, data=None):
+        if not events or events & ~(selectors.EVENT_READ |
+                                    selectors.EVENT_WRITE):
+            raise ValueError(f"Invalid events: {events!r}")
+        fd = _fileobj_to_fd(fileobj)
+        if fd in self._keys:
+            raise KeyError(f"{fileobj!r} (FD {fd}) is already registered")
+        key = selectors.SelectorKey(fileobj, fd, events, data)
+        mask = 0
+        if events & selectors.EVENT_READ:
+            mask |= tkinter.READABLE
+        if events & selectors.EVENT_WRITE:
+            mask |= tkinter.WRITABLE
+        self._tk.createfilehandler(fd, mask, self._on_ready)
+        self._keys[fd] = key
+        return key
+
+    def unregister(self, fileobj):
+        try:
+            key = self._keys.pop(_fileobj_to_fd(fileobj))
+        except KeyError:
+            raise KeyError(f"{fileobj!r} is not registered") from None
+        self._tk.deletefilehandler(key.fd)
+        self._ready.pop(key.fd, None)
+        return key
+
+    def _on_ready(self, fd, mask):
+        events = 0
+        if mask & tkinter.READABLE:
+            events |= selectors.EVENT_READ
+        if mask & tkinter.WRITABLE:
+            events |= selectors.EVENT_WRITE
+        self._ready[fd] = self._ready.get(fd, 0) | events
+
+    def select(self, timeout=None):
+        tk = self._tk
+        if timeout is not None and timeout <= 0:
+            for _ in range(_MAX_EVENTS_PER_POLL):
+                if not tk.dooneevent(_tkinter.DONT_WAIT):
+                    break
+        else:
+            # Return after the first Tk event of any kind: a Tk callback may
+            # have scheduled asyncio work, which the loop must now run.
+            timer = None
+            if timeout is not None:
+                timer = tk.createtimerhandler(math.ceil(timeout * 1000),
+                                              _noop)
+            try:
+                tk.dooneevent(0)
+            finally:
+                if timer is not None:
+                    timer.deletetimerhandler()
+        ready = []
+        for fd, events in self._ready.items():
+            key = self._keys.get(fd)
+            if key is not None:
+                ready.append((key, events & key.events))
+        self._ready.clear()
+        return ready
+
+    def close(self):
+        for fd in list(self._keys):
+            self._tk.deletefilehandler(fd)
+        self._keys.clear()
+        self._ready.clear()
+
+    def get_map(self):
+        return self._map
+
+
+class _SlicedSelector(selectors.DefaultSelector):
+    """Fallback for platforms without Tcl file handlers."""
+
+    def __init__(self, tk):
+        super().__init__()
+        self._tk = tk
+
+    def select(self, timeout=None):
+        for _ in range(_MAX_EVENTS_PER_POLL):
+            if not self._tk.dooneevent(_tkinter.DONT_WAIT):
+                break
+        if timeout is None or timeout > _FALLBACK_SLICE:
+            timeout = _FALLBACK_SLICE
+        return super().select(timeout)
+
+
+def _noop():
+    pass
+
+
+class TkEventLoop(asyncio.SelectorEventLoop):
+    """asyncio event loop that also services the Tk event loop of *root*.
+
+    While the loop runs, Tk events are processed exactly as in
+    :meth:`~tkinter.Misc.mainloop`, so widgets stay responsive without any
+    ``root.update()`` polling.  Worker threads can ``await`` chains recorded
+    with :meth:`from_thread` from their own event loops.
+    """
+
+    def __init__(self, root=None):
+        if root is None:
+            root = tkinter._get_default_root("create event loop")
+        self.root = root
+        if hasattr(root.tk, "createfilehandler"):
+            selector = TkSelector(root.tk)
+        else:
+            selector = _SlicedSelector(root.tk)
+        super().__init__(selector)
+        # Set up cross-thread dispatch now, on the Tk thread, so worker
+        # threads can use from_thread() without tkinter's mainloop.
+        _dispatcher(root)
+
+
+def new_event_loop(root=None):
+    """Return a new :class:`TkEventLoop` for *root*."""
+    return TkEventLoop(root)
+
+
+def run(main, root=None, *, debug=None):
+    """Run coroutine *main* on a :class:`TkEventLoop` and return its result.
+
+    The Tk counterpart of :func:`asyncio.run`; *root* defaults to the
+    default root window.
+    """
+    with asyncio.Runner(debug=debug,
+                        loop_factory=lambda: TkEventLoop(root)) as runner:
+        return runner.run(main)
+
+
+class _EventWaiters:
+    """Futures waiting for one event sequence on one widget.
+
+    All waiters share a single binding, which is removed again as soon as
+    nobody is waiting, so thousands of awaiters cost one Tcl command.
+    """
+
+    __slots__ = ("widget", "sequence", "futures", "funcid")
+
+    def __init__(self, widget, sequence):
+        self.widget = widget
+        self.sequence = sequence
+        self.futures = {}    # ordered set: waiters resume in FIFO order
+        self.funcid = widget.bind(sequence, self._fire, add="+")
+
+    def _fire(self, event):
+        futures = self.futures
+        self.futures = {}
+        self._close()
+        for future in futures:
+            if not future.done():
+                future.set_result(event)
+
+    def discard(self, future):
+        self.futures.pop(future, None)
+        if not self.futures:
+            self._close()
+
+    def _close(self):
+        widget = self.widget
+        if widget._fluent_waiters.get(self.sequence) is not self:
+            return
+        del widget._fluent_waiters[self.sequence]
+        what = ("bind", widget._w, self.sequence)
+        prefix = f'if {{"[{self.funcid} '
+        try:
+            lines = widget.tk.call(what).split("\n")
+            keep = "\n".join(line for line in lines
+                             if not line.startswith(prefix))
+            widget.tk.call(*what, keep if keep.strip() else "")
+            widget.deletecommand(self.funcid)
+        except tkinter.TclError:
+            pass    # the widget has been destroyed
+
+
+@extension(tkinter.Misc)
+def wait_event(self, sequence):
+    """Return an :class:`asyncio.Future` resolved with the next
+    :class:`tkinter.Event` for SEQUENCE on this widget.
+
+    Must be called from a coroutine running on the Tk thread, for
+    example under :func:`fluent_tkinter.run`::
+
+        event = await button.wait_event("<ButtonRelease-1>")
+    """
+    future = asyncio.get_running_loop().create_future()
+    try:
+        waiters = self._fluent_waiters
+    except AttributeError:
+        waiters = self._fluent_waiters = {}
+    entry = waiters.get(sequence)
+    if entry is None:
+        entry = waiters[sequence] = _EventWaiters(self, sequence)
+    entry.futures[future] = None
+    future.add_done_callback(
+        lambda f: f.cancelled() and entry.discard(f))
+    return future
+
+
+@extension(tkinter.Misc)
+def after_async(self, ms):
+    """Return an :class:`asyncio.Future` resolved after MS milliseconds.
+
+    The timer is a plain Tcl timer handler, so no Tcl command is created;
+    cancelling the future cancels the timer."""
+    future = asyncio.get_running_loop().create_future()
+
+    def fire():
+        if not future.done():
+            future.set_result(None)
+
+    timer = self.tk.createtimerhandler(int(ms), fire)
+    future.add_done_callback(
+        lambda f: f.cancelled() and timer.deletetimerhandler())
+    return future
@@ -0,0 +1,141 @@
+"""Frame-paced animation loops.
+
+An ``after(16, tick)`` chain measures each delay from the end of the last
+tick, so the time spent in ``tick`` and the lateness of the timer add up
+to a frame rate well below the intended one, and every tick registers a
+new Tcl command.  :meth:`Misc.animation_loop` schedules frames against a
+monotonic clock instead: each frame is due a fixed interval after the
+previous due time, a late frame shortens the next delay, and when the
+loop falls more than a frame behind the missed frames are skipped and
+counted rather than run back to back.
+
+Work that can be spread over frames, such as laying out a long list, is
+queued with :meth:`AnimationLoop.add_work` and run after the frame
+callback for as long as the frame's time budget lasts::
+
+    loop = root.animation_loop(step, fps=60)
+    for row in rows:
+        loop.add_work(table.insert_row, row)
+"""
+
+from __future__ import annotations
+
+import collections
+import math
+import time
+
+import tkinter
+
+from fluent_tkinter._patch import extension
+
+
+class AnimationLoop:
+    """Calls CALLBACK about FPS times per second on the Tk thread.
+
+    CALLBACK is called with the time in seconds since the previous frame,
+    which includes skipped frames, so animations advance by elapsed time.
+    Create loops with :meth:`Misc.animation_loop`; they run until
+    :meth:`stop` is called or their widget is destroyed.
+
+    BUDGET is the fraction of the frame interval available to the frame
+    callback and queued work together.  It is reduced by how late the
+    timer has been firing recently, which tracks the time the rest of the
+    application needs between frames.
+    """
+
+    def __init__(self, widget, callback, fps=60, budget=0.5):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.callback = callback
+        self.interval = 1 / fps
+        self.budget = budget
+        #: Frames run and frames skipped because the loop fell behind.
+        self.frames = 0
+        self.dropped = 0
+        self._tk = widget.tk
+        self._widget = widget
+        self._work = collections.deque()
+        self._lateness = 0.0
+        self._deadline = 0.0
+        self._after_id = None
+        self._name = widget._register(self._tick)
+        # The command goes away with the widget; a pending frame must not
+        # then call it.
+        self._script = (f"if {{[winfo exists {widget._w}]}} "
+                        f"{{{self._name}}}")
+        self._last = self._due = time.monotonic()
+        self._schedule(0)
+
+    @property
+    def running(self):
+        """Whether the loop runs: not stopped and its widget still exists."""
+        if self._after_id is None:
+            return False
+        try:
+            return bool(self._widget.winfo_exists())
+        except tkinter.TclError:
+            return False
+
+    @property
+    def pending_work(self):
+        """Number of queued work items."""
+        return len(self._work)
+
+    def time_left(self):
+        """Return the seconds left in the budget of the current frame."""
+        return self._deadline - time.monotonic()
+
+    def add_work(self, func, *args):
+        """Queue ``func(*args)`` to run in the budget of a coming frame.
+        Returns the loop."""
+        self._work.append((func, args))
+        return self
+
+    def stop(self):
+        """Stop the loop, drop queued work and delete the loop's Tcl command.
+        Stopping a stopped loop does nothing.  Returns the loop."""
+        after_id, self._after_id = self._after_id, None
+        if after_id is not None:
+            try:
+                self._tk.call("after", "cancel", after_id)
+                self._widget.deletecommand(self._name)
+            except tkinter.TclError:
+                pass    # already deleted with the widget
+        self._work.clear()
+        return self
+
+    def _schedule(self, delay):
+        self._after_id = self._tk.call(
+            "after", max(0, math.ceil(delay * 1000)), self._script)
+
+    def _tick(self):
+        now = time.monotonic()
+        interval = self.interval
+        late = now - self._due
+        if late >= interval:
+            skipped = int(late // interval)
+            self.dropped += skipped
+            self._due += skipped * interval
+            late -= skipped * interval
+        self._lateness += (late - self._lateness) / 8
+        self._deadline = self._due + max(
+            interval * self.budget - self._lateness, interval / 10)
+        self._due += interval
+        self.frames += 1
+        dt, self._last = now - self._last, now
+        try:
+            self.callback(dt)
+            work = self._work
+            while work and time.monotonic() < self._deadline:
+                func, args = work.popleft()
+                func(*args)
+        finally:
+            if self._after_id is not None:
+                self._schedule(self._due - time.monotonic())
+
+
+@extension(tkinter.Misc)
+def animation_loop(self, callback, fps=60, budget=0.5):
+    """Start and return an :class:`AnimationLoop` calling CALLBACK FPS
+    times per second.  The loop stops when this widget is destroyed."""
+    return AnimationLoop(self, callback, fps, budget)
@@ -0,0 +1,196 @@
+"""Opt-in routing of all Python callbacks through one Tcl command.
+
+``Misc._register`` gives every callback (``command=`` options, bindings,
+``after`` calls) its own Tcl command, a ``CallWrapper`` and a name string
+kept in the widget's ``_tclCommands``.  After
+``root.use_shared_callbacks()`` callbacks registered in that application
+instead get a slot in a Python handle table and are invoked by a single
+Tcl command as ``::_fluent_callback SLOT GENERATION ?arg ...?``.
+
+Slots are plain list entries reused through a free list.  Each slot
+carries a generation counter that is bumped when the slot is released, so a
+handle that outlived its callback is reported as an error instead of
+calling whatever callback took the slot over.
+
+Handles behave like command names everywhere tkinter uses them: they are
+owned by the registering widget and released when it is destroyed, by
+``deletecommand``, ``after_cancel`` and when a binding or command option
+is replaced.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import tkinter
+
+from fluent_tkinter._patch import extension, override
+
+HANDLE_COMMAND = "::_fluent_callback"
+
+_HANDLE_PREFIX = HANDLE_COMMAND + " "
+
+
+def _is_handle(name):
+    return isinstance(name, str) and name.startswith(_HANDLE_PREFIX)
+
+
+def _handle_from_words(words):
+    """Return the handle at the start of the Tcl command WORDS, or None."""
+    if len(words) >= 3 and str(words[0]) == HANDLE_COMMAND:
+        return f"{_HANDLE_PREFIX}{words[1]} {words[2]}"
+    return None
+
+
+class _CallbackTable:
+    """Handle table of the shared callback command of one interpreter."""
+
+    def __init__(self, root):
+        self.root = root
+        self.enabled = False
+        self._funcs = []
+        self._substs = []
+        self._widgets = []
+        self._generations = []
+        self._free = []
+        root.tk.createcommand(HANDLE_COMMAND, self.dispatch)
+
+    def __len__(self):
+        """Return the number of live handles."""
+        return len(self._funcs) - len(self._free)
+
+    def add(self, func, subst, widget):
+        """Store FUNC and return its handle."""
+        if self._free:
+            slot = self._free.pop()
+            self._funcs[slot] = func
+            self._substs[slot] = subst
+            self._widgets[slot] = widget
+        else:
+            slot = len(self._funcs)
+            self._funcs.append(func)
+            self._substs.append(subst)
+            self._widgets.append(widget)
+            self._generations.append(0)
+        return f"{_HANDLE_PREFIX}{slot} {self._generations[slot]}"
+
+    def release(self, handle):
+        """Free the slot of HANDLE; stale handles are ignored."""
+        _, slot, generation = handle.split(" ", 2)
+        slot = int(slot)
+        if self._generations[slot] != int(generation):
+            return
+        self._funcs[slot] = self._substs[slot] = self._widgets[slot] = None
+        self._generations[slot] += 1
+        self._free.append(slot)
+
+    def dispatch(self, slot, generation, *args):
+        slot = int(slot)
+        if (slot >= len(self._generations)
+                or self._generations[slot] != int(generation)):
+            # Like CallWrapper, never let an exception escape into Tcl.
+            try:
+                raise tkinter.TclError(
+                    f"stale callback handle {slot} {generation}")
+            except tkinter.TclError:
+                self.root._report_exception()
+            return None
+        # The callback may release its own slot (``after`` callbacks do).
+        func = self._funcs[slot]
+        subst = self._substs[slot]
+        widget = self._widgets[slot]
+        try:
+            if subst:
+                args = subst(*args)
+            return func(*args)
+        except SystemExit:
+            raise
+        except BaseException:
+            widget._report_exception()
+
+
+def _table(widget, create=False):
+    root = widget._root()
+    try:
+        return root._fluent_callback_table
+    except AttributeError:
+        if not create:
+            return None
+        table = root._fluent_callback_table = _CallbackTable(root)
+        return table
+
+
+def release(widget, name):
+    """Delete command or handle NAME of WIDGET's interpreter."""
+    if _is_handle(name):
+        table = _table(widget)
+        if table is not None:
+            table.release(name)
+    else:
+        widget.tk.deletecommand(name)
+
+
+@extension(tkinter.Misc)
+def use_shared_callbacks(self, enable=True):
+    """Route the callbacks registered from now on in this application
+    through one shared Tcl command (see :mod:`fluent_tkinter._callbacks`).
+    ``use_shared_callbacks(False)`` goes back to one Tcl command per
+    callback; existing handles keep working.  Returns the widget."""
+    table = _table(self, create=enable)
+    if table is not None:
+        table.enabled = enable
+    return self
+
+
+@extension(tkinter.Misc)
+def shared_callback_count(self):
+    """Return the number of live shared callback handles, or 0 if shared
+    callbacks were never enabled."""
+    table = _table(self)
+    return len(table) if table is not None else 0
+
+
+@override(tkinter.Misc, "_register")
+def _register(register):
+    @functools.wraps(register)
+    def wrapper(self, func, subst=None, needcleanup=1):
+        table = _table(self)
+        if table is None or not table.enabled:
+            return register(self, func, subst, needcleanup)
+        handle = table.add(func, subst, self)
+        if needcleanup:
+            if self._tclCommands is None:
+                self._tclCommands = []
+            self._tclCommands.append(handle)
+        return handle
+    return wrapper
+
+
+@override(tkinter.Misc, "deletecommand")
+def _deletecommand(deletecommand):
+    @functools.wraps(deletecommand)
+    def wrapper(self, name):
+        if not _is_handle(name):
+            return deletecommand(self, name)
+        release(self, name)
+        try:
+            self._tclCommands.remove(name)
+        except (AttributeError, ValueError):
+            pass
+        return self
+    return wrapper
+
+
+@override(tkinter.Misc, "destroy")
+def _destroy(destroy):
+    @functools.wraps(destroy)
+    def wrapper(self):
+        commands = self._tclCommands
+        if commands and any(map(_is_handle, commands)):
+            for name in commands:
+                if _is_handle(name):
+                    release(self, name)
+            self._tclCommands = [name for name in commands
+                                 if not _is_handle(name)]
+        return destroy(self)
+    return wrapper
@@ -0,0 +1,363 @@
+"""Cleanup of superseded Tcl callback commands.
+
+Every Python callback handed to Tcl gets a Tcl command from
+``Misc._register``.  tkinter deletes those commands when the owning widget
+is destroyed, but not when the callback is replaced while the widget lives:
+rebinding a sequence, reconfiguring ``command=`` or clearing a binding with
+``unbind`` all leave the old command behind.  Commands created by
+``bind_all``/``bind_class`` belong to the root and so live as long as the
+application.
+
+The wrappers below delete a command as soon as the binding or option that
+referenced it is overwritten, and :meth:`command_report` shows which
+callback commands exist and who owns them.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import NamedTuple
+
+import tkinter
+
+from fluent_tkinter._callbacks import HANDLE_COMMAND, _handle_from_words
+from fluent_tkinter._patch import extension, override
+
+# Commands invoked by tkinter-generated scripts: ``[name %# %b ...]``, or
+# ``[::_fluent_callback slot generation %# %b ...]`` for shared callbacks.
+# Scripts passing a command on quote it as ``[list name]``.
+_SCRIPT_COMMAND_RE = re.compile(
+    rf"\[(?:list )?({re.escape(HANDLE_COMMAND)} \d+ \d+|[^\s\[\]]+)")
+
+# Number of deleted commands remembered per widget, so that unbinding one
+# by its funcid after a replacing bind() deleted it is not an error.
+_SUPERSEDED_MAX = 64
+
+# Words of a script or option value that may name a command.
+_WORD_RE = re.compile(
+    rf"{re.escape(HANDLE_COMMAND)} \d+ \d+|[^\s\[\]{{}};\"]+")
+
+
+def _script_commands(script):
+    """Return the command names invoked by a tkinter-generated script."""
+    if not script:
+        return []
+    return _SCRIPT_COMMAND_RE.findall(str(script))
+
+
+def _bound_commands(widget, what):
+    try:
+        return _script_commands(widget.tk.call(what))
+    except tkinter.TclError:
+        return []
+
+
+def _is_command_option(key, value):
+    return (callable(value) or key.endswith("command")
+            or key in ("vcmd", "invcmd"))
+
+
+def _option_commands(widget, cget, cnf, kw):
+    """Return the registered commands referenced by the current values of
+    the command options about to be set from *cnf* and *kw*."""
+    owned = widget._tclCommands
+    if not owned:
+        return []
+    if kw:
+        cnf = tkinter._cnfmerge((cnf, kw))
+    names = []
+    for key, value in cnf.items():
+        if not isinstance(key, str):
+            continue
+        key = key.rstrip("_")
+        if not _is_command_option(key, value):
+            continue
+        try:
+            current = widget.tk.call(cget + ("-" + key,))
+        except tkinter.TclError:
+            continue
+        words = widget.tk.splitlist(current) if current else ()
+        if not words:
+            continue
+        name = _handle_from_words(words) or str(words[0])
+        if name in owned:
+            names.append(name)
+    return names
+
+
+def _delete_owned(widget, names, keep=()):
+    """Delete those of *names* registered by *widget*, except *keep* and
+    commands the widget shares between several callbacks."""
+    owned = widget._tclCommands
+    if not owned:
+        return
+    pinned = getattr(widget, "_fluent_pinned_commands", ())
+    for name in names:
+        if name in owned and name not in keep and name not in pinned:
+            widget.deletecommand(name)
+            _superseded(widget)[name] = None
+
+
+def _superseded(widget):
+    """Return the ordered set of commands of *widget* deleted here,
+    trimmed to the newest ``_SUPERSEDED_MAX``."""
+    try:
+        names = widget._fluent_superseded
+    except AttributeError:
+        names = widget._fluent_superseded = {}
+    while len(names) >= _SUPERSEDED_MAX:
+        del names[next(iter(names))]
+    return names
+
+
+def _mentioned_commands(value):
+    """Return the words of the script or option *value* that may name a
+    command, so that commands it still refers to are kept."""
+    if isinstance(value, (tuple, list)):
+        words = {word for item in value for word in _mentioned_commands(item)}
+        handle = _handle_from_words(value)
+        if handle:
+            words.add(handle)
+        return words
+    if isinstance(value, (str, tkinter._tkinter.Tcl_Obj)):
+        return set(_WORD_RE.findall(str(value)))
+    return set()
+
+
+def _new_commands(func, result):
+    """Return the commands referenced by a binding just made with *func*."""
+    if isinstance(func, str):
+        return _mentioned_commands(func)
+    return {result}
+
+
+def _unbind_funcid(unbind, widget, what, funcid):
+    """Unbind *funcid* from the binding *what* with *unbind*, or, if its
+    command was already deleted here, remove its call from the binding as
+    tkinter's ``_unbind`` does."""
+    if funcid in (widget._tclCommands or ()):
+        return unbind()
+    superseded = getattr(widget, "_fluent_superseded", {})
+    if funcid not in superseded:
+        return unbind()     # fails as in tkinter if FUNCID is unknown
+    del superseded[funcid]
+    prefix = f'if {{"[{funcid} '
+    lines = str(widget.tk.call(what)).split("\n")
+    keep = "\n".join(line for line in lines if not line.startswith(prefix))
+    widget.tk.call(*what, keep if keep.strip() else "")
+
+
+def _new_option_commands(cnf, kw):
+    """Return the commands referenced by the option values *cnf* and *kw*
+    being set."""
+    names = set()
+    for values in (cnf, kw):
+        for value in values.values():
+            names |= _mentioned_commands(value)
+    return names
+
+
+# -- widget bindings ---------------------------------------------------------
+
+@override(tkinter.Misc, "bind")
+def _bind(bind):
+    @functools.wraps(bind)
+    def wrapper(self, sequence=None, func=None, add=None):
+        if not (sequence and func) or add:
+            return bind(self, sequence, func, add)
+        old = _bound_commands(self, ("bind", self._w, sequence))
+        result = bind(self, sequence, func, add)
+        _delete_owned(self, old, _new_commands(func, result))
+        return result
+    return wrapper
+
+
+@override(tkinter.Misc, "unbind")
+def _unbind(unbind):
+    @functools.wraps(unbind)
+    def wrapper(self, sequence, funcid=None):
+        if funcid is not None:
+            return _unbind_funcid(
+                lambda: unbind(self, sequence, funcid),
+                self, ("bind", self._w, sequence), funcid)
+        old = _bound_commands(self, ("bind", self._w, sequence))
+        result = unbind(self, sequence)
+        _delete_owned(self, old)
+        return result
+    return wrapper
+
+
+def _tag_bind_factory(what):
+    def factory(tag_bind):
+        @functools.wraps(tag_bind)
+        def wrapper(self, tag, sequence=None, func=None, add=None):
+            if not (sequence and func) or add:
+                return tag_bind(self, tag, sequence, func, add)
+            old = _bound_commands(self, (self._w, *what, tag, sequence))
+            result = tag_bind(self, tag, sequence, func, add)
+            _delete_owned(self, old, _new_commands(func, result))
+            return result
+        return wrapper
+    return factory
+
+
+def _tag_unbind_factory(what):
+    def factory(tag_unbind):
+        @functools.wraps(tag_unbind)
+        def wrapper(self, tag, sequence, funcid=None):
+            if funcid is not None:
+                return _unbind_funcid(
+                    lambda: tag_unbind(self, tag, sequence, funcid),
+                    self, (self._w, *what, tag, sequence), funcid)
+            old = _bound_commands(self, (self._w, *what, tag, sequence))
+            result = tag_unbind(self, tag, sequence)
+            _delete_owned(self, old)
+            return result
+        return wrapper
+    return factory
+
+
+override(tkinter.Canvas, "tag_bind", _tag_bind_factory(("bind",)))
+override(tkinter.Canvas, "tag_unbind", _tag_unbind_factory(("bind",)))
+override(tkinter.Text, "tag_bind", _tag_bind_factory(("tag", "bind")))
+override(tkinter.Text, "tag_unbind", _tag_unbind_factory(("tag", "bind")))
+
+
+# -- application-wide bindings ----------------------------------------------
+
+# tkinter registers the commands of these bindings on the root.
+
+def _shared_bind(what, bind, self, sequence, func, add, *args):
+    if not (sequence and func) or add:
+        return bind(self, *args, sequence, func, add)
+    old = _bound_commands(self, ("bind", what, sequence))
+    result = bind(self, *args, sequence, func, add)
+    _delete_owned(self._root(), old, _new_commands(func, result))
+    return result
+
+
+@override(tkinter.Misc, "bind_all")
+def _bind_all(bind_all):
+    @functools.wraps(bind_all)
+    def wrapper(self, sequence=None, func=None, add=None):
+        return _shared_bind("all", bind_all, self, sequence, func, add)
+    return wrapper
+
+
+@override(tkinter.Misc, "bind_class")
+def _bind_class(bind_class):
+    @functools.wraps(bind_class)
+    def wrapper(self, className, sequence=None, func=None, add=None):
+        return _shared_bind(className, bind_class, self, sequence, func, add,
+                            className)
+    return wrapper
+
+
+@override(tkinter.Misc, "unbind_all")
+def _unbind_all(unbind_all):
+    @functools.wraps(unbind_all)
+    def wrapper(self, sequence):
+        old = _bound_commands(self, ("bind", "all", sequence))
+        result = unbind_all(self, sequence)
+        _delete_owned(self._root(), old)
+        return result
+    return wrapper
+
+
+@override(tkinter.Misc, "unbind_class")
+def _unbind_class(unbind_class):
+    @functools.wraps(unbind_class)
+    def wrapper(self, className, sequence):
+        old = _bound_commands(self, ("bind", className, sequence))
+        result = unbind_class(self, className, sequence)
+        _delete_owned(self._root(), old)
+        return result
+    return wrapper
+
+
+# -- command options ---------------------------------------------------------
+
+def _configure_factory(configure):
+    @functools.wraps(configure)
+    def wrapper(self, cnf=None, **kw):
+        if not kw and not isinstance(cnf, dict):
+            return configure(self, cnf, **kw)
+        old = _option_commands(self, (self._w, "cget"), cnf or {}, kw)
+        result = configure(self, cnf, **kw)
+        if old:
+            _delete_owned(self, old, _new_option_commands(cnf or {}, kw))
+        return result
+    return wrapper
+
+
+override(tkinter.Misc, "configure", _configure_factory)
+override(tkinter.Misc, "config", _configure_factory)
+
+
+@override(tkinter.Menu, "entryconfigure")
+def _entryconfigure(entryconfigure):
+    @functools.wraps(entryconfigure)
+    def wrapper(self, index, cnf=None, **kw):
+        if not kw and not isinstance(cnf, dict):
+            return entryconfigure(self, index, cnf, **kw)
+        old = _option_commands(self, (self._w, "entrycget", index),
+                               cnf or {}, kw)
+        result = entryconfigure(self, index, cnf, **kw)
+        if old:
+            _delete_owned(self, old, _new_option_commands(cnf or {}, kw))
+        return result
+    return wrapper
+
+
+# -- reporting ---------------------------------------------------------------
+
+class CommandReport(NamedTuple):
+    """Python callback commands alive in a Tcl interpreter."""
+
+    #: Number of callback commands in the interpreter.
+    total: int
+    #: Widget path name -> number of commands the widget will delete.
+    by_widget: dict
+    #: Number of commands bound with ``bind_all``, ``bind_class`` or to
+    #: other tags that are not windows, for the tags the widgets use.
+    shared: int
+    #: Commands nobody will delete: leaks, or commands owned by objects
+    #: outside the widget tree such as variable traces.
+    unowned: tuple
+
+
+def _is_callback_name(name):
+    # ``_register`` names start with ``repr(id(wrapper))``.
+    return name[:1].isdigit()
+
+
+@extension(tkinter.Misc)
+def command_report(self):
+    """Return a :class:`CommandReport` for this application."""
+    root = self._root()
+    commands = {name for name in map(str, self.tk.splitlist(
+                    self.tk.call("info", "commands")))
+                if _is_callback_name(name)}
+    by_widget = {}
+    owned = set()
+    tags = {"all"}
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        names = [name for name in widget._tclCommands or ()
+                 if _is_callback_name(name)]
+        if names:
+            by_widget[widget._w] = len(names)
+            owned.update(names)
+        tags.update(tag for tag in widget.bindtags()
+                    if not tag.startswith("."))
+        stack.extend(widget.children.values())
+    shared = set()
+    for tag in tags:
+        for sequence in self.tk.splitlist(self.tk.call("bind", tag)):
+            shared.update(_bound_commands(self, ("bind", tag, sequence)))
+    shared &= commands
+    unowned = commands - owned
+    return CommandReport(len(commands), by_widget, len(shared),
+                         tuple(sorted(unowned)))
@@ -0,0 +1,227 @@
+"""Cheaper event bindings for high-frequency events.
+
+For every bound event tkinter asks Tk for 19 ``%`` substitutions and
+``Misc._substitute`` converts all of them into a new :class:`tkinter.Event`,
+whatever the handler reads.  :meth:`Misc.bind_fast` only requests the
+fields the handler names and passes them as a small named tuple, so a
+``<Motion>`` handler reading ``x`` and ``y`` costs two conversions::
+
+    canvas.bind_fast("<B1-Motion>", drag, fields=("x", "y"))
+
+:meth:`Misc.bind_coalesced` goes further for events whose handler only
+needs the latest one, such as drags: a Tcl procedure keeps the values of
+the newest event and calls Python once per idle cycle or frame interval.
+"""
+
+from __future__ import annotations
+
+import collections
+
+import tkinter
+
+from fluent_tkinter._patch import extension
+from fluent_tkinter._template import _script_word
+
+
+def _int(value):
+    # Like getint_event: Tk reports fields an event does not have as "??".
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+# Event field -> (substitution, converter).  A converter of None passes the
+# string through; "widget" converters are given the bound widget first.
+_FIELDS = {
+    "serial": ("%#", _int),
+    "num": ("%b", _int),
+    "focus": ("%f", "boolean"),
+    "height": ("%h", _int),
+    "keycode": ("%k", _int),
+    "state": ("%s", _int),
+    "time": ("%t", _int),
+    "width": ("%w", _int),
+    "x": ("%x", _int),
+    "y": ("%y", _int),
+    "char": ("%A", None),
+    "send_event": ("%E", "boolean"),
+    "keysym": ("%K", None),
+    "keysym_num": ("%N", _int),
+    "type": ("%T", "type"),
+    "widget": ("%W", "widget"),
+    "x_root": ("%X", _int),
+    "y_root": ("%Y", _int),
+    "delta": ("%D", "delta"),
+}
+
+_event_types = {}
+
+
+def _event_type(fields):
+    """Return the named tuple class of events with FIELDS."""
+    try:
+        return _event_types[fields]
+    except KeyError:
+        pass
+    for field in fields:
+        if field not in _FIELDS:
+            raise ValueError(f"unknown event field {field!r}")
+    cls = collections.namedtuple("FastEvent", fields)
+    cls.__module__ = __name__
+    _event_types[fields] = cls
+    return cls
+
+
+def _converter(widget, kind):
+    if kind is None or callable(kind):
+        return kind
+    if kind == "boolean":
+        getboolean = widget.tk.getboolean
+
+        def convert(value):
+            try:
+                return getboolean(value)
+            except tkinter.TclError:
+                return value
+    elif kind == "type":
+        def convert(value):
+            try:
+                return tkinter.EventType(value)
+            except ValueError:
+                return value
+    elif kind == "widget":
+        def convert(value):
+            try:
+                return widget._nametowidget(value)
+            except KeyError:
+                return value
+    else:  # delta
+        def convert(value):
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return convert
+
+
+def _subst(widget, fields):
+    """Return a function converting the substitutions of FIELDS into a
+    one-tuple holding an event of type ``_event_type(fields)``."""
+    cls = _event_type(fields)
+    new = tuple.__new__
+    converters = [_converter(widget, _FIELDS[field][1]) for field in fields]
+    converters = [str if c is None else c for c in converters]
+
+    def convert(*args):
+        return (new(cls, [c(arg) for c, arg in zip(converters, args)]),)
+
+    if all(c is _int for c in converters):
+        def convert_ints(*args):
+            try:
+                return (new(cls, map(int, args)),)
+            except ValueError:
+                return convert(*args)
+        return convert_ints
+    return convert
+
+
+@extension(tkinter.Misc)
+def bind_fast(self, sequence, handler, fields=("x", "y"), add=None):
+    """Bind HANDLER to event SEQUENCE of this widget, passing only FIELDS.
+
+    HANDLER is called with a named tuple holding the given attributes of
+    :class:`tkinter.Event` (serial, num, focus, height, keycode, state,
+    time, width, x, y, char, send_event, keysym, keysym_num, type, widget,
+    x_root, y_root or delta), converted as for ``bind``.  Only those are
+    requested from Tk.  As with ``bind``, ADD="+" adds to the existing
+    bindings and a handler returning "break" stops further bindings.
+    Remove the binding with ``unbind(sequence)``.  Returns the widget."""
+    fields = tuple(fields)
+    subst = _subst(self, fields)
+    funcid = self._register(handler, subst)
+    codes = " ".join(_FIELDS[field][0] for field in fields)
+    script = f'if {{"[{funcid} {codes}]" == "break"}} break\n'
+    # tkinter only honours ADD for callables; passing it on as well keeps
+    # the command cleanup of bind() away from the bindings added to.
+    self.bind(sequence, ("+" if add else "") + script, add)
+    return self
+
+
+# Keeps the substitutions of the newest pending event of each coalesced
+# binding, keyed by its command, and schedules one flush per batch.  The
+# flush is dropped if the binding was removed or replaced in the meantime.
+_COALESCE_SCRIPT = r"""
+proc ::_fluent_coalesce {delay delta cmd w seq args} {
+    upvar #0 ::_fluent_coalesced($cmd) pending
+    if {[info exists pending]} {
+        if {$delta >= 0} {
+            set old [lindex $pending $delta]
+            set new [lindex $args $delta]
+            if {[string is integer -strict $old]
+                    && [string is integer -strict $new]} {
+                lset args $delta [expr {$old + $new}]
+            }
+        }
+        set pending $args
+        return
+    }
+    set pending $args
+    after $delay [list ::_fluent_coalesce_flush $cmd $w $seq]
+}
+proc ::_fluent_coalesce_flush {cmd w seq} {
+    upvar #0 ::_fluent_coalesced($cmd) pending
+    set args $pending
+    unset pending
+    if {[catch {bind $w $seq} script]
+            || [string first "\[list $cmd\]" $script] < 0} {
+        return
+    }
+    uplevel #0 [list {*}$cmd {*}$args]
+}
+"""
+
+
+def _ensure_coalesce_procs(widget):
+    root = widget._root()
+    if not getattr(root, "_fluent_coalesce_procs", False):
+        widget.tk.eval(_COALESCE_SCRIPT)
+        root._fluent_coalesce_procs = True
+
+
+@extension(tkinter.Misc)
+def bind_coalesced(self, sequence, handler, max_rate_hz=None, fields=None):
+    """Bind HANDLER to event SEQUENCE of this widget, calling it at most
+    once per idle cycle with the newest event.
+
+    Events arriving before HANDLER has run replace the pending one in Tcl,
+    without calling Python; the last event of a burst is always delivered.
+    With MAX_RATE_HZ the pending event is delivered that many times per
+    second at most instead of at the next idle cycle.  The ``delta`` of
+    ``<MouseWheel>`` events dropped this way is added to the delivered
+    event's, so no scrolling is lost.
+
+    FIELDS selects the event attributes passed, as for :meth:`bind_fast`;
+    by default HANDLER gets a :class:`tkinter.Event` as with ``bind``.
+    Since HANDLER runs after the event was processed, returning "break"
+    has no effect.  The binding replaces the existing bindings of
+    SEQUENCE; remove it with ``unbind(sequence)``.  Returns the widget."""
+    _ensure_coalesce_procs(self)
+    if fields is None:
+        subst = self._substitute
+        codes = self._subst_format_str
+        delta = self._subst_format.index("%D")
+    else:
+        fields = tuple(fields)
+        subst = _subst(self, fields)
+        codes = " ".join(_FIELDS[field][0] for field in fields)
+        delta = fields.index("delta") if "delta" in fields else -1
+    if max_rate_hz is None:
+        delay = "idle"
+    else:
+        delay = str(max(1, round(1000 / max_rate_hz)))
+    funcid = self._register(handler, subst)
+    script = (f"::_fluent_coalesce {delay} {delta} [list {funcid}] "
+              f"{_script_word(self._w)} {_script_word(sequence)} {codes}\n")
+    self.bind(sequence, script)
+    return self
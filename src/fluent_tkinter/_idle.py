@@ -0,0 +1,127 @@
+"""Cooperative incremental work on the Tk thread.
+
+A long loop on the Tk thread, filling a tree with thousands of rows say,
+freezes the application until it ends.  Written as a generator that yields
+between units of work, it can be handed to :meth:`Misc.idle_work`, which
+advances it in slices of a few milliseconds and returns to the event loop
+in between, so input and redraws are handled while the job runs::
+
+    def fill(tree, rows):
+        for row in rows:
+            tree.insert("", "end", values=row)
+            yield
+
+    root.idle_work(fill(tree, rows)).add_done_callback(announce)
+
+Slices are scheduled through the application's
+:meth:`~tkinter.Misc.scheduler` and need no Tcl command.  Jobs with a higher
+priority run first; jobs of equal priority take turns.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from concurrent.futures import Future
+
+import tkinter
+
+from fluent_tkinter._patch import extension
+
+
+class _IdleJob:
+
+    __slots__ = ("iterator", "future", "budget")
+
+    def __init__(self, iterator, future, budget):
+        self.iterator = iterator
+        self.future = future
+        self.budget = budget
+
+
+class _IdleWorker:
+    """Runs the idle jobs of one application."""
+
+    def __init__(self, root):
+        self.root = root
+        # (-priority, sequence number, job)
+        self._jobs = []
+        self._order = itertools.count()
+        self._timer = None
+
+    def submit(self, iterable, budget_ms, priority):
+        future = Future()
+        job = _IdleJob(iter(iterable), future, budget_ms / 1000)
+        heapq.heappush(self._jobs, (-priority, next(self._order), job))
+        self._arm()
+        return future
+
+    def _arm(self):
+        if self._timer is None:
+            self._timer = self.root.scheduler().call_idle(self._run)
+
+    def _run(self):
+        self._timer = None
+        jobs = self._jobs
+        start = time.perf_counter()
+        deadline = None
+        while jobs:
+            key, _, job = jobs[0]
+            if job.future.cancelled():
+                heapq.heappop(jobs)
+                _close(job.iterator)
+                continue
+            if deadline is None:
+                deadline = start + job.budget
+            elif time.perf_counter() >= deadline:
+                break
+            # Off the heap while it runs: the job may submit other jobs.
+            heapq.heappop(jobs)
+            step = job.iterator.__next__
+            future = job.future
+            try:
+                while True:
+                    step()
+                    if (time.perf_counter() >= deadline
+                            or future.cancelled()):
+                        break
+            except StopIteration as stop:
+                if not future.cancelled():
+                    future.set_result(stop.value)
+            except Exception as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                # The job may have cancelled its own future.
+                if future.cancelled():
+                    _close(job.iterator)
+                    continue
+                # Let the other jobs of this priority have the next slice.
+                heapq.heappush(jobs, (key, next(self._order), job))
+                break
+        if jobs:
+            self._arm()
+
+
+def _close(iterator):
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+@extension(tkinter.Misc)
+def idle_work(self, generator, budget_ms=8, priority=0):
+    """Run GENERATOR, or any iterable, in slices between events.
+
+    Each slice advances the job for up to BUDGET_MS milliseconds and then
+    returns to the event loop.  Jobs with a higher PRIORITY go first.
+    Returns a :class:`concurrent.futures.Future` that receives the
+    generator's return value or exception; cancelling it stops the job
+    and closes the generator."""
+    root = self._root()
+    try:
+        worker = root._fluent_idle_worker
+    except AttributeError:
+        worker = root._fluent_idle_worker = _IdleWorker(root)
+    return worker.submit(generator, budget_ms, priority)
@@ -0,0 +1,185 @@
+"""Bulk geometry management.
+
+Gridding a spreadsheet-like matrix one widget at a time costs a
+``grid_configure`` call per cell, each converting its options and making
+its own Tcl call.  Tk's ``grid`` command accepts a whole row of slaves per
+invocation, so :meth:`grid_many` writes one such command per row and runs
+the lot as a single Tcl script.  :meth:`grid_weights` sets the weights of
+any number of rows and columns with one call per distinct weight.
+
+Repopulating a container triggers a geometry recalculation, and often a
+redraw, for every child packed or gridded into it.  Inside
+``with frame.layout_batch():`` the container stops propagating its size and
+is unmapped, so the work is done once, when the block exits.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import functools
+from collections.abc import Mapping
+
+import tkinter
+
+from fluent_tkinter._patch import extension
+
+# Cell placeholders understood by the grid command.
+_GRID_PLACEHOLDERS = frozenset({"x", "-", "^"})
+
+
+def _cell(widget):
+    if widget is None:
+        return "x"
+    if isinstance(widget, tkinter.Misc):
+        return widget._w
+    if widget in _GRID_PLACEHOLDERS:
+        return widget
+    raise TypeError(f"grid cell must be a widget, None, 'x', '-' or '^', "
+                    f"not {widget!r}")
+
+
+@extension(tkinter.Misc)
+def grid_many(self, rows, cnf={}, *, row=0, column=0, **kw):
+    """Grid a matrix of widgets into this widget.
+
+    ROWS is an iterable of rows, each an iterable of widgets placed in
+    consecutive columns starting at COLUMN; the first row goes to row ROW.
+    A cell may be None or "x" to leave it empty, "-" to widen the widget
+    to its left or "^" to extend the widget above it, as with the grid
+    command.  The remaining options (sticky, padx, ...) apply to every
+    widget.  All rows are gridded with a single Tcl script."""
+    options = ("-in", self._w, "-column", column) + self._options(cnf, kw)
+    lines = []
+    for index, cells in enumerate(rows, row):
+        words = [_cell(widget) for widget in cells]
+        if any(word not in _GRID_PLACEHOLDERS for word in words):
+            words.append("-row")
+            words.append(index)
+            lines.append("grid " + tkinter._join(words + list(options)))
+    if lines:
+        self.tk.eval("\n".join(lines))
+    return self
+
+
+def _weight_groups(weights):
+    """Return ``{weight: indices}`` for WEIGHTS given as a mapping of
+    indices to weights or a sequence of weights."""
+    if isinstance(weights, Mapping):
+        items = weights.items()
+    else:
+        items = enumerate(weights)
+    groups = collections.defaultdict(list)
+    for index, weight in items:
+        if weight is not None:
+            groups[weight].append(index)
+    return groups
+
+
+@extension(tkinter.Misc)
+def grid_weights(self, columns=None, rows=None, **kw):
+    """Set the weights of many grid columns and rows of this widget.
+
+    COLUMNS and ROWS are each a mapping of indices to weights, a sequence
+    of weights for indices 0, 1, ..., or a single weight for every row or
+    column currently in use ("all").  A weight of None leaves that index
+    alone.  Other options, such as uniform or minsize, apply to every
+    index given.  Indices sharing a weight are set in one call."""
+    for weights, configure in ((columns, self.grid_columnconfigure),
+                               (rows, self.grid_rowconfigure)):
+        if weights is None:
+            continue
+        if isinstance(weights, int):
+            configure("all", weight=weights, **kw)
+            continue
+        for weight, indices in _weight_groups(weights).items():
+            configure(tuple(indices), weight=weight, **kw)
+    return self
+
+
+def _unmap(widget):
+    """Unmap WIDGET and return a callable that maps it again exactly where
+    it was, or None if it is not mapped by a geometry manager we know."""
+    if isinstance(widget, tkinter.Wm):
+        if widget.wm_state() != "normal":
+            return None
+        widget.wm_withdraw()
+        return widget.wm_deiconify
+    manager = widget.winfo_manager()
+    if manager == "pack":
+        info = widget.pack_info()
+        master = info["in"]
+        slaves = master.pack_slaves()
+        following = slaves[slaves.index(widget) + 1:][:1]
+        widget.pack_forget()
+
+        def restore():
+            if following and following[0] in master.pack_slaves():
+                info["before"] = following[0]
+            widget.pack_configure(**info)
+        return restore
+    if manager == "grid":
+        widget.grid_remove()
+        return widget.grid_configure
+    if manager == "place":
+        info = widget.place_info()
+        widget.place_forget()
+        return lambda: widget.place_configure(**info)
+    return None
+
+
+def _freeze(widget):
+    """Stop WIDGET from propagating and unmap it; return the undo
+    callables in the order they should run."""
+    undo = []
+    for manager in ("pack", "grid"):
+        propagate = widget.tk.call(manager, "propagate", widget._w)
+        if widget.tk.getboolean(propagate):
+            widget.tk.call(manager, "propagate", widget._w, 0)
+            undo.append(functools.partial(
+                widget.tk.call, manager, "propagate", widget._w, 1))
+    restore = _unmap(widget)
+    if restore is not None:
+        undo.append(restore)
+    return undo
+
+
+@extension(tkinter.Misc)
+@contextlib.contextmanager
+def layout_batch(self):
+    """Return a context manager that batches layout changes to this
+    widget's children.
+
+    For the duration of the block the widget does not propagate its size
+    (``pack_propagate``/``grid_propagate``) and is unmapped: a toplevel is
+    withdrawn, a packed, gridded or placed widget is removed from its
+    manager.  On exit everything is restored, the widget keeping its
+    place among its siblings, and a single ``update_idletasks`` lays out
+    the result.  Nested blocks on the same widget only act on the
+    outermost one, and blocks nested in a block on any other widget leave
+    the update to the outermost.  The context value is the widget itself::
+
+        with frame.layout_batch():
+            for child in frame.winfo_children():
+                child.destroy()
+            frame.grid_many(rows)
+    """
+    root = self._root()
+    depth = getattr(root, "_fluent_layout_depth", 0)
+    root._fluent_layout_depth = depth + 1
+    try:
+        if getattr(self, "_fluent_layout_frozen", False):
+            yield self
+            return
+        undo = _freeze(self)
+        self._fluent_layout_frozen = True
+        try:
+            yield self
+        finally:
+            for func in undo:
+                func()
+            self._fluent_layout_frozen = False
+            if not depth:
+                self.update_idletasks()
+    finally:
+        root._fluent_layout_depth = depth
@@ -0,0 +1,202 @@
+"""Bulk construction of menus from a nested specification.
+
+Building a large menu with ``add_command``/``add_cascade`` processes the
+options of every entry in Python, makes a Tcl call per entry and registers
+a Tcl command per callback.  :meth:`Menu.build` instead writes all entries
+of a menu tree as one Tcl script.  Every entry invokes the same dispatcher
+command with its own id, so a menu tree holds a single Tcl command however
+many callbacks it has.  Cascades can be populated lazily, the first time
+they are posted.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import tkinter
+
+from fluent_tkinter._patch import extension, override
+from fluent_tkinter._template import _child_name, _materialize, _script_word
+
+_ENTRY_TYPES = frozenset({
+    "command", "cascade", "checkbutton", "radiobutton", "separator",
+})
+
+
+class _MenuDispatcher:
+    """One Tcl command calling the callbacks of a whole menu tree."""
+
+    def __init__(self, menu):
+        self.callbacks = {}
+        self._ids = itertools.count()
+        self.name = menu._register(self.dispatch)
+        # Replacing the command of one entry must not delete the command
+        # shared by all of them.
+        menu._fluent_pinned_commands = {self.name}
+
+    def add(self, callback):
+        """Return the Tcl script that calls CALLBACK."""
+        key = next(self._ids)
+        self.callbacks[key] = callback
+        return f"{self.name} {key}"
+
+    def discard(self, script):
+        """Forget the callback called by SCRIPT.  Return whether SCRIPT
+        was made by :meth:`add`."""
+        words = str(script).split()
+        if len(words) != 2 or words[0] != self.name:
+            return False
+        self.callbacks.pop(int(words[1]), None)
+        return True
+
+    def dispatch(self, key):
+        return self.callbacks[int(key)]()
+
+
+def _dispatcher(menu):
+    try:
+        return menu._fluent_menu_dispatcher
+    except AttributeError:
+        dispatcher = menu._fluent_menu_dispatcher = _MenuDispatcher(menu)
+        return dispatcher
+
+
+def _option_word(value):
+    if isinstance(value, (tuple, list)):
+        return _script_word(tkinter._join(value))
+    return _script_word(str(value))
+
+
+def _normalize(entry):
+    """Return ENTRY as an options dict with a 'type' key."""
+    if entry is None or entry == "-":
+        return {"type": "separator"}
+    if isinstance(entry, dict):
+        options = dict(entry)
+    else:
+        label, action, *rest = entry
+        options = dict(rest[0]) if rest else {}
+        options["label"] = label
+        if callable(action):
+            options["command"] = action
+        else:
+            options["children"] = action
+    if "type" not in options:
+        options["type"] = "cascade" if "children" in options else "command"
+    if options["type"] not in _ENTRY_TYPES:
+        raise ValueError(f"unknown menu entry type {options['type']!r}")
+    return options
+
+
+def _build(menu, spec, dispatcher, lines):
+    """Append the script adding the entries of SPEC to MENU to LINES."""
+    for entry in spec:
+        options = _normalize(entry)
+        kind = options.pop("type")
+        children = options.pop("children", None)
+        tearoff = options.pop("tearoff", 0)
+        words = [_script_word(menu._w), "add", kind]
+        if kind == "cascade" and children is not None:
+            submenu = _materialize(tkinter.Menu, "menu", menu,
+                                   _child_name(menu, tkinter.Menu))
+            submenu._fluent_menu_dispatcher = dispatcher
+            submenu._fluent_menu_built = True
+            create = ["menu", _script_word(submenu._w),
+                      "-tearoff", _option_word(tearoff)]
+            if callable(children):
+                populate = functools.partial(_populate, submenu, children)
+                create += ["-postcommand",
+                           _script_word(dispatcher.add(populate))]
+            lines.append(" ".join(create))
+            options["menu"] = submenu
+        for key, value in options.items():
+            if callable(value):
+                value = dispatcher.add(value)
+            words.append("-" + key.rstrip("_"))
+            words.append(_option_word(value))
+        lines.append(" ".join(words))
+        if kind == "cascade" and isinstance(children, (list, tuple)):
+            _build(options["menu"], children, dispatcher, lines)
+
+
+def _populate(menu, children):
+    """Fill a lazy cascade the first time it is posted."""
+    menu._fluent_menu_dispatcher.discard(menu.cget("postcommand"))
+    menu.configure(postcommand="")
+    menu.build(children())
+
+
+@extension(tkinter.Menu)
+def build(self, spec):
+    """Add the entries described by SPEC to this menu in one Tcl script.
+
+    SPEC is a sequence of entries, each one of:
+
+    * None or "-": a separator;
+    * ``(label, callback)``: a command entry;
+    * ``(label, children)``: a cascade whose submenu holds the entries of
+      the sequence CHILDREN;
+    * ``(label, callback_or_children, options)`` with a dict of further
+      entry options such as accelerator or underline;
+    * a dict of entry options, with an optional "type" (command, cascade,
+      checkbutton, radiobutton or separator; default command, or cascade
+      if "children" is given).  "children" may also be a callable
+      returning a spec: the submenu is then filled the first time it is
+      posted.  "tearoff" sets the submenu's tearoff option (default 0).
+
+    All callbacks of the menu tree share a single Tcl command, owned by
+    the menu on which ``build`` was first called.  Deleting entries with
+    ``delete`` forgets their callbacks and destroys the cascades built for
+    them, so a menu can be cleared and built again.  Returns the menu."""
+    dispatcher = _dispatcher(self)
+    lines = []
+    _build(self, spec, dispatcher, lines)
+    if lines:
+        self.tk.eval("\n".join(lines))
+    return self
+
+
+def _discard_entries(menu, dispatcher, first, last, submenus):
+    """Forget the callbacks of entries FIRST to LAST of MENU, and of the
+    cascades created for them by ``build``, which are added to SUBMENUS.
+    Other commands of the entries are deleted as ``Menu.delete`` does."""
+    for i in range(first, last + 1):
+        kind = menu.type(i)
+        if kind in ("separator", "tearoff"):
+            continue
+        command = str(menu.entrycget(i, "command"))
+        if command and not dispatcher.discard(command):
+            menu.deletecommand(command)
+        if kind != "cascade":
+            continue
+        try:
+            submenu = menu.nametowidget(menu.entrycget(i, "menu"))
+        except KeyError:
+            continue
+        if (getattr(submenu, "_fluent_menu_built", False)
+                and submenu._fluent_menu_dispatcher is dispatcher):
+            dispatcher.discard(submenu.cget("postcommand"))
+            end = submenu.index("end")
+            if end is not None:
+                _discard_entries(submenu, dispatcher, 0, end, submenus)
+            submenus.append(submenu)
+
+
+@override(tkinter.Menu, "delete")
+def _delete(delete):
+    @functools.wraps(delete)
+    def wrapper(self, index1, index2=None):
+        dispatcher = getattr(self, "_fluent_menu_dispatcher", None)
+        if dispatcher is None:
+            return delete(self, index1, index2)
+        if index2 is None:
+            index2 = index1
+        first, last = self.index(index1), self.index(index2)
+        submenus = []
+        if first is not None and last is not None:
+            _discard_entries(self, dispatcher, first, last, submenus)
+        self.tk.call(self._w, "delete", index1, index2)
+        # Cascades made by build() belong to the deleted entries.
+        for submenu in submenus:
+            submenu.destroy()
+    return wrapper
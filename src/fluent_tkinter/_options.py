@@ -0,0 +1,101 @@
+"""Option metadata cached per widget class.
+
+``widget.configure()`` without arguments and ``widget.keys()`` ask Tk for
+the full description of every option, ``(name, dbName, dbClass, default,
+current)``, and split all of it again on every call.  Only the current
+values change between calls: names, database names, classes and defaults
+are fixed by the widget's Tcl command.  This module keeps them per widget
+class (``button``, ``ttk::entry``, ...) and interpreter after the first
+query; later ``configure()`` calls fetch just the current values in one
+Tcl call and ``keys()`` does not call Tcl at all.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import tkinter
+
+from fluent_tkinter._patch import override
+
+# Current values of the options OPTS of widget W.
+_VALUES_PROC = ("proc ::_fluent_option_values {w opts} "
+                "{lmap o $opts {$w cget $o}}")
+
+
+class _OptionTable:
+    """The options of one widget class, as described by ``configure``."""
+
+    __slots__ = ("names", "entries", "value_names")
+
+    def __init__(self, widget):
+        splitlist = widget.tk.splitlist
+        entries = {}
+        for item in splitlist(widget.tk.call(widget._w, "configure")):
+            item = splitlist(item)
+            name = item[0][1:]
+            # Keep all but the current value; aliases are (name, -target).
+            if len(item) == 5:
+                item = item[:-1]
+            entries[name] = (name,) + item[1:]
+        self.names = list(entries)
+        self.entries = entries
+        self.value_names = tuple(f"-{name}" for name, entry in entries.items()
+                                 if len(entry) == 4)
+
+    def describe(self, widget):
+        """Return the ``configure()`` dict of WIDGET."""
+        values = widget.tk.splitlist(widget.tk.call(
+            "::_fluent_option_values", widget._w, self.value_names))
+        values = iter(values)
+        return {name: entry + (next(values),) if len(entry) == 4 else entry
+                for name, entry in self.entries.items()}
+
+
+def _table(widget):
+    """Return the option table of WIDGET's class, or None if it has none."""
+    widget_name = getattr(widget, "widgetName", None)
+    if widget_name is None:
+        return None
+    root = widget._root()
+    try:
+        tables = root._fluent_option_tables
+    except AttributeError:
+        widget.tk.eval(_VALUES_PROC)
+        tables = root._fluent_option_tables = {}
+    try:
+        return tables[widget_name]
+    except KeyError:
+        table = tables[widget_name] = _OptionTable(widget)
+        return table
+
+
+def _configure_factory(configure):
+    @functools.wraps(configure)
+    def wrapper(self, cnf=None, **kw):
+        if cnf is None and not kw:
+            table = _table(self)
+            if table is not None:
+                return table.describe(self)
+        elif isinstance(cnf, str) and not kw:
+            table = _table(self)
+            entry = table and table.entries.get(cnf)
+            if entry is not None and len(entry) == 4:
+                return entry + (self.tk.call(self._w, "cget", "-" + cnf),)
+        return configure(self, cnf, **kw)
+    return wrapper
+
+
+override(tkinter.Misc, "configure", _configure_factory)
+override(tkinter.Misc, "config", _configure_factory)
+
+
+@override(tkinter.Misc, "keys")
+def _keys(keys):
+    @functools.wraps(keys)
+    def wrapper(self):
+        table = _table(self)
+        if table is None:
+            return keys(self)
+        return list(table.names)
+    return wrapper
@@ -101,9 +101,43 @@ def _patch_class(cls):
             setattr(cls, name, _make_fluent(obj))
 
 
+# Additional methods contributed by the feature modules.  Each entry is
+# ``(cls, name, factory)``; *factory* receives the attribute currently found
+# on *cls* (or ``None``) and returns its replacement.  Extensions are applied
+# after the fluent wrappers so they may build on the patched methods.
+_EXTENSIONS: list[tuple[type, str, object]] = []
+
 _patched = False
 
 
+def _install(cls, name, factory):
+    setattr(cls, name, factory(getattr(cls, name, None)))
+
+
+def extension(*classes, name=None):
+    """Decorator adding the decorated function as a method of *classes*."""
+    def decorator(func):
+        for cls in classes:
+            override(cls, name or func.__name__, lambda _, func=func: func)
+        return func
+    return decorator
+
+
+def override(cls, name, factory=None):
+    """Register *factory* to replace attribute *name* of *cls*.
+
+    *factory* receives the attribute being replaced and returns the new
+    one.  Without *factory*, return a decorator that registers it.  If
+    :func:`patch` has already run the replacement is applied at once.
+    """
+    if factory is None:
+        return functools.partial(override, cls, name)
+    _EXTENSIONS.append((cls, name, factory))
+    if _patched:
+        _install(cls, name, factory)
+    return factory
+
+
 def patch():
     """Apply the fluent monkey-patch to tkinter.
 
@@ -180,3 +214,6 @@ def patch():
 
     for cls in _tkinter_classes + _ttk_classes:
         _patch_class(cls)
+
+    for cls, name, factory in _EXTENSIONS:
+        _install(cls, name, factory)
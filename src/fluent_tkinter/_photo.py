@@ -0,0 +1,106 @@
+"""Bulk pixel upload for :class:`tkinter.PhotoImage`.
+
+``PhotoImage.put`` expects pixel data as Tcl lists of ``#rrggbb`` strings,
+and formatting those in Python dominates the cost of pushing video frames
+or heatmaps.  :meth:`put_buffer` instead wraps a raw pixel buffer in a
+binary PPM/PGM header, or a stored (uncompressed) PNG when an alpha channel
+is present, and hands it to Tk in a single ``put`` call.  No per-pixel work
+happens in Python.
+"""
+
+from __future__ import annotations
+
+import struct
+import tkinter
+import zlib
+
+from fluent_tkinter._patch import extension
+
+# mode -> (bytes per pixel, Tk photo format)
+_MODES = {
+    "L": (1, "ppm"),
+    "RGB": (3, "ppm"),
+    "RGBA": (4, "png"),
+}
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(kind, data):
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+
+def _encode_png(rows, width, height):
+    # Every scanline is prefixed with filter type 0 (None).
+    raw = b"\0" + b"\0".join(rows)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"".join((
+        _PNG_SIGNATURE,
+        _png_chunk(b"IHDR", header),
+        _png_chunk(b"IDAT", zlib.compress(raw, 0)),
+        _png_chunk(b"IEND", b""),
+    ))
+
+
+def _encode_pnm(data, width, height, channels):
+    magic = b"P5" if channels == 1 else b"P6"
+    return b"%s %d %d 255\n" % (magic, width, height) + data
+
+
+def _as_bytes_view(buf):
+    view = memoryview(buf)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast("B")
+
+
+@extension(tkinter.PhotoImage)
+def put_buffer(self, buf, width, height, mode="RGB", box=None, to=None):
+    """Put raw pixels from BUF into the image.
+
+    BUF is any object supporting the buffer protocol (bytes, bytearray,
+    memoryview, a C-contiguous NumPy array, ...) holding HEIGHT rows of
+    WIDTH pixels.  MODE is "L" (grey), "RGB" or "RGBA", one byte per
+    channel.
+
+    BOX = (x0, y0, x1, y1) selects a sub-rectangle of the buffer to upload,
+    for example the dirty region of a frame.  TO = (x, y) is where the
+    uploaded pixels go in the image; it defaults to the position of BOX, or
+    the origin.  Returns the image."""
+    try:
+        channels, fmt = _MODES[mode]
+    except KeyError:
+        raise ValueError(f"unsupported mode {mode!r}; "
+                         f"expected one of {', '.join(_MODES)}") from None
+    view = _as_bytes_view(buf)
+    stride = width * channels
+    if len(view) != stride * height:
+        raise ValueError(f"buffer holds {len(view)} bytes, expected "
+                         f"{stride * height} for {width}x{height} {mode}")
+    if box is None:
+        x0, y0, x1, y1 = 0, 0, width, height
+    else:
+        x0, y0, x1, y1 = box
+        if not (0 <= x0 < x1 <= width and 0 <= y0 < y1 <= height):
+            raise ValueError(f"box {box!r} outside {width}x{height} buffer")
+    if to is None:
+        to = (x0, y0)
+    w, h = x1 - x0, y1 - y0
+    if fmt == "png" or w != width:
+        start, end = x0 * channels, x1 * channels
+        rows = [view[y * stride + start:y * stride + end]
+                for y in range(y0, y1)]
+    else:
+        rows = None
+    if fmt == "png":
+        data = _encode_png(rows, w, h)
+    else:
+        if rows is None:
+            pixels = view[y0 * stride:y1 * stride]
+        else:
+            pixels = b"".join(rows)
+        data = _encode_pnm(pixels, w, h, channels)
+    self.tk.call(self.name, "put", data, "-format", fmt,
+                 "-to", to[0], to[1])
+    return self
@@ -0,0 +1,120 @@
+"""Recycling of frequently created and destroyed widgets.
+
+Destroying a composite row (a frame with labels, buttons and an icon) and
+building a new one costs a Tcl command per widget, option processing and a
+relayout, and the row's callback commands must be created again.  A
+:class:`WidgetPool` hides released widgets instead and hands them out again,
+reconfigured, on the next :meth:`~WidgetPool.acquire`.
+"""
+
+from __future__ import annotations
+
+import time
+
+
+class WidgetPool:
+    """Pool of interchangeable widgets made by FACTORY.
+
+    FACTORY is called with no arguments and returns a new widget.  RESET,
+    if given, is called as ``reset(widget, *args, **kwargs)`` by
+    :meth:`acquire` to prepare a widget for reuse; without it the keyword
+    arguments are passed to ``widget.configure``.  Reconfiguring callback
+    options replaces the old Tcl commands rather than adding to them.
+
+    At most MAXSIZE released widgets are kept; further ones are destroyed.
+    Widgets left unused for TRIM_AFTER milliseconds are destroyed by the
+    application's :meth:`~tkinter.Misc.scheduler`, so an idle pool shrinks
+    back to nothing::
+
+        pool = WidgetPool(lambda: Row(results), reset=Row.show)
+        for hit in hits:
+            pool.acquire(hit).pack(fill="x")
+        ...
+        pool.release(row)
+    """
+
+    def __init__(self, factory, reset=None, maxsize=64, trim_after=10000):
+        self.factory = factory
+        self.reset = reset
+        self.maxsize = maxsize
+        self.trim_after = trim_after
+        # Released widgets and when they were released, oldest first.
+        self._free = []
+        # The same widgets, to ignore repeated releases.
+        self._released = set()
+        self._trim_timer = None
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self):
+        """Return the number of released widgets kept for reuse."""
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs):
+        """Return an unmapped widget, reused if possible, prepared with
+        ARGS and KWARGS.  Map it with pack, grid or place as usual."""
+        if args and self.reset is None:
+            raise TypeError("positional arguments need a reset function")
+        while self._free:
+            widget, _ = self._free.pop()
+            self._released.discard(widget)
+            if widget.winfo_exists():
+                self.reused += 1
+                break
+        else:
+            widget = self.factory()
+            self.created += 1
+        if self.reset is not None:
+            self.reset(widget, *args, **kwargs)
+        elif kwargs:
+            widget.configure(**kwargs)
+        return widget
+
+    def release(self, widget):
+        """Unmap WIDGET and keep it for reuse, or destroy it if the pool is
+        full.  Releasing a widget already in the pool does nothing.
+        Returns the pool."""
+        if widget in self._released:
+            return self
+        if len(self._free) >= self.maxsize:
+            widget.destroy()
+            return self
+        manager = widget.winfo_manager()
+        if manager == "pack":
+            widget.pack_forget()
+        elif manager == "grid":
+            widget.grid_remove()
+        elif manager == "place":
+            widget.place_forget()
+        self._free.append((widget, time.monotonic()))
+        self._released.add(widget)
+        if self._trim_timer is None and self.trim_after is not None:
+            self._trim_timer = widget.scheduler().call_later(
+                self.trim_after, self._trim, widget)
+        return self
+
+    def _trim(self, widget):
+        self._trim_timer = None
+        cutoff = time.monotonic() - self.trim_after / 1000
+        free = self._free
+        stale = 0
+        while stale < len(free) and free[stale][1] <= cutoff:
+            stale += 1
+        for old, _ in free[:stale]:
+            self._released.discard(old)
+            old.destroy()
+        del free[:stale]
+        if free:
+            delay = (free[0][1] - cutoff) * 1000
+            self._trim_timer = widget.scheduler().call_later(
+                max(delay, 1), self._trim, free[0][0])
+
+    def clear(self):
+        """Destroy every released widget."""
+        if self._trim_timer is not None:
+            self._trim_timer.cancel()
+            self._trim_timer = None
+        free, self._free = self._free, []
+        self._released.clear()
+        for widget, _ in free:
+            widget.destroy()
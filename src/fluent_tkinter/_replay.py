@@ -0,0 +1,213 @@
+"""Replay of synthetic input for measuring latency.
+
+An :class:`InputReplay` holds a script of events (key presses, pointer
+motion, clicks, any ``event_generate`` sequence) and plays it against a
+widget at a fixed rate or with recorded timing.  For every event it takes
+two timestamps in Tcl: when Tk starts running the bindings of the target
+widget for it, through a probe bind tag put in front of the widget's own
+tags, and when the ``update_idletasks`` that follows the event, and hence
+the redraw it caused, has completed.  The differences are returned
+as a :class:`LatencyReport`::
+
+    report = (InputReplay(canvas)
+              .click(10, 10)
+              .drag([(x, x) for x in range(10, 200)])
+              .run(rate_hz=120))
+    print(report.p50, report.p99)
+    report.check(p99=16)
+
+Run it against a display of its own, such as the Xvfb server started by
+the test suite, so that real input does not interfere.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import NamedTuple
+
+# Bind tag put in front of the bind tags of the targets while replaying.
+_PROBE_TAG = "FluentReplayProbe"
+_PROBE_SCRIPT = "set ::_fluent_replay_entry [clock microseconds]"
+
+_KEYSYMS = {
+    " ": "space", "\n": "Return", "\t": "Tab", ".": "period",
+    ",": "comma", "-": "minus", "+": "plus", "=": "equal", "/": "slash",
+    ":": "colon", ";": "semicolon", "!": "exclam", "?": "question",
+    "'": "apostrophe", '"': "quotedbl", "(": "parenleft",
+    ")": "parenright",
+}
+
+
+def _percentile(values, pct):
+    """Return the PCT percentile of VALUES, by nearest rank."""
+    values = sorted(values)
+    if not values:
+        return float("nan")
+    index = min(len(values) - 1, round(pct / 100 * (len(values) - 1)))
+    return values[index]
+
+
+class LatencyReport(NamedTuple):
+    """Dispatch-to-redraw latencies of one replay, in milliseconds."""
+
+    #: Latency of every event Tk delivered to its target, from the start of
+    #: binding dispatch to the end of the following redraw, in replay
+    #: order.  Events the target has no binding for are included.
+    samples: tuple
+    #: Number of events Tk never delivered to their target, such as key
+    #: events while the target does not have the focus.
+    missed: int
+
+    @property
+    def count(self):
+        return len(self.samples)
+
+    @property
+    def p50(self):
+        return _percentile(self.samples, 50)
+
+    @property
+    def p99(self):
+        return _percentile(self.samples, 99)
+
+    @property
+    def max(self):
+        return max(self.samples, default=float("nan"))
+
+    def check(self, p50=None, p99=None, max=None):
+        """Raise AssertionError if a latency exceeds its limit, in
+        milliseconds.  Returns the report."""
+        failures = [
+            f"{name} {value:.2f} ms > {limit} ms"
+            for name, value, limit in [("p50", self.p50, p50),
+                                       ("p99", self.p99, p99),
+                                       ("max", self.max, max)]
+            if limit is not None and not value <= limit
+        ]
+        if failures:
+            raise AssertionError(
+                f"input latency over budget ({self.count} events): "
+                + ", ".join(failures))
+        return self
+
+    def __str__(self):
+        return (f"{self.count} events, p50 {self.p50:.2f} ms, "
+                f"p99 {self.p99:.2f} ms, max {self.max:.2f} ms"
+                + (f", {self.missed} missed" if self.missed else ""))
+
+
+class InputReplay:
+    """Script of synthetic input events played against WIDGET.
+
+    The builder methods append events and return the replay, so scripts
+    chain.  Each event is sent to WIDGET unless another target is given.
+    :meth:`pause` inserts a delay used when the script is played with its
+    own timing.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        # (offset in ms, target, sequence, options)
+        self._events = []
+        self._offset = 0.0
+
+    def __len__(self):
+        return len(self._events)
+
+    def event(self, sequence, widget=None, **options):
+        """Add SEQUENCE with the ``event_generate`` OPTIONS."""
+        self._events.append((self._offset, widget or self.widget,
+                             sequence, options))
+        return self
+
+    def pause(self, ms):
+        """Delay the following events by MS milliseconds."""
+        self._offset += ms
+        return self
+
+    def extend(self, events):
+        """Add recorded EVENTS, an iterable of ``(time_ms, sequence,
+        options)`` with times relative to the start of the recording."""
+        start = self._offset
+        for when, sequence, options in events:
+            self._offset = start + when
+            self.event(sequence, **options)
+        return self
+
+    def key(self, keysym, widget=None):
+        """Add a press and release of the key KEYSYM."""
+        return (self.event("<KeyPress>", widget, keysym=keysym)
+                .event("<KeyRelease>", widget, keysym=keysym))
+
+    def text(self, text, widget=None):
+        """Add key presses typing the characters of TEXT."""
+        for char in text:
+            keysym = _KEYSYMS.get(char, char)
+            self.key(keysym, widget)
+        return self
+
+    def motion(self, x, y, widget=None, button=None):
+        """Add pointer motion to (X, Y), with BUTTON held if given."""
+        state = 0x80 << button if button else 0
+        return self.event("<Motion>", widget, x=x, y=y, state=state)
+
+    def click(self, x, y, button=1, widget=None):
+        """Add a press and release of BUTTON at (X, Y)."""
+        return (self.event("<ButtonPress>", widget, x=x, y=y, button=button)
+                .event("<ButtonRelease>", widget, x=x, y=y, button=button))
+
+    def drag(self, points, button=1, widget=None):
+        """Add a drag with BUTTON through the (x, y) POINTS."""
+        (x, y), *rest = points
+        self.event("<ButtonPress>", widget, x=x, y=y, button=button)
+        for x, y in rest:
+            self.motion(x, y, widget, button)
+        return self.event("<ButtonRelease>", widget, x=x, y=y,
+                          button=button)
+
+    def run(self, rate_hz=None, warmup=0):
+        """Play the script and return a :class:`LatencyReport`.
+
+        With RATE_HZ, events are sent that many per second; otherwise at
+        the times given by :meth:`pause` and :meth:`extend`, back to back if
+        there are none.  Between events the event loop runs, so timers and
+        other pending work of the application compete with the input as
+        they would for a user.  The first WARMUP events are not measured."""
+        widget = self.widget
+        tk = widget.tk
+        targets = {target for _, target, _, _ in self._events}
+        saved = {target: target.bindtags() for target in targets}
+        for sequence in {sequence for _, _, sequence, _ in self._events}:
+            tk.call("bind", _PROBE_TAG, sequence, _PROBE_SCRIPT)
+        for target, tags in saved.items():
+            target.bindtags((_PROBE_TAG, *tags))
+        samples = []
+        missed = 0
+        try:
+            widget.focus_force()
+            widget.update()
+            start = time.perf_counter()
+            for i, (offset, target, sequence, options) in enumerate(
+                    self._events):
+                due = start + (i / rate_hz if rate_hz else offset / 1000)
+                while time.perf_counter() < due:
+                    widget.update()
+                    time.sleep(0.0002)
+                tk.call("set", "::_fluent_replay_entry", "")
+                target.event_generate(sequence, **options)
+                target.update_idletasks()
+                done = tk.call("clock", "microseconds")
+                entry = tk.call("set", "::_fluent_replay_entry")
+                if i < warmup:
+                    continue
+                if entry == "":
+                    missed += 1
+                else:
+                    samples.append((done - int(entry)) / 1000)
+        finally:
+            for target, tags in saved.items():
+                if target.winfo_exists():
+                    target.bindtags(tags)
+            for sequence in tk.splitlist(tk.call("bind", _PROBE_TAG)):
+                tk.call("bind", _PROBE_TAG, sequence, "")
+        return LatencyReport(tuple(samples), missed)
@@ -0,0 +1,257 @@
+"""Timer scheduler multiplexing Python timers onto a single Tcl timer.
+
+Every ``Misc.after(ms, func)`` call registers a Tcl command and a Tcl timer,
+and the command leaks if the timer is cancelled with anything other than
+``after_cancel``.  Applications with thousands of short-lived timers
+(tooltips, debounces, cursor blinks) pay for that churn.
+
+:class:`Scheduler` keeps timers in millisecond buckets: timers due in the
+same millisecond share a bucket, and a heap orders the distinct deadlines.
+Inserting into an existing bucket and cancelling are O(1); only a new
+deadline costs a heap push.  A single Tcl timer handler, which needs no Tcl
+command, is armed for the earliest deadline.  Nothing is armed while no
+timer is pending.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import time
+
+import tkinter
+
+from fluent_tkinter._patch import extension
+
+
+def _now():
+    return time.monotonic() * 1000.0
+
+
+class TimerHandle:
+    """A pending call scheduled with :meth:`Scheduler.call_later`."""
+
+    __slots__ = ("_scheduler", "_func", "_args", "when")
+
+    def __init__(self, scheduler, when, func, args):
+        self._scheduler = scheduler
+        self._func = func
+        self._args = args
+        self.when = when
+
+    @property
+    def active(self):
+        """True until the timer has fired or been cancelled."""
+        return self._func is not None
+
+    def cancel(self):
+        """Cancel the timer.  Cancelling twice, or after it fired, is a
+        no-op."""
+        if self._func is not None:
+            self._func = self._args = None
+            self._scheduler._cancelled()
+
+    def __repr__(self):
+        state = "active" if self.active else "done"
+        return f"<TimerHandle {state} when={self.when}>"
+
+
+class Scheduler:
+    """Multiplexes any number of timers onto one Tcl timer handler.
+
+    Obtain the scheduler of an application with :meth:`Misc.scheduler`.
+    Callbacks run on the Tk thread; exceptions are reported through
+    ``report_callback_exception`` like those of ordinary Tk callbacks.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._buckets = {}
+        self._deadlines = []
+        self._live = 0
+        self._timer = None
+        self._armed_for = None
+        self._firing = False
+
+    def __len__(self):
+        """Return the number of pending timers."""
+        return self._live
+
+    def call_later(self, ms, func, *args):
+        """Call ``func(*args)`` after MS milliseconds and return a
+        :class:`TimerHandle`."""
+        when = math.ceil(_now() + ms)
+        handle = TimerHandle(self, when, func, args)
+        bucket = self._buckets.get(when)
+        if bucket is None:
+            bucket = self._buckets[when] = []
+            heapq.heappush(self._deadlines, when)
+        bucket.append(handle)
+        self._live += 1
+        if not self._firing and (self._armed_for is None
+                                 or when < self._armed_for):
+            self._arm(when)
+        return handle
+
+    def call_idle(self, func, *args):
+        """Call ``func(*args)`` once pending events have been processed."""
+        return self.call_later(0, func, *args)
+
+    def debounce(self, ms, func):
+        """Return a :class:`Debounced` wrapper of FUNC.
+
+        Each call of the wrapper restarts an MS millisecond timer; FUNC runs
+        once, with the latest arguments, when calls stop for that long."""
+        return Debounced(self, ms, func)
+
+    def throttle(self, ms, func):
+        """Return a :class:`Throttled` wrapper of FUNC.
+
+        FUNC runs at most once per MS milliseconds: the first call runs
+        immediately and calls during the window collapse into one trailing
+        call with the latest arguments."""
+        return Throttled(self, ms, func)
+
+    def cancel_all(self):
+        """Cancel every pending timer."""
+        for bucket in self._buckets.values():
+            for handle in bucket:
+                handle._func = handle._args = None
+        self._buckets.clear()
+        self._deadlines.clear()
+        self._live = 0
+        self._disarm()
+
+    def _cancelled(self):
+        self._live -= 1
+        if not self._live:
+            # Drop the cancelled entries and let the event loop sleep.
+            self._buckets.clear()
+            self._deadlines.clear()
+            self._disarm()
+
+    def _arm(self, when):
+        self._disarm()
+        delay = max(0, math.ceil(when - _now()))
+        self._timer = self.root.tk.createtimerhandler(delay, self._fire)
+        self._armed_for = when
+
+    def _disarm(self):
+        if self._timer is not None:
+            self._timer.deletetimerhandler()
+            self._timer = None
+            self._armed_for = None
+
+    def _fire(self):
+        self._timer = self._armed_for = None
+        self._firing = True
+        deadlines = self._deadlines
+        buckets = self._buckets
+        try:
+            now = _now()
+            while deadlines and deadlines[0] <= now:
+                for handle in buckets.pop(heapq.heappop(deadlines)):
+                    func = handle._func
+                    if func is None:
+                        continue
+                    args = handle._args
+                    handle._func = handle._args = None
+                    self._live -= 1
+                    try:
+                        func(*args)
+                    except SystemExit:
+                        raise
+                    except BaseException:
+                        self.root._report_exception()
+        finally:
+            self._firing = False
+            if not self._live:
+                buckets.clear()
+                deadlines.clear()
+            elif deadlines:
+                self._arm(deadlines[0])
+
+
+class Debounced:
+    """Callable that postpones FUNC until calls stop for MS milliseconds."""
+
+    __slots__ = ("_scheduler", "_ms", "_func", "_handle")
+
+    def __init__(self, scheduler, ms, func):
+        self._scheduler = scheduler
+        self._ms = ms
+        self._func = func
+        self._handle = None
+
+    def __call__(self, *args):
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._scheduler.call_later(self._ms, self._run, args)
+
+    def _run(self, args):
+        self._handle = None
+        self._func(*args)
+
+    @property
+    def pending(self):
+        """True while a call is waiting to run."""
+        return self._handle is not None
+
+    def cancel(self):
+        """Drop the pending call, if any."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def flush(self):
+        """Run the pending call now, if any."""
+        handle = self._handle
+        if handle is not None and handle.active:
+            args = handle._args
+            self.cancel()
+            self._run(*args)
+
+
+class Throttled:
+    """Callable that runs FUNC at most once per MS milliseconds."""
+
+    __slots__ = ("_scheduler", "_ms", "_func", "_handle", "_pending")
+
+    def __init__(self, scheduler, ms, func):
+        self._scheduler = scheduler
+        self._ms = ms
+        self._func = func
+        self._handle = None
+        self._pending = None
+
+    def __call__(self, *args):
+        if self._handle is None:
+            self._handle = self._scheduler.call_later(self._ms, self._reopen)
+            self._func(*args)
+        else:
+            self._pending = args
+
+    def _reopen(self):
+        self._handle = None
+        args = self._pending
+        if args is not None:
+            self._pending = None
+            self(*args)
+
+    def cancel(self):
+        """Drop the trailing call and reopen the window."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending = None
+
+
+@extension(tkinter.Misc)
+def scheduler(self):
+    """Return the :class:`Scheduler` shared by this application."""
+    root = self._root()
+    try:
+        return root._fluent_scheduler
+    except AttributeError:
+        sched = root._fluent_scheduler = Scheduler(root)
+        return sched
@@ -0,0 +1,277 @@
+"""Batched ttk style updates and a read-through style cache.
+
+Switching themes typically configures, maps and lays out dozens of styles,
+and every ``ttk.Style`` call formats its arguments in Python and makes its
+own Tcl round trip.  :meth:`ttk.Style.apply` takes the settings of all
+styles at once, in the format of ``theme_settings``, and runs them as a
+single Tcl script.
+
+Style queries (``lookup``, ``configure``/``map`` with a query option,
+``layout`` without a spec) are answered from a cache shared by all
+``Style`` objects of an application.  The cache is cleared by every write
+through ``ttk.Style`` and whenever the theme changes, even from Tcl; code
+that changes the styles of the current theme behind ``ttk.Style``'s back,
+in Tcl, should call :meth:`ttk.Style.clear_cache`.
+
+:meth:`ttk.Style.load_theme` creates a theme from settings built in Python
+once, saves the resulting Tcl script in a cache directory and afterwards
+creates the theme with a single ``source`` of that file, without building
+or formatting the settings again.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import marshal
+import os
+import re
+import tkinter
+import tkinter.font
+import tkinter.ttk as ttk
+
+from fluent_tkinter._patch import extension, override
+from fluent_tkinter._template import _script_word
+
+
+def _cache(style):
+    """Return the query cache of the application of *style*."""
+    master = style.master
+    root = master._root() if isinstance(master, tkinter.Misc) else master
+    try:
+        return root._fluent_style_cache
+    except AttributeError:
+        cache = root._fluent_style_cache = {}
+        if isinstance(root, tkinter.Misc):
+            # Themes may also be switched from Tcl, e.g. by ttk::setTheme.
+            root.bind("<<ThemeChanged>>", lambda event: cache.clear(), "+")
+        return cache
+
+
+def _copy(value):
+    """Copy the dicts and lists of a query result; Tcl objects and strings
+    are immutable and shared."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_copy(v) for v in value)
+    return value
+
+
+def _cached(style, key, query):
+    cache = _cache(style)
+    try:
+        result = cache[key]
+    except KeyError:
+        result = cache[key] = query()
+    # Callers may modify the dicts and lists they get back.
+    return _copy(result)
+
+
+@extension(ttk.Style)
+def clear_cache(self):
+    """Forget all cached style queries of this application.  Returns the
+    style."""
+    _cache(self).clear()
+    return self
+
+
+@extension(ttk.Style)
+def apply(self, settings):
+    """Apply SETTINGS to the current theme in one Tcl script.
+
+    SETTINGS maps style names to dicts with any of the keys 'configure',
+    'map', 'layout' and 'element create', in the format of
+    :meth:`theme_settings`::
+
+        style.apply({
+            "TButton": {"configure": {"padding": 6}},
+            "Danger.TButton": {"map": {"foreground": [("active", "red")]}},
+        })
+
+    Returns the style."""
+    script = ttk._script_from_settings(settings)
+    _cache(self).clear()
+    if script:
+        self.tk.eval(script)
+    return self
+
+
+@override(ttk.Style, "lookup")
+def _lookup(lookup):
+    @functools.wraps(lookup)
+    def wrapper(self, style, option, state=None, default=None):
+        key = ("lookup", style, option,
+               tuple(state) if state else None, default)
+        return _cached(self, key,
+                       lambda: lookup(self, style, option, state, default))
+    return wrapper
+
+
+def _query_or_write(kind):
+    def factory(method):
+        @functools.wraps(method)
+        def wrapper(self, style, query_opt=None, **kw):
+            if kw:
+                _cache(self).clear()
+                return method(self, style, query_opt, **kw)
+            return _cached(self, (kind, style, query_opt),
+                           lambda: method(self, style, query_opt))
+        return wrapper
+    return factory
+
+
+override(ttk.Style, "configure", _query_or_write("configure"))
+override(ttk.Style, "map", _query_or_write("map"))
+
+
+@override(ttk.Style, "layout")
+def _layout(layout):
+    @functools.wraps(layout)
+    def wrapper(self, style, layoutspec=None):
+        if layoutspec is not None:
+            _cache(self).clear()
+            return layout(self, style, layoutspec)
+        return _cached(self, ("layout", style),
+                       lambda: layout(self, style))
+    return wrapper
+
+
+def _invalidating(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        _cache(self).clear()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+for _name in ("element_create", "theme_create", "theme_settings"):
+    override(ttk.Style, _name, _invalidating)
+
+
+@override(ttk.Style, "theme_use")
+def _theme_use(theme_use):
+    @functools.wraps(theme_use)
+    def wrapper(self, themename=None):
+        if themename is None:
+            return theme_use(self)
+        _cache(self).clear()
+        return theme_use(self, themename)
+    return wrapper
+
+
+# -- cached theme bundles ----------------------------------------------------
+
+# Bumped whenever the layout of the cached scripts changes.
+_BUNDLE_FORMAT = b"1"
+
+
+def _default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "fluent_tkinter", "themes")
+
+
+def _build_fingerprint(build):
+    """Return bytes identifying the code of BUILD: the source of its module,
+    or its bytecode if the source is not available."""
+    try:
+        with open(inspect.getsourcefile(build), "rb") as f:
+            return f.read()
+    except (TypeError, OSError):
+        return marshal.dumps(build.__code__)
+
+
+def _transient_names(tk):
+    """Return the names of the images and of the named fonts other than
+    Tk's standard ones: objects a saved script cannot recreate."""
+    names = set(map(str, tk.splitlist(tk.call("image", "names"))))
+    names.update(name for name in map(str, tk.splitlist(
+                     tk.call("font", "names")))
+                 if not name.startswith("Tk"))
+    return names
+
+
+def _is_transient(value, names):
+    """Return whether the settings VALUE refer to an image or a named
+    font: an Image object, an ``image`` option or element, or a name or
+    Font object in NAMES."""
+    if isinstance(value, tkinter.Image):
+        return True
+    if isinstance(value, dict):
+        return any(key in ("image", "-image")
+                   or key == "element create" and item and item[0] == "image"
+                   or _is_transient(item, names)
+                   for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_is_transient(item, names) for item in value)
+    return (isinstance(value, (str, tkinter._tkinter.Tcl_Obj,
+                               tkinter.font.Font))
+            and str(value) in names)
+
+
+@extension(ttk.Style)
+def load_theme(self, themename, build, parent=None, *, version=None,
+               cache_dir=None):
+    """Create theme THEMENAME from the settings returned by BUILD, using a
+    cached Tcl script when possible.  Returns the style.
+
+    BUILD is called without arguments and returns settings in the format
+    of :meth:`theme_create`.  The script generated from them is saved in
+    CACHE_DIR (by default ``$XDG_CACHE_HOME/fluent_tkinter/themes``) under
+    a hash of THEMENAME, PARENT, the Tk version and VERSION.  When VERSION
+    is None the source of BUILD's module is hashed instead, so editing the
+    theme code invalidates the cache.  Later calls with the same hash
+    ``source`` the saved script and do not call BUILD.
+
+    Settings that refer to images or named fonts are applied but never
+    cached, as those do not survive the process.  Nothing happens if the theme
+    already exists."""
+    if themename in self.theme_names():
+        return self
+    if version is None:
+        version = _build_fingerprint(build)
+    elif isinstance(version, str):
+        version = version.encode()
+    digest = hashlib.sha256(b"\0".join([
+        _BUNDLE_FORMAT, themename.encode(), (parent or "").encode(),
+        str(self.tk.call("info", "patchlevel")).encode(),
+        self.tk.call("package", "provide", "Tk").encode(), version,
+    ])).hexdigest()[:24]
+    if cache_dir is None:
+        cache_dir = _default_cache_dir()
+    # The digest covers the exact name; keep just a readable hint of it.
+    hint = re.sub(r"[^\w.-]", "_", themename)[:40]
+    path = os.path.join(cache_dir, f"{hint}-{digest}.tcl")
+    _cache(self).clear()
+    if os.path.exists(path):
+        try:
+            self.tk.call("source", "-encoding", "utf-8", path)
+            return self
+        except tkinter.TclError:
+            # A damaged or stale file.  Remove it so the next run rebuilds
+            # it, and rebuild it now if the theme was not created.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            if themename in self.theme_names():
+                raise
+    settings = build()
+    args = ["ttk::style", "theme", "create", themename]
+    if parent:
+        args += ["-parent", parent]
+    args += ["-settings", ttk._script_from_settings(settings)]
+    script = " ".join(map(_script_word, args))
+    self.tk.eval(script)
+    if not _is_transient(settings, _transient_names(self.tk)):
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(script)
+            f.write("\n")
+        os.replace(tmp, path)
+    return self
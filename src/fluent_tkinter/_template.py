@@ -0,0 +1,335 @@
+"""Widget-tree templates compiled to a single Tcl script.
+
+Building the same dialog again and again repeats all the Python-side work
+of tkinter: option processing, name generation and one Tcl round trip per
+widget and per chained call.  A :class:`Template` records the construction
+of a widget tree once, on prototype widgets whose Tcl calls are captured
+instead of executed, and compiles the capture into a Tcl script with
+placeholders for widget paths, :class:`Param` values and callbacks::
+
+    form = Template()
+    frame = form.widget(tkinter.Frame, padx=8)
+    form.widget(tkinter.Label, frame, text=Param("title")).grid(row=0)
+    form.widget(tkinter.Button, frame, name="ok", text="OK",
+                command=Param("on_ok")).grid(row=1)
+
+    dialog = form.instantiate(top, title="Save changes?", on_ok=save)
+    dialog.root.pack()
+    dialog["ok"].focus_set()
+
+:meth:`Template.instantiate` creates the Python widget objects directly
+and runs the whole script in one interpreter evaluation.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+
+import tkinter
+
+_MISSING = object()
+
+_MARKER_RE = re.compile(
+    r"\.<fluent-top:(\d+)>|<fluent-(param|elem):(\w+)>|<fluent-cmd:(\d+)>")
+
+# Characters that must be escaped in a word of a Tcl script.
+_SCRIPT_SPECIAL_RE = re.compile(r'([\\\[\]{}$";\s])', re.ASCII)
+_SCRIPT_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r",
+                   "\v": "\\v", "\f": "\\f"}
+
+
+def _script_word(value):
+    """Return VALUE quoted as a single word of a Tcl script."""
+    if not value:
+        return "{}"
+    return _SCRIPT_SPECIAL_RE.sub(
+        lambda m: _SCRIPT_ESCAPES.get(m[1], "\\" + m[1]), value)
+
+
+class Param:
+    """Placeholder for a value supplied to :meth:`Template.instantiate`.
+
+    A parameter can stand for a whole option value or for an element of a
+    tuple value, such as ``padx=(Param("pad"), 0)``.  Callable values are
+    registered as Tcl commands of the new widgets.
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name, default=_MISSING):
+        if not name.isidentifier():
+            raise ValueError(f"parameter name must be an identifier, "
+                             f"not {name!r}")
+        self.name = name
+        self.default = default
+
+    def __str__(self):
+        return f"<fluent-param:{self.name}>"
+
+    def __repr__(self):
+        return f"Param({self.name!r})"
+
+
+class _Recorder:
+    """Stands in for the Tcl interpreter of prototype widgets."""
+
+    def __init__(self, tk):
+        self._tk = tk
+        self.calls = []
+        # Command name -> CallWrapper of every callback registered.
+        self.commands = {}
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        self.calls.append(args)
+        return ""
+
+    def createcommand(self, name, func):
+        self.commands[name] = func.__self__
+
+    def deletecommand(self, name):
+        # Instances still need the command if an earlier recorded call
+        # refers to it; it is owned by the new widget and deleted with it.
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+class _PrototypeMaster(tkinter.Misc):
+    """Parent of the top-level prototype widgets of a template."""
+
+    _w = "."
+    master = None
+
+    def __init__(self, tk):
+        self.tk = tk
+        self.children = {}
+        self._last_child_ids = None
+
+    def _root(self):
+        return self
+
+
+class TemplateInstance:
+    """Widgets created by one :meth:`Template.instantiate` call.
+
+    ``instance[name]`` is the widget created for the node given ``name=``;
+    :attr:`roots` are the top-level widgets, :attr:`root` the first one.
+    """
+
+    def __init__(self, roots, named):
+        self.roots = roots
+        self._named = named
+
+    @property
+    def root(self):
+        return self.roots[0]
+
+    def __getitem__(self, name):
+        return self._named[name]
+
+    def __contains__(self, name):
+        return name in self._named
+
+    def __repr__(self):
+        return f"<TemplateInstance {' '.join(map(str, self.roots))}>"
+
+
+class _Node:
+
+    __slots__ = ("proto", "name", "top")
+
+    def __init__(self, proto, name, top):
+        self.proto = proto
+        self.name = name
+        self.top = top
+
+
+class Template:
+    """Records a widget tree once and instantiates it cheaply.
+
+    Create the tree with :meth:`widget`, which returns a prototype widget
+    of the given class; configuration calls chained on prototypes
+    (``pack``, ``grid``, ``configure``, ``bind``, ...) are recorded as
+    well.  Only record calls that change state: queries on a prototype
+    return empty results.  Supported are widget classes whose constructor
+    takes ``(master, cnf, **kw)`` and keeps no Python state of its own,
+    which includes all tkinter and ttk widgets.
+    """
+
+    def __init__(self, master=None):
+        if master is None:
+            master = tkinter._get_default_root("create template")
+        self._recorder = _Recorder(master.tk)
+        self._master = _PrototypeMaster(self._recorder)
+        self._nodes = []
+        self._params = {}
+        self._script = None
+        self._top_ids = itertools.count()
+
+    def widget(self, cls, parent=None, cnf={}, **kw):
+        """Add a widget of class CLS to the template and return its
+        prototype.
+
+        PARENT is the prototype of the parent widget, or None for a
+        top-level widget of the template, whose parent is the master passed
+        to :meth:`instantiate`.  Options may be :class:`Param` objects."""
+        if kw:
+            cnf = tkinter._cnfmerge((cnf, kw))
+        else:
+            cnf = dict(cnf)
+        for value in cnf.values():
+            self._add_params(value)
+        name = cnf.get("name")
+        top = parent is None
+        if top:
+            cnf["name"] = f"<fluent-top:{next(self._top_ids)}>"
+            parent = self._master
+        proto = cls(parent, cnf)
+        self._nodes.append(_Node(proto, name, top))
+        self._script = None
+        return proto
+
+    def _add_params(self, value):
+        if isinstance(value, Param):
+            self._params.setdefault(value.name, value)
+        elif isinstance(value, (tuple, list)):
+            for item in value:
+                self._add_params(item)
+
+    def _compile(self):
+        commands = self._recorder.commands
+        if commands:
+            names = {name: f"<fluent-cmd:{i}>"
+                     for i, name in enumerate(commands)}
+            names_re = re.compile("|".join(
+                rf"(?<![\w]){re.escape(name)}(?![\w])" for name in names))
+        lines = []
+        for call in self._recorder.calls:
+            words = []
+            for arg in call:
+                if isinstance(arg, Param):
+                    self._params.setdefault(arg.name, arg)
+                    word = str(arg)
+                elif isinstance(arg, (tuple, list)):
+                    self._add_params(arg)
+                    word = _script_word(tkinter._join(arg)).replace(
+                        "<fluent-param:", "<fluent-elem:")
+                else:
+                    word = _script_word(str(arg))
+                if commands:
+                    word = names_re.sub(lambda m: names[m[0]], word)
+                words.append(word)
+            lines.append(" ".join(words))
+        self._script = "\n".join(lines)
+        self._callbacks = list(commands.values())
+
+    def instantiate(self, master=None, **params):
+        """Create the widget tree in MASTER and return a
+        :class:`TemplateInstance`.
+
+        PARAMS supply the values of the template's :class:`Param`
+        placeholders; parameters without a default are required."""
+        if master is None:
+            master = tkinter._get_default_root("instantiate template")
+        if self._script is None:
+            self._compile()
+        unknown = params.keys() - self._params.keys()
+        if unknown:
+            raise TypeError(f"unknown template parameters: "
+                            f"{', '.join(sorted(unknown))}")
+
+        widgets = {self._master: master}
+        roots = []
+        named = {}
+        tops = []
+        for node in self._nodes:
+            proto = node.proto
+            parent = widgets[proto.master]
+            if node.top:
+                name = node.name or _child_name(master, type(proto))
+            else:
+                name = proto._name
+            widget = widgets[proto] = _materialize(
+                type(proto), proto.widgetName, parent, name,
+                proto._last_child_ids)
+            if node.top:
+                roots.append(widget)
+                tops.append(_script_word(widget._w))
+            if node.name is not None:
+                named[node.name] = widget
+
+        values = {}
+        for name, param in self._params.items():
+            value = params.get(name, param.default)
+            if value is _MISSING:
+                raise TypeError(f"missing template parameter {name!r}")
+            if callable(value):
+                value = roots[0]._register(value)
+            values[name] = value
+        callbacks = [
+            widgets.get(wrapper.widget, master)._register(
+                wrapper.func, _rebind(wrapper.subst, widgets))
+            for wrapper in self._callbacks]
+
+        def substitute(match):
+            top, kind, name, cmd = match.groups()
+            if top is not None:
+                return tops[int(top)]
+            if cmd is not None:
+                return callbacks[int(cmd)]
+            value = values[name]
+            if kind == "elem":
+                return _script_word(tkinter._stringify(value))
+            if isinstance(value, (tuple, list)):
+                return _script_word(tkinter._join(value))
+            return _script_word(str(value))
+
+        try:
+            master.tk.eval(_MARKER_RE.sub(substitute, self._script))
+        except tkinter.TclError:
+            for widget in roots:
+                widget.destroy()
+            raise
+        return TemplateInstance(tuple(roots), named)
+
+
+def _child_name(master, cls):
+    # The automatic naming of BaseWidget._setup.
+    name = cls.__name__.lower()
+    if name[-1].isdigit():
+        name += "!"
+    if master._last_child_ids is None:
+        master._last_child_ids = {}
+    count = master._last_child_ids.get(name, 0) + 1
+    master._last_child_ids[name] = count
+    return f"!{name}" if count == 1 else f"!{name}{count}"
+
+
+def _materialize(cls, widget_name, parent, name, last_child_ids=None):
+    """Return a Python object of class CLS for the Tcl widget NAME in
+    PARENT, without calling Tcl."""
+    widget = cls.__new__(cls)
+    widget.widgetName = widget_name
+    widget.master = parent
+    widget.tk = parent.tk
+    widget._name = name
+    widget._w = "." + name if parent._w == "." else f"{parent._w}.{name}"
+    widget.children = {}
+    if last_child_ids:
+        widget._last_child_ids = dict(last_child_ids)
+    if name in parent.children:
+        parent.children[name].destroy()
+    parent.children[name] = widget
+    return widget
+
+
+def _rebind(subst, widgets):
+    """Return SUBST bound to the instance widget of its prototype."""
+    owner = getattr(subst, "__self__", None)
+    if isinstance(owner, tkinter.Misc) and owner in widgets:
+        return getattr(widgets[owner], subst.__name__)
+    return subst
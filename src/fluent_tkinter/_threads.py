@@ -0,0 +1,264 @@
+"""Thread-safe marshaling of fluent call chains onto the Tk thread.
+
+Tcl interpreters may only be used from the thread that created them.  Worker
+threads therefore record their calls on a :class:`ThreadProxy`; each call is
+appended to a per-interpreter queue that is drained on the Tk thread in
+batches, bounded by a time budget so that a flood of updates cannot starve
+input handling.
+
+The Tk thread is woken by writing a byte to a pipe watched with
+``createfilehandler``, so an idle application does no polling at all.  On
+platforms without file handlers (Windows) a virtual event generated with
+``when='tail'`` is used instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+import tkinter
+
+from fluent_tkinter._patch import extension, override
+
+_WAKE_EVENT = "<<FluentThreadWake>>"
+
+
+class _Dispatcher:
+    """Queue of pending calls for one Tcl interpreter."""
+
+    def __init__(self, root):
+        self.root = root
+        # Seconds of work done per wake-up before yielding to the event loop.
+        self.budget = 0.008
+        self._queue = collections.deque()
+        self._armed = False
+        self._closed = False
+        self._rfd = self._wfd = None
+        if hasattr(root.tk, "createfilehandler"):
+            self._rfd, self._wfd = os.pipe()
+            os.set_blocking(self._rfd, False)
+            os.set_blocking(self._wfd, False)
+            try:
+                self._watch()
+            except RuntimeError:
+                # Created from a worker thread of a threaded Tcl; tkinter
+                # marshals this call onto the Tk thread if it is in its
+                # mainloop.  Wake-ups written before then stay buffered.
+                try:
+                    root.after_idle(self._watch)
+                except RuntimeError:
+                    self.close()
+                    raise RuntimeError(
+                        "from_thread() must first be called on the Tk "
+                        "thread unless it is running mainloop()") from None
+        else:
+            root.bind(_WAKE_EVENT, self._on_event, add="+")
+
+    def _watch(self):
+        self.root.tk.createfilehandler(self._rfd, tkinter.READABLE,
+                                       self._on_readable)
+
+    def submit(self, func, args, kwargs, future, upstream=None):
+        """Queue ``func(*args, **kwargs)``; safe to call from any thread.
+
+        If *upstream* is given it is the future of the previous call in a
+        chain and *func* is the name of the method to call on its result.
+        """
+        self._queue.append((func, args, kwargs, future, upstream))
+        if self._closed:
+            # The root is gone; close() may have drained the queue before
+            # this call was appended.
+            self._cancel_pending()
+            return
+        if not self._armed:
+            self._armed = True
+            self._wake()
+
+    def close(self):
+        """Stop watching the wake-up pipe, release it and cancel the calls
+        still queued."""
+        self._closed = True
+        self._cancel_pending()
+        if self._rfd is not None:
+            try:
+                self.root.tk.deletefilehandler(self._rfd)
+            except RuntimeError:
+                pass
+            os.close(self._rfd)
+            os.close(self._wfd)
+            self._rfd = self._wfd = None
+
+    def _cancel_pending(self):
+        queue = self._queue
+        while queue:
+            try:
+                item = queue.popleft()
+            except IndexError:
+                break
+            item[3].cancel()
+
+    def _wake(self):
+        if self._wfd is not None:
+            try:
+                os.write(self._wfd, b"\0")
+            except BlockingIOError:
+                pass    # pipe full: a wake-up is already pending
+        else:
+            self.root.event_generate(_WAKE_EVENT, when="tail")
+
+    def _on_readable(self, fd, mask):
+        try:
+            while os.read(fd, 512):
+                pass
+        except BlockingIOError:
+            pass
+        self.drain()
+
+    def _on_event(self, event):
+        self.drain()
+
+    def drain(self):
+        """Run queued calls on the Tk thread until the budget is exhausted."""
+        # Disarm before draining: a producer appending after this point
+        # either sees the flag cleared and wakes us again, or its item is
+        # picked up by the loop below.
+        self._armed = False
+        queue = self._queue
+        deadline = time.perf_counter() + self.budget
+        while queue:
+            self._run(*queue.popleft())
+            if queue and time.perf_counter() >= deadline:
+                # Yield to the event loop; the pending wake-up brings us
+                # back once input and redraws have been handled.
+                self._armed = True
+                self._wake()
+                break
+
+    def _run(self, func, args, kwargs, future, upstream):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            if upstream is not None:
+                # An earlier failure in the chain was already reported;
+                # result() re-raises it for the rest of the chain.
+                try:
+                    target = upstream.result(0)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                    return
+                func = getattr(target, func)
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            if isinstance(exc, SystemExit):
+                raise
+            self.root._report_exception()
+        else:
+            future.set_result(result)
+
+
+_dispatcher_lock = threading.Lock()
+
+
+def _dispatcher(widget):
+    """Return the dispatcher of *widget*'s interpreter, creating it."""
+    root = widget._root()
+    try:
+        return root._fluent_dispatcher
+    except AttributeError:
+        pass
+    with _dispatcher_lock:
+        try:
+            return root._fluent_dispatcher
+        except AttributeError:
+            dispatcher = root._fluent_dispatcher = _Dispatcher(root)
+            return dispatcher
+
+
+@override(tkinter.Tk, "destroy")
+def _destroy(destroy):
+    @functools.wraps(destroy)
+    def wrapper(self):
+        result = destroy(self)
+        # The closed dispatcher stays, so later calls are cancelled.
+        dispatcher = self.__dict__.get("_fluent_dispatcher")
+        if dispatcher is not None:
+            dispatcher.close()
+        return result
+    return wrapper
+
+
+class ThreadProxy:
+    """Records a fluent call chain and replays it on the Tk thread.
+
+    Every call returns a new proxy for the value the call will produce, so
+    the chain reads exactly as it would on the Tk thread::
+
+        label.from_thread().configure(text=status).pack(fill="x")
+
+    :meth:`result` blocks until the last recorded call has run.  Do not call
+    it from the Tk thread itself, as the queue cannot drain while it waits.
+    Coroutines, on any thread, can ``await`` the proxy instead.
+    """
+
+    __slots__ = ("_dispatcher", "_future", "_name")
+
+    def __init__(self, dispatcher, future, name=None):
+        self._dispatcher = dispatcher
+        self._future = future
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return ThreadProxy(self._dispatcher, self._future, name)
+
+    def __call__(self, *args, **kwargs):
+        name = self._name
+        if name is None:
+            raise TypeError("ThreadProxy is not callable; call a method of it")
+        future = Future()
+        self._dispatcher.submit(name, args, kwargs, future, self._future)
+        return ThreadProxy(self._dispatcher, future)
+
+    def result(self, timeout=None):
+        """Wait for the recorded chain to run and return its last value."""
+        return self._future.result(timeout)
+
+    def future(self):
+        """Return the :class:`concurrent.futures.Future` of the last call."""
+        return self._future
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
+
+    def __repr__(self):
+        return f"<ThreadProxy {self._name or ''}>"
+
+
+@extension(tkinter.Misc)
+def from_thread(self):
+    """Return a :class:`ThreadProxy` that replays calls on the Tk thread.
+
+    Safe to use from any thread.  The calls are queued in order and run in
+    batches from the Tk event loop."""
+    future = Future()
+    future.set_result(self)
+    return ThreadProxy(_dispatcher(self), future)
+
+
+@extension(tkinter.Misc)
+def call_from_thread(self, func, /, *args, **kwargs):
+    """Run ``func(*args, **kwargs)`` on the Tk thread.
+
+    Safe to call from any thread; returns a
+    :class:`concurrent.futures.Future` for the result."""
+    future = Future()
+    _dispatcher(self).submit(func, args, kwargs, future)
+    return future
@@ -0,0 +1,190 @@
+"""Operations on whole widget subtrees.
+
+:meth:`Misc.walk`, :meth:`Misc.descendants` and :meth:`Misc.find_widget`
+traverse the ``children`` dicts tkinter keeps for every widget, so they
+need no Tcl call and no ``nametowidget`` lookup per child, unlike a
+recursion over ``winfo_children()``.  They only see widgets created
+through tkinter.
+
+:meth:`Misc.geometry_snapshot` returns the screen geometry of every widget
+of a subtree from a single Tcl call, where asking each widget for its
+``winfo_rootx``, ``winfo_rooty``, ``winfo_width``, ``winfo_height`` and
+``winfo_ismapped`` would make five calls per widget.
+
+:meth:`Misc.destroy_fast` tears a subtree down with one Tcl call instead
+of a ``destroy`` and a ``deletecommand`` per widget and command.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import tkinter
+
+from fluent_tkinter._callbacks import _is_handle, release
+from fluent_tkinter._patch import extension
+
+# For each path of WIDGETS: 1 and its geometry if it exists, else 0.
+_GEOMETRY_PROC = """
+proc ::_fluent_geometry {widgets} {
+    set result {}
+    foreach w $widgets {
+        if {[winfo exists $w]} {
+            lappend result 1 [winfo rootx $w] [winfo rooty $w] \\
+                [winfo width $w] [winfo height $w] [winfo ismapped $w]
+        } else {
+            lappend result 0
+        }
+    }
+    return $result
+}
+"""
+
+# Destroy window W, then delete the callback commands CMDS.
+_DESTROY_PROC = """
+proc ::_fluent_destroy {w cmds} {
+    destroy $w
+    foreach cmd $cmds {
+        catch {rename $cmd {}}
+    }
+}
+"""
+
+
+class WidgetGeometry(NamedTuple):
+    """Position on the screen, size and mapped state of a widget."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    mapped: bool
+
+
+@extension(tkinter.Misc)
+def walk(self):
+    """Yield this widget and then all its descendants, depth first in
+    creation order.
+
+    Widgets may be destroyed during the walk; the descendants of a widget
+    destroyed when it is yielded are skipped."""
+    yield self
+    # Snapshots of the children of each level, so destroying widgets does
+    # not disturb the iteration.
+    stack = [iter(tuple(self.children.values()))]
+    while stack:
+        for child in stack[-1]:
+            yield child
+            if child.children:
+                stack.append(iter(tuple(child.children.values())))
+            break
+        else:
+            stack.pop()
+
+
+@extension(tkinter.Misc)
+def descendants(self, filter=None):
+    """Yield the descendants of this widget, depth first.
+
+    FILTER may be a widget class or tuple of classes, to yield only
+    instances of them, or a predicate called with each widget."""
+    widgets = self.walk()
+    next(widgets)
+    if filter is None:
+        yield from widgets
+    elif isinstance(filter, (type, tuple)):
+        for widget in widgets:
+            if isinstance(widget, filter):
+                yield widget
+    else:
+        for widget in widgets:
+            if filter(widget):
+                yield widget
+
+
+@extension(tkinter.Misc)
+def find_widget(self, name):
+    """Return the first descendant named NAME (the last component of its
+    path name, as given with ``name=``), or None.  Unlike
+    ``nametowidget`` it searches the whole subtree."""
+    for widget in self.descendants():
+        if widget._name == name:
+            return widget
+    return None
+
+
+def _ensure_proc(widget, flag, script):
+    root = widget._root()
+    if not getattr(root, flag, False):
+        widget.tk.eval(script)
+        setattr(root, flag, True)
+
+
+@extension(tkinter.Misc)
+def geometry_snapshot(self, recursive=True):
+    """Return a dict mapping this widget and its descendants (only its
+    children if RECURSIVE is false) to their :class:`WidgetGeometry`.
+
+    Coordinates are relative to the root window of the screen, as given
+    by ``winfo_rootx`` and ``winfo_rooty``.  Everything is fetched in one
+    Tcl call; widgets whose window no longer exists are left out."""
+    _ensure_proc(self, "_fluent_geometry_proc", _GEOMETRY_PROC)
+    if recursive:
+        widgets = list(self.walk())
+    else:
+        widgets = [self, *self.children.values()]
+    values = self.tk.splitlist(self.tk.call(
+        "::_fluent_geometry", tuple(w._w for w in widgets)))
+    snapshot = {}
+    i = 0
+    for widget in widgets:
+        if int(values[i]):
+            x, y, width, height, mapped = map(int, values[i + 1:i + 6])
+            snapshot[widget] = WidgetGeometry(x, y, width, height,
+                                              bool(mapped))
+            i += 6
+        else:
+            i += 1
+    return snapshot
+
+
+def _plain_destroy(widget):
+    """Return whether WIDGET's class keeps the destroy of BaseWidget."""
+    return type(widget).destroy is tkinter.BaseWidget.destroy
+
+
+@extension(tkinter.Misc)
+def destroy_fast(self):
+    """Destroy this widget and all its descendants, like ``destroy``.
+
+    The windows and the callback commands of the whole subtree are deleted
+    by one Tcl call, and the Python widgets are then detached in a single
+    pass.  Widgets whose class defines its own ``destroy``, and their
+    descendants, are destroyed with it first.  Returns the widget."""
+    if not isinstance(self, tkinter.BaseWidget) or not _plain_destroy(self):
+        self.destroy()
+        return self
+    for widget in self.descendants():
+        if not _plain_destroy(widget):
+            widget.destroy()
+    widgets = list(self.walk())
+    commands = []
+    handles = []
+    for widget in widgets:
+        names = widget._tclCommands
+        if names:
+            for name in names:
+                (handles if _is_handle(name) else commands).append(name)
+            widget._tclCommands = None
+    _ensure_proc(self, "_fluent_destroy_proc", _DESTROY_PROC)
+    # <Destroy> bindings run during the Tcl destroy and may still need
+    # the callbacks.
+    self.tk.call("::_fluent_destroy", self._w, tuple(commands))
+    for handle in handles:
+        release(self, handle)
+    master_children = self.master.children
+    if master_children.get(self._name) is self:
+        del master_children[self._name]
+    for widget in widgets:
+        widget.children.clear()
+    return self
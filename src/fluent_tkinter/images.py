@@ -0,0 +1,419 @@
+"""Cache of decoded images shared across widgets.
+
+Constructing ``tkinter.PhotoImage(file=...)`` decodes the file every time,
+so an icon shown in twenty windows is decoded twenty times and held in
+memory twenty times.  :func:`load` returns one shared image per file and
+transform instead::
+
+    from fluent_tkinter import images
+
+    icon = images.load("icons/save.png", subsample=2)
+    button.configure(image=icon)
+
+Entries are keyed by the file's path, modification time and size, and the
+requested ``subsample``/``zoom``, so an edited file is decoded afresh.  The
+cache evicts least recently used images once their decoded size exceeds a
+byte budget, but never an image that is still in use: either displayed by a
+widget (``image inuse``) or referenced from Python.  Evicted images are
+deleted from Tcl as soon as the last Python reference goes away.
+
+For many images, such as a grid of thumbnails, :class:`ThumbnailLoader`
+moves file I/O and preprocessing to worker threads and applies the results
+in batches on the Tk thread::
+
+    with images.ThumbnailLoader(root) as loader:
+        for label, path in zip(labels, paths):
+            loader.load(path, label, subsample=4)
+"""
+
+from __future__ import annotations
+
+import collections
+import mmap
+import os
+import re
+import tkinter
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
+
+from fluent_tkinter._threads import _dispatcher
+
+__all__ = [
+    "ImageCache", "CacheStats", "ThumbnailLoader", "load", "cache", "clear",
+]
+
+# Default budget for decoded pixels, in bytes.
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+# Binary PGM/PPM header: magic, width, height and maxval separated by
+# whitespace or comments, then a single whitespace byte.
+_PNM_HEADER_RE = re.compile(
+    rb"(P[56])(?:\s|#[^\n]*\n)+(\d+)(?:\s|#[^\n]*\n)+(\d+)"
+    rb"(?:\s|#[^\n]*\n)+(\d+)\s")
+
+
+class CacheStats(NamedTuple):
+    """Counters of an :class:`ImageCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    count: int
+    nbytes: int
+
+
+def _pair(value):
+    if value is None:
+        return None
+    if isinstance(value, int):
+        value = (value, value)
+    x, y = value
+    if (x, y) == (1, 1):
+        return None
+    return (int(x), int(y))
+
+
+def _normalize(path, subsample, zoom):
+    return os.path.abspath(os.fspath(path)), (_pair(subsample), _pair(zoom))
+
+
+def _key(path, transform, st):
+    return (path, st.st_mtime_ns, st.st_size, transform)
+
+
+def _scale(image, subsample, zoom):
+    """Return IMAGE subsampled and zoomed with a single ``copy``."""
+    if subsample is None and zoom is None:
+        return image
+    scaled = tkinter.PhotoImage(master=image.tk)
+    args = []
+    if subsample is not None:
+        args += ["-subsample", *subsample]
+    if zoom is not None:
+        args += ["-zoom", *zoom]
+    image.tk.call(scaled.name, "copy", image.name, *args)
+    return scaled
+
+
+class _SharedImage(tkinter.PhotoImage):
+    """View of the cached image OWNER, as handed out by the cache.
+
+    While any view of an image is alive the cache counts it as referenced
+    from Python.  A view keeps the owner, and with it the Tcl image, alive;
+    the owner deletes the Tcl image once it is neither cached nor viewed."""
+
+    def __init__(self, owner):
+        self.name = owner.name
+        self.tk = owner.tk
+        self._owner = owner
+
+    def __del__(self):
+        pass
+
+
+class _Entry:
+
+    __slots__ = ("image", "nbytes", "path", "transform")
+
+    def __init__(self, image, path, transform):
+        # The PhotoImage owning the Tcl image.
+        self.image = image
+        self.nbytes = image.width() * image.height() * 4
+        self.path = path
+        self.transform = transform
+
+
+class ImageCache:
+    """LRU cache of decoded :class:`tkinter.PhotoImage` objects for the
+    Tcl interpreter of *master*."""
+
+    def __init__(self, master=None, budget=DEFAULT_BUDGET):
+        if master is None:
+            master = tkinter._get_default_root("create image cache")
+        self.master = master
+        self.tk = master.tk
+        self._budget = budget
+        self._entries = collections.OrderedDict()
+        # (path, transform) -> key of the newest entry for that file.
+        self._current = {}
+        # Tcl image name -> the live view handed out for it.
+        self._views = weakref.WeakValueDictionary()
+        self._nbytes = 0
+        self._hits = self._misses = self._evictions = 0
+
+    @property
+    def budget(self):
+        """Byte budget for decoded images not in use."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, value):
+        self._budget = value
+        self._evict()
+
+    def load(self, path, subsample=None, zoom=None):
+        """Return the shared :class:`tkinter.PhotoImage` for PATH.
+
+        SUBSAMPLE and ZOOM take an int or an (x, y) pair, as
+        ``PhotoImage.subsample``/``zoom``; both may be given.  Raises
+        :class:`OSError` for a missing file and :class:`tkinter.TclError`
+        for a format Tk cannot read."""
+        path, transform = _normalize(path, subsample, zoom)
+        key = _key(path, transform, os.stat(path))
+        image = self._lookup(key)
+        if image is None:
+            image = self._insert(
+                key, _scale(self._decode(path), *transform))
+        return image
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return self._view(entry.image)
+
+    def _view(self, image):
+        view = self._views.get(image.name)
+        if view is None:
+            view = self._views[image.name] = _SharedImage(image)
+        return view
+
+    def _known_key(self, path, transform):
+        """Return the key of the newest entry for PATH and TRANSFORM."""
+        return self._current.get((path, transform))
+
+    def _insert(self, key, image):
+        path, transform = key[0], key[3]
+        entry = self._entries[key] = _Entry(image, path, transform)
+        self._nbytes += entry.nbytes
+        stale = self._current.get((path, transform))
+        self._current[(path, transform)] = key
+        if stale is not None and stale in self._entries:
+            # The file changed: drop the outdated image once unused.
+            self._entries.move_to_end(stale, last=False)
+            self._discard(stale)
+        view = self._view(image)
+        self._evict()
+        return view
+
+    def _decode(self, path):
+        return tkinter.PhotoImage(master=self.master, file=path)
+
+    def in_use(self, image):
+        """Return whether IMAGE is displayed by a widget or referenced from
+        Python outside the cache."""
+        return (image.name in self._views
+                or self.tk.getboolean(
+                    self.tk.call("image", "inuse", image.name)))
+
+    def _discard(self, key):
+        """Drop the entry for KEY unless its image is in use."""
+        entry = self._entries[key]
+        if self.in_use(entry.image):
+            return False
+        del self._entries[key]
+        self._nbytes -= entry.nbytes
+        self._evictions += 1
+        if self._current.get((entry.path, entry.transform)) == key:
+            del self._current[(entry.path, entry.transform)]
+        return True
+
+    def _evict(self):
+        if self._nbytes <= self._budget:
+            return
+        for key in list(self._entries):
+            if self._discard(key) and self._nbytes <= self._budget:
+                break
+
+    def clear(self):
+        """Drop every image that is not in use."""
+        for key in list(self._entries):
+            self._discard(key)
+
+    def stats(self):
+        """Return a :class:`CacheStats` snapshot."""
+        return CacheStats(self._hits, self._misses, self._evictions,
+                          len(self._entries), self._nbytes)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def cache(master=None):
+    """Return the :class:`ImageCache` of the application of MASTER."""
+    if master is None:
+        master = tkinter._get_default_root("use image cache")
+    root = master._root()
+    try:
+        return root._fluent_image_cache
+    except AttributeError:
+        result = root._fluent_image_cache = ImageCache(root)
+        return result
+
+
+def load(path, subsample=None, zoom=None, master=None):
+    """Return the shared image for PATH from the cache of MASTER's
+    application.  See :meth:`ImageCache.load`."""
+    return cache(master).load(path, subsample, zoom)
+
+
+def clear(master=None):
+    """Drop all unused images from the cache of MASTER's application."""
+    cache(master).clear()
+
+
+# -- background loading ------------------------------------------------------
+
+def _read(path, use_mmap):
+    with open(path, "rb") as f:
+        if use_mmap:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                pass    # empty file, or not mappable
+        return f.read()
+
+
+def _decode_pnm(data, subsample):
+    """Decode a binary PGM/PPM with 8-bit samples and apply SUBSAMPLE.
+
+    Return ``(pixels, width, height, mode)``, or None for any other
+    format."""
+    match = _PNM_HEADER_RE.match(data)
+    if match is None or int(match[4]) != 255:
+        return None
+    channels, mode = (1, "L") if match[1] == b"P5" else (3, "RGB")
+    width, height = int(match[2]), int(match[3])
+    stride = width * channels
+    start = match.end()
+    view = memoryview(data)[start:start + stride * height]
+    if len(view) != stride * height:
+        return None
+    if subsample is None:
+        return bytes(view), width, height, mode
+    sx, sy = subsample
+    if sx < 1 or sy < 1:
+        return None     # mirroring: leave it to Tk
+    w, h = -(-width // sx), -(-height // sy)
+    pixels = bytearray(w * h * channels)
+    row_bytes = w * channels
+    pos = 0
+    for y in range(0, height, sy):
+        row = view[y * stride:(y + 1) * stride]
+        for c in range(channels):
+            pixels[pos + c:pos + row_bytes:channels] = row[c::channels * sx]
+        pos += row_bytes
+    return pixels, w, h, mode
+
+
+class ThumbnailLoader:
+    """Loads images for widgets without blocking the Tk thread.
+
+    Worker threads stat and read the files and, for 8-bit PGM/PPM files,
+    decode and subsample the pixels.  Only creating the image from the
+    prepared bytes runs on the Tk thread, batched with the other work queued
+    by :meth:`~tkinter.Misc.call_from_thread` within its time budget.
+    Images go through the :class:`ImageCache` of the application, so
+    files already decoded are not read again.
+
+    Tk can only decode PNG, GIF and other formats on the Tk thread; for
+    those the workers save the file I/O and the decoding itself happens in
+    the batched handoff.  With USE_MMAP the workers map files instead of
+    reading them, which lets PGM/PPM subsampling touch only the rows it
+    keeps.
+    """
+
+    def __init__(self, master=None, workers=4, use_mmap=False):
+        if master is None:
+            master = tkinter._get_default_root("create thumbnail loader")
+        self.master = master
+        self.use_mmap = use_mmap
+        self._cache = cache(master)
+        # Created here, on the Tk thread, so workers can always reach it.
+        self._dispatcher = _dispatcher(master)
+        self._pool = ThreadPoolExecutor(workers,
+                                        thread_name_prefix="ThumbnailLoader")
+
+    def load(self, path, widget=None, subsample=None, zoom=None, **options):
+        """Load PATH in the background and return a
+        :class:`concurrent.futures.Future` for the image.
+
+        If WIDGET is given, ``widget.configure(image=image, **options)`` is
+        called once the image is ready.  SUBSAMPLE and ZOOM are as for
+        :meth:`ImageCache.load`.  The future completes on the Tk thread;
+        a failure is also reported like an exception in a Tk callback.
+        Cancelling the future before it completes skips the file."""
+        path, transform = _normalize(path, subsample, zoom)
+        future = Future()
+        self._pool.submit(self._prepare, path, transform,
+                          self._cache._known_key(path, transform),
+                          widget, options, future)
+        return future
+
+    def _prepare(self, path, transform, known, widget, options, future):
+        # Runs on a worker thread.
+        if future.cancelled():
+            return
+        try:
+            key = _key(path, transform, os.stat(path))
+            if key == known:
+                payload = None
+            else:
+                data = _read(path, self.use_mmap)
+                payload = _decode_pnm(data, transform[0])
+                if payload is None:
+                    payload = bytes(data)
+                if isinstance(data, mmap.mmap):
+                    data.close()
+        except BaseException as exc:
+            self._dispatcher.submit(_raise, (exc,), {}, future)
+        else:
+            self._dispatcher.submit(self._apply,
+                                    (key, payload, widget, options), {},
+                                    future)
+
+    def _apply(self, key, payload, widget, options):
+        # Runs on the Tk thread.
+        image = self._cache._lookup(key)
+        if image is None:
+            image = self._cache._insert(key, self._create(key, payload))
+        if widget is not None:
+            widget.configure(image=image, **options)
+        return image
+
+    def _create(self, key, payload):
+        path, (subsample, zoom) = key[0], key[3]
+        if isinstance(payload, tuple):
+            pixels, width, height, mode = payload
+            image = tkinter.PhotoImage(master=self.master,
+                                       width=width, height=height)
+            image.put_buffer(pixels, width, height, mode)
+            return _scale(image, None, zoom)
+        image = None
+        if payload is not None:
+            try:
+                image = tkinter.PhotoImage(master=self.master, data=payload)
+            except tkinter.TclError:
+                pass    # not readable from data; let Tk read the file
+        if image is None:
+            image = self._cache._decode(path)
+        return _scale(image, subsample, zoom)
+
+    def shutdown(self, wait=True):
+        """Stop the worker threads.  With WAIT, wait until pending files
+        have been read; their images are still applied by the Tk thread."""
+        self._pool.shutdown(wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown(wait=False)
+
+
+def _raise(exc):
+    raise exc
@@ -0,0 +1,184 @@
+"""Tests for the Tk-driven asyncio event loop."""
+
+import asyncio
+import threading
+import time
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class TkEventLoopTest(AbstractTkTest, unittest.TestCase):
+
+    def run_coro(self, coro):
+        return fluent_tkinter.run(coro, self.root)
+
+    def test_run_returns_result(self):
+        async def main():
+            return 42
+        self.assertEqual(self.run_coro(main()), 42)
+
+    def test_running_loop_is_tk_event_loop(self):
+        async def main():
+            return asyncio.get_running_loop()
+        loop = self.run_coro(main())
+        self.assertIsInstance(loop, fluent_tkinter.TkEventLoop)
+        self.assertIs(loop.root, self.root)
+
+    def test_sleep(self):
+        async def main():
+            start = time.monotonic()
+            await asyncio.sleep(0.05)
+            return time.monotonic() - start
+        self.assertGreaterEqual(self.run_coro(main()), 0.045)
+
+    def test_tk_callbacks_run_while_awaiting(self):
+        fired = []
+
+        async def main():
+            self.root.after(10, fired.append, 'after')
+            await asyncio.sleep(0.1)
+        self.run_coro(main())
+        self.assertEqual(fired, ['after'])
+
+    def test_tk_callback_wakes_loop(self):
+        # A future resolved from a Tk callback must resume the awaiting
+        # coroutine without any other asyncio activity.
+        async def main():
+            future = asyncio.get_running_loop().create_future()
+            self.root.after(10, future.set_result, 'done')
+            return await asyncio.wait_for(future, 2)
+        self.assertEqual(self.run_coro(main()), 'done')
+
+    def test_virtual_event_handler_runs(self):
+        async def main():
+            future = asyncio.get_running_loop().create_future()
+            frame = tkinter.Frame(self.root).pack()
+            frame.bind('<<Ping>>', lambda e: future.set_result(e.widget))
+            self.root.update_idletasks()
+            frame.event_generate('<<Ping>>', when='tail')
+            return frame, await asyncio.wait_for(future, 2)
+        frame, widget = self.run_coro(main())
+        self.assertIs(widget, frame)
+
+    def test_call_soon_threadsafe_wakes_loop(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            threading.Thread(
+                target=loop.call_soon_threadsafe,
+                args=(future.set_result, 'thread')).start()
+            return await asyncio.wait_for(future, 2)
+        self.assertEqual(self.run_coro(main()), 'thread')
+
+    def test_sockets(self):
+        async def main():
+            async def echo(reader, writer):
+                writer.write(await reader.readline())
+                await writer.drain()
+                writer.close()
+            server = await asyncio.start_server(echo, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'ping\n')
+            data = await reader.readline()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return data
+        self.assertEqual(self.run_coro(main()), b'ping\n')
+
+
+class AwaitableTest(AbstractTkTest, unittest.TestCase):
+
+    def run_coro(self, coro):
+        return fluent_tkinter.run(coro, self.root)
+
+    def test_after_async(self):
+        async def main():
+            start = time.monotonic()
+            result = await self.root.after_async(30)
+            return result, time.monotonic() - start
+        result, elapsed = self.run_coro(main())
+        self.assertIsNone(result)
+        self.assertGreaterEqual(elapsed, 0.025)
+
+    def test_after_async_cancel(self):
+        async def main():
+            future = self.root.after_async(10)
+            future.cancel()
+            await asyncio.sleep(0.05)
+            return future
+        self.assertTrue(self.run_coro(main()).cancelled())
+
+    def test_wait_event(self):
+        frame = tkinter.Frame(self.root).pack()
+
+        async def main():
+            future = frame.wait_event('<<Ping>>')
+            frame.event_generate('<<Ping>>', when='tail')
+            return await asyncio.wait_for(future, 2)
+        event = self.run_coro(main())
+        self.assertIsInstance(event, tkinter.Event)
+        self.assertIs(event.widget, frame)
+        # The shared binding is removed once nobody waits.
+        self.assertEqual(frame.bind('<<Ping>>'), '')
+
+    def test_wait_event_shares_one_binding(self):
+        frame = tkinter.Frame(self.root).pack()
+
+        async def main():
+            futures = [frame.wait_event('<<Ping>>') for _ in range(100)]
+            commands = len(frame._tclCommands)
+            frame.event_generate('<<Ping>>', when='tail')
+            events = await asyncio.wait_for(asyncio.gather(*futures), 2)
+            return commands, events
+        commands, events = self.run_coro(main())
+        self.assertEqual(commands, 1)
+        self.assertEqual(len(events), 100)
+        self.assertEqual(frame._tclCommands, [])
+
+    def test_wait_event_keeps_other_bindings(self):
+        frame = tkinter.Frame(self.root).pack()
+        seen = []
+        frame.bind('<<Ping>>', seen.append)
+
+        async def main():
+            future = frame.wait_event('<<Ping>>')
+            frame.event_generate('<<Ping>>', when='tail')
+            await asyncio.wait_for(future, 2)
+        self.run_coro(main())
+        self.assertEqual(len(seen), 1)
+        self.assertNotEqual(frame.bind('<<Ping>>'), '')
+
+    def test_wait_event_cancel_removes_binding(self):
+        frame = tkinter.Frame(self.root).pack()
+
+        async def main():
+            with self.assertRaises(TimeoutError):
+                await asyncio.wait_for(frame.wait_event('<<Never>>'), 0.01)
+        self.run_coro(main())
+        self.assertEqual(frame.bind('<<Never>>'), '')
+
+    def test_await_thread_proxy(self):
+        frame = tkinter.Frame(self.root)
+
+        def worker():
+            async def update():
+                return await frame.from_thread().configure(width=33)
+            return asyncio.run(update())
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, worker)
+        self.assertIs(self.run_coro(main()), frame)
+        self.assertEqual(frame['width'], 33)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for ``Misc.animation_loop``."""
+
+import time
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from fluent_tkinter import AnimationLoop
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class AnimationLoopTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.frame = tkinter.Frame(self.root)
+        self.deltas = []
+
+    def tearDown(self):
+        self.frame.destroy()
+        super().tearDown()
+
+    def pump(self, seconds):
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            self.root.update()
+            time.sleep(0.001)
+
+    def test_frame_rate(self):
+        loop = self.frame.animation_loop(self.deltas.append, fps=50)
+        self.assertIsInstance(loop, AnimationLoop)
+        self.assertTrue(loop.running)
+        self.pump(0.5)
+        loop.stop()
+        self.assertFalse(loop.running)
+        frames = loop.frames
+        self.assertGreaterEqual(frames + loop.dropped, 20)
+        self.assertLessEqual(frames + loop.dropped, 27)
+        self.assertEqual(len(self.deltas), frames)
+        self.pump(0.1)
+        self.assertEqual(loop.frames, frames)
+
+    def test_overrun_drops_frames(self):
+        def slow(dt):
+            self.deltas.append(dt)
+            if len(self.deltas) == 2:
+                time.sleep(0.1)
+        loop = self.frame.animation_loop(slow, fps=100)
+        self.pump(0.3)
+        loop.stop()
+        self.assertGreaterEqual(loop.dropped, 5)
+        self.assertGreaterEqual(max(self.deltas), 0.09)
+
+    def test_work_budget(self):
+        done = []
+        loop = self.frame.animation_loop(lambda dt: None, fps=100,
+                                         budget=0.5)
+        for i in range(30):
+            self.assertIs(loop.add_work(lambda i=i: (done.append(i),
+                                                     time.sleep(0.002))),
+                          loop)
+        self.assertEqual(loop.pending_work, 30)
+        self.root.update()
+        # A 5 ms budget fits about three 2 ms items per frame.
+        self.assertLess(len(done), 10)
+        self.pump(0.5)
+        loop.stop()
+        self.assertEqual(done, list(range(30)))
+        self.assertEqual(loop.pending_work, 0)
+
+    def test_destroy_stops_loop(self):
+        frame = tkinter.Frame(self.frame)
+        loop = frame.animation_loop(self.deltas.append, fps=100)
+        self.pump(0.05)
+        frame.destroy()
+        count = len(self.deltas)
+        self.pump(0.05)
+        self.assertEqual(len(self.deltas), count)
+        self.assertFalse(loop.running)
+        loop.stop()
+
+    def test_stop_deletes_command(self):
+        before = len(self.frame._tclCommands or ())
+        loop = self.frame.animation_loop(self.deltas.append)
+        self.assertEqual(len(self.frame._tclCommands), before + 1)
+        loop.stop().stop()
+        self.assertEqual(len(self.frame._tclCommands), before)
+
+    def test_invalid_fps(self):
+        with self.assertRaises(ValueError):
+            self.frame.animation_loop(print, fps=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
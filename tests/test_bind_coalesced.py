@@ -0,0 +1,99 @@
+"""Tests for ``Misc.bind_coalesced``."""
+
+import time
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class BindCoalescedTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.frame = tkinter.Frame(self.root, width=100, height=100)
+        self.frame.pack()
+        self.root.update()
+        self.events = []
+
+    def tearDown(self):
+        self.frame.destroy()
+        super().tearDown()
+
+    def motion(self, *positions):
+        for x, y in positions:
+            self.frame.event_generate('<Motion>', x=x, y=y)
+
+    def test_latest_event_per_idle_cycle(self):
+        result = self.frame.bind_coalesced('<Motion>', self.events.append)
+        self.assertIs(result, self.frame)
+        self.motion((1, 1), (2, 2), (3, 4))
+        self.assertEqual(self.events, [])
+        self.root.update_idletasks()
+        self.assertEqual(len(self.events), 1)
+        self.assertIsInstance(self.events[0], tkinter.Event)
+        self.assertEqual((self.events[0].x, self.events[0].y), (3, 4))
+        self.assertIs(self.events[0].widget, self.frame)
+        self.motion((5, 6))
+        self.root.update_idletasks()
+        self.assertEqual([(e.x, e.y) for e in self.events],
+                         [(3, 4), (5, 6)])
+
+    def test_fields(self):
+        self.frame.bind_coalesced('<Motion>', self.events.append,
+                                  fields=('x', 'y'))
+        self.motion((1, 2), (3, 4))
+        self.root.update_idletasks()
+        self.assertEqual(self.events, [(3, 4)])
+
+    def test_max_rate(self):
+        self.frame.bind_coalesced('<Motion>', self.events.append,
+                                  max_rate_hz=50, fields=('x',))
+        self.motion((1, 0), (2, 0))
+        self.root.update_idletasks()
+        self.assertEqual(self.events, [])
+        deadline = time.monotonic() + 1
+        while not self.events and time.monotonic() < deadline:
+            self.root.update()
+        self.assertEqual(self.events, [(2,)])
+
+    def test_wheel_deltas_accumulate(self):
+        self.frame.bind_coalesced('<MouseWheel>', self.events.append,
+                                  fields=('delta',))
+        for delta in (120, 120, -120, 240):
+            self.frame.event_generate('<MouseWheel>', delta=delta)
+        self.root.update_idletasks()
+        self.assertEqual(self.events, [(360,)])
+
+    def test_unbind_drops_pending_event(self):
+        self.frame.bind_coalesced('<Motion>', self.events.append)
+        self.motion((1, 1))
+        self.frame.unbind('<Motion>')
+        self.root.update_idletasks()
+        self.assertEqual(self.events, [])
+
+    def test_destroy_drops_pending_event(self):
+        frame = tkinter.Frame(self.frame, width=10, height=10)
+        frame.pack()
+        self.root.update()
+        frame.bind_coalesced('<Motion>', self.events.append)
+        frame.event_generate('<Motion>', x=1, y=1)
+        frame.destroy()
+        self.root.update_idletasks()
+        self.assertEqual(self.events, [])
+
+    def test_rebind_deletes_commands(self):
+        before = self.frame.command_report().total
+        for i in range(5):
+            self.frame.bind_coalesced('<Motion>', self.events.append)
+        self.assertEqual(self.frame.command_report().total, before + 1)
+        self.frame.unbind('<Motion>')
+        self.assertEqual(self.frame.command_report().total, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
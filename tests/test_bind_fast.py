@@ -0,0 +1,74 @@
+"""Tests for ``Misc.bind_fast``."""
+
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class BindFastTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.frame = tkinter.Frame(self.root, width=100, height=100)
+        self.frame.pack()
+        self.root.update()
+        self.events = []
+
+    def tearDown(self):
+        self.frame.destroy()
+        super().tearDown()
+
+    def test_default_fields(self):
+        result = self.frame.bind_fast('<Motion>', self.events.append)
+        self.assertIs(result, self.frame)
+        self.frame.event_generate('<Motion>', x=12, y=34)
+        self.assertEqual(len(self.events), 1)
+        event = self.events[0]
+        self.assertEqual((event.x, event.y), (12, 34))
+        self.assertEqual(event, (12, 34))
+        self.assertFalse(hasattr(event, 'widget'))
+
+    def test_fields(self):
+        self.frame.bind_fast('<<Test>>', self.events.append,
+                             fields=('widget', 'type', 'x', 'delta',
+                                     'keysym'))
+        self.frame.event_generate('<<Test>>', x=5)
+        event = self.events[0]
+        self.assertIs(event.widget, self.frame)
+        self.assertEqual(event.type, tkinter.EventType.VirtualEvent)
+        self.assertEqual(event.x, 5)
+        self.assertEqual(event.delta, 0)
+        self.assertEqual(event.keysym, '??')
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self.frame.bind_fast('<Motion>', print, fields=('pos',))
+
+    def test_break_and_add(self):
+        self.frame.bind_fast('<<Test>>', lambda e: self.events.append(1))
+        self.frame.bind_fast('<<Test>>', lambda e: self.events.append(2),
+                             add='+')
+        self.frame.event_generate('<<Test>>')
+        self.assertEqual(self.events, [1, 2])
+        self.frame.bind_fast('<<Test>>', lambda e: 'break')
+        self.frame.bind('<<Test>>', lambda e: self.events.append(3), '+')
+        self.frame.event_generate('<<Test>>')
+        self.assertEqual(self.events, [1, 2])
+
+    def test_rebind_and_unbind_delete_commands(self):
+        report = self.frame.command_report
+        before = report().total
+        for i in range(5):
+            self.frame.bind_fast('<Motion>', self.events.append)
+        self.assertEqual(report().total, before + 1)
+        self.frame.unbind('<Motion>')
+        self.assertEqual(report().total, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
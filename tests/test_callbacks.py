@@ -0,0 +1,140 @@
+"""Tests for ``use_shared_callbacks``."""
+
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from fluent_tkinter._callbacks import HANDLE_COMMAND
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class SharedCallbacksTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.assertIs(self.root.use_shared_callbacks(), self.root)
+        self.frame = tkinter.Frame(self.root)
+        self.calls = []
+        self.errors = []
+        self.root.report_callback_exception = (
+            lambda *args: self.errors.append(args[1]))
+
+    def tearDown(self):
+        self.frame.destroy()
+        self.root.use_shared_callbacks(False)
+        del self.root.report_callback_exception
+        super().tearDown()
+
+    def commands(self):
+        return set(self.root.tk.splitlist(
+            self.root.tk.call('info', 'commands')))
+
+    def test_command_option(self):
+        before = self.commands()
+        count = self.root.shared_callback_count()
+        button = tkinter.Button(self.frame,
+                                command=lambda: self.calls.append('b'))
+        self.assertEqual(self.commands(), before)
+        self.assertEqual(self.root.shared_callback_count(), count + 1)
+        self.assertTrue(str(button.cget('command')).startswith(
+            HANDLE_COMMAND + ' '))
+        button.invoke()
+        self.assertEqual(self.calls, ['b'])
+
+    def test_replacing_command_releases_handle(self):
+        count = self.root.shared_callback_count()
+        button = tkinter.Button(self.frame, command=lambda: None)
+        for i in range(10):
+            button.configure(command=lambda i=i: self.calls.append(i))
+        self.assertEqual(self.root.shared_callback_count(), count + 1)
+        button.invoke()
+        self.assertEqual(self.calls, [9])
+
+    def test_bind(self):
+        self.frame.pack()
+        self.root.update()
+        funcid = self.frame.bind('<<Test>>', self.calls.append)
+        self.frame.event_generate('<<Test>>')
+        self.assertEqual(len(self.calls), 1)
+        self.assertIsInstance(self.calls[0], tkinter.Event)
+        self.assertIs(self.calls[0].widget, self.frame)
+        count = self.root.shared_callback_count()
+        self.frame.unbind('<<Test>>', funcid)
+        self.assertEqual(self.root.shared_callback_count(), count - 1)
+        self.frame.event_generate('<<Test>>')
+        self.assertEqual(len(self.calls), 1)
+
+    def test_after(self):
+        count = self.root.shared_callback_count()
+        self.root.after(1, self.calls.append, 'later')
+        cancelled = self.root.after(1, self.calls.append, 'cancelled')
+        self.root.after_cancel(cancelled)
+        self.root.after_idle(self.calls.append, 'idle')
+        self.assertEqual(self.root.shared_callback_count(), count + 2)
+        while len(self.calls) < 2:
+            self.root.update()
+        self.assertCountEqual(self.calls, ['later', 'idle'])
+        self.assertEqual(self.root.shared_callback_count(), count)
+
+    def test_exception_is_reported(self):
+        self.root.after_idle(lambda: 1 / 0)
+        self.root.update()
+        self.assertEqual(len(self.errors), 1)
+        self.assertIsInstance(self.errors[0], ZeroDivisionError)
+
+    def test_destroy_releases_handles(self):
+        count = self.root.shared_callback_count()
+        frame = tkinter.Frame(self.frame)
+        for i in range(5):
+            tkinter.Button(frame, command=lambda: None)
+        frame.bind('<Enter>', lambda e: None)
+        self.assertEqual(self.root.shared_callback_count(), count + 6)
+        frame.destroy()
+        self.assertEqual(self.root.shared_callback_count(), count)
+
+    def test_stale_handle(self):
+        handle = self.frame._register(lambda: self.calls.append('old'))
+        self.frame.deletecommand(handle)
+        new = self.frame._register(lambda: self.calls.append('new'))
+        # The slot is reused under a new generation.
+        self.assertEqual(new.split()[1], handle.split()[1])
+        self.assertNotEqual(new, handle)
+        self.root.tk.eval(handle)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(self.errors), 1)
+        self.assertIsInstance(self.errors[0], tkinter.TclError)
+        self.root.tk.eval(new)
+        self.assertEqual(self.calls, ['new'])
+        # Releasing a stale handle does not free the new callback.
+        self.frame.deletecommand(handle)
+        self.root.tk.eval(new)
+        self.assertEqual(self.calls, ['new', 'new'])
+
+    def test_disable(self):
+        handle = self.frame._register(lambda: self.calls.append('shared'))
+        self.root.use_shared_callbacks(False)
+        name = self.frame._register(lambda: self.calls.append('own'))
+        self.assertFalse(name.startswith(HANDLE_COMMAND))
+        self.assertIn(name, self.commands())
+        self.root.tk.eval(handle)
+        self.root.tk.eval(name)
+        self.assertEqual(self.calls, ['shared', 'own'])
+
+    def test_menu_build(self):
+        menu = tkinter.Menu(self.frame, tearoff=0)
+        count = self.root.shared_callback_count()
+        menu.build([(f'item{i}', lambda i=i: self.calls.append(i))
+                    for i in range(5)])
+        self.assertEqual(self.root.shared_callback_count(), count + 1)
+        menu.invoke(3)
+        menu.entryconfigure(0, command=lambda: self.calls.append('new'))
+        menu.invoke(1)
+        menu.invoke(0)
+        self.assertEqual(self.calls, [3, 1, 'new'])
+
+
+if __name__ == '__main__':
+    unittest.main()
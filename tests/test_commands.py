@@ -0,0 +1,165 @@
+"""Tests for cleanup of superseded Tcl callback commands."""
+
+import unittest
+import tkinter
+from test.support import requires
+
+from fluent_tkinter import CommandReport
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+def callback(*args):
+    pass
+
+
+class CommandCleanupTest(AbstractTkTest, unittest.TestCase):
+
+    def commands(self):
+        return self.root.command_report().total
+
+    def test_rebind_deletes_superseded_command(self):
+        f = tkinter.Frame(self.root)
+        first = f.bind('<Button-1>', callback)
+        before = self.commands()
+        second = f.bind('<Button-1>', callback)
+        self.assertEqual(self.commands(), before)
+        self.assertNotIn(first, f._tclCommands)
+        self.assertIn(second, f._tclCommands)
+
+    def test_add_keeps_existing_commands(self):
+        f = tkinter.Frame(self.root)
+        first = f.bind('<Button-1>', callback)
+        second = f.bind('<Button-1>', callback, add='+')
+        self.assertIn(first, f._tclCommands)
+        self.assertIn(second, f._tclCommands)
+
+    def test_rebind_with_script_keeps_referenced_command(self):
+        f = tkinter.Frame(self.root)
+        funcid = f.bind('<Button-1>', callback)
+        f.bind('<Button-1>', f'{funcid} %x')
+        self.assertIn(funcid, f._tclCommands)
+
+    def test_unbind_funcid_after_rebind(self):
+        f = tkinter.Frame(self.root)
+        funcid = f.bind('<Button-1>', callback)
+        second = f.bind('<Button-1>', callback)
+        f.unbind('<Button-1>', funcid)
+        self.assertIn(second, f.bind('<Button-1>'))
+        c = tkinter.Canvas(self.root)
+        item = c.create_rectangle(0, 0, 10, 10)
+        funcid = c.tag_bind(item, '<Button-1>', callback)
+        c.tag_bind(item, '<Button-1>', callback)
+        c.tag_unbind(item, '<Button-1>', funcid)
+        with self.assertRaises(tkinter.TclError):
+            f.unbind('<Button-1>', funcid)
+
+    def test_unbind_all_functions_deletes_commands(self):
+        f = tkinter.Frame(self.root)
+        f.bind('<Button-1>', callback)
+        f.bind('<Button-1>', callback, add='+')
+        f.unbind('<Button-1>')
+        self.assertEqual(f._tclCommands, [])
+
+    def test_soak_rebind_keeps_command_count_constant(self):
+        f = tkinter.Frame(self.root)
+        f.bind('<Motion>', callback)
+        before = self.commands()
+        for _ in range(1000):
+            f.bind('<Motion>', lambda e: None)
+        self.assertEqual(self.commands(), before)
+        self.assertEqual(len(f._tclCommands), 1)
+
+    def test_reconfigure_command_deletes_old(self):
+        b = tkinter.Button(self.root, command=callback)
+        old = b['command']
+        b.configure(command=lambda: None)
+        self.assertNotIn(str(old), b._tclCommands)
+        self.assertEqual(len(b._tclCommands), 1)
+        b['command'] = callback
+        self.assertEqual(len(b._tclCommands), 1)
+        b.configure(command='')
+        self.assertEqual(b._tclCommands, [])
+
+    def test_reconfigure_validatecommand(self):
+        e = tkinter.Entry(self.root)
+        for _ in range(10):
+            e.configure(validate='key',
+                        validatecommand=(e.register(callback), '%P'))
+        self.assertEqual(len(e._tclCommands), 1)
+
+    def test_reconfigure_to_same_command_keeps_it(self):
+        e = tkinter.Entry(self.root)
+        e.configure(validate='key',
+                    validatecommand=(e.register(callback), '%P'))
+        name = e._tclCommands[0]
+        e.configure(validatecommand=e.cget('validatecommand'))
+        self.assertEqual(e._tclCommands, [name])
+        self.assertEqual(self.root.tk.call('info', 'commands', name), name)
+        b = tkinter.Button(self.root, command=callback)
+        b.configure(command=b['command'])
+        self.assertEqual(len(b._tclCommands), 1)
+        self.assertTrue(self.root.tk.call('info', 'commands',
+                                          b._tclCommands[0]))
+
+    def test_canvas_tag_rebind(self):
+        c = tkinter.Canvas(self.root)
+        item = c.create_rectangle(0, 0, 10, 10)
+        for _ in range(10):
+            c.tag_bind(item, '<Button-1>', callback)
+        self.assertEqual(len(c._tclCommands), 1)
+        c.tag_unbind(item, '<Button-1>')
+        self.assertEqual(c._tclCommands, [])
+
+    def test_text_tag_rebind(self):
+        t = tkinter.Text(self.root)
+        for _ in range(10):
+            t.tag_bind('link', '<Button-1>', callback)
+        self.assertEqual(len(t._tclCommands), 1)
+
+    def test_menu_entryconfigure(self):
+        m = tkinter.Menu(self.root)
+        m.add_command(label='x', command=callback)
+        for _ in range(10):
+            m.entryconfigure(0, command=callback)
+        self.assertEqual(len(m._tclCommands), 1)
+        m.entryconfigure(0, command=m.entrycget(0, 'command'))
+        self.assertEqual(len(m._tclCommands), 1)
+
+    def test_bind_all_rebind_and_unbind(self):
+        before = self.commands()
+        for _ in range(10):
+            self.root.bind_all('<<Soak>>', callback)
+        self.assertEqual(self.commands(), before + 1)
+        self.assertEqual(self.root.command_report().shared, 1)
+        self.root.unbind_all('<<Soak>>')
+        self.assertEqual(self.commands(), before)
+        self.assertEqual(self.root.command_report().unowned, ())
+
+    def test_bind_class_rebind_and_unbind(self):
+        before = self.commands()
+        for _ in range(10):
+            self.root.bind_class('Soak', '<Button-1>', callback)
+        self.assertEqual(self.commands(), before + 1)
+        self.root.unbind_class('Soak', '<Button-1>')
+        self.assertEqual(self.commands(), before)
+
+    def test_command_report(self):
+        f = tkinter.Frame(self.root)
+        f.bind('<Button-1>', callback)
+        report = self.root.command_report()
+        self.assertIsInstance(report, CommandReport)
+        self.assertEqual(report.by_widget[f._w], 1)
+        self.assertEqual(report.unowned, ())
+
+    def test_command_report_finds_leaks(self):
+        name = self.root._register(callback, needcleanup=0)
+        try:
+            self.assertIn(name, self.root.command_report().unowned)
+        finally:
+            self.root.tk.deletecommand(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
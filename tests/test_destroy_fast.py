@@ -0,0 +1,82 @@
+"""Tests for ``Misc.destroy_fast``."""
+
+import unittest
+import tkinter
+import tkinter.ttk as ttk
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class DestroyFastTest(AbstractTkTest, unittest.TestCase):
+
+    def commands(self):
+        return set(self.root.tk.splitlist(
+            self.root.tk.call('info', 'commands')))
+
+    def build(self):
+        page = tkinter.Frame(self.root)
+        for i in range(5):
+            row = tkinter.Frame(page)
+            tkinter.Button(row, command=lambda: None)
+            ttk.Entry(row, validatecommand=lambda: True)
+            row.bind('<Enter>', lambda e: None)
+        return page
+
+    def test_destroys_subtree(self):
+        self.build().destroy_fast()
+        before = self.commands()
+        report = self.root.command_report().total
+        page = self.build()
+        widgets = list(page.walk())
+        self.assertIs(page.destroy_fast(), page)
+        self.assertNotIn(page._name, self.root.children)
+        for widget in widgets:
+            self.assertFalse(widget.winfo_exists())
+            self.assertEqual(widget.children, {})
+            self.assertIsNone(widget._tclCommands)
+        self.assertEqual(self.commands(), before)
+        self.assertEqual(self.root.command_report().total, report)
+
+    def test_destroy_bindings_run(self):
+        page = self.build()
+        seen = []
+        child = tkinter.Frame(page)
+        child.bind('<Destroy>', lambda e: seen.append(e.widget))
+        page.destroy_fast()
+        self.assertEqual(seen, [child])
+
+    def test_custom_destroy(self):
+        page = self.build()
+        var = tkinter.StringVar(self.root)
+        menu = tkinter.OptionMenu(page, var, 'a', 'b')
+        labeled = ttk.LabeledScale(page)
+        page.destroy_fast()
+        self.assertFalse(menu.winfo_exists())
+        self.assertIsNone(menu._OptionMenu__menu)
+        self.assertIsNone(labeled.label)
+
+    def test_shared_callbacks(self):
+        self.root.use_shared_callbacks()
+        try:
+            count = self.root.shared_callback_count()
+            page = self.build()
+            self.assertGreater(self.root.shared_callback_count(), count)
+            page.destroy_fast()
+            self.assertEqual(self.root.shared_callback_count(), count)
+        finally:
+            self.root.use_shared_callbacks(False)
+
+    def test_toplevel(self):
+        top = tkinter.Toplevel(self.root)
+        tkinter.Label(top, text='x')
+        top.destroy_fast()
+        self.assertFalse(top.winfo_exists())
+        self.assertNotIn(top._name, self.root.children)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for ``Misc.geometry_snapshot``."""
+
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from fluent_tkinter import WidgetGeometry
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class GeometrySnapshotTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.root.deiconify()
+        self.frame = tkinter.Frame(self.root)
+        self.frame.pack()
+        self.inner = tkinter.Frame(self.frame, width=50, height=30)
+        self.inner.pack()
+        self.labels = [tkinter.Label(self.inner, text=str(i)).pack()
+                       for i in range(3)]
+        self.inner.pack_propagate(False)
+        self.hidden = tkinter.Label(self.frame, text='hidden')
+        self.root.update()
+
+    def tearDown(self):
+        self.frame.destroy()
+        super().tearDown()
+
+    def expected(self, widget):
+        return WidgetGeometry(widget.winfo_rootx(), widget.winfo_rooty(),
+                              widget.winfo_width(), widget.winfo_height(),
+                              bool(widget.winfo_ismapped()))
+
+    def test_recursive(self):
+        snapshot = self.frame.geometry_snapshot()
+        self.assertEqual(set(snapshot),
+                         {self.frame, self.inner, self.hidden,
+                          *self.labels})
+        for widget, geometry in snapshot.items():
+            self.assertEqual(geometry, self.expected(widget))
+        self.assertEqual(snapshot[self.inner][2:4], (50, 30))
+        self.assertFalse(snapshot[self.hidden].mapped)
+        self.assertTrue(snapshot[self.labels[0]].mapped)
+
+    def test_not_recursive(self):
+        snapshot = self.frame.geometry_snapshot(recursive=False)
+        self.assertEqual(set(snapshot),
+                         {self.frame, self.inner, self.hidden})
+
+    def test_destroyed_window(self):
+        label = self.labels[0]
+        label.tk.call('destroy', label._w)
+        snapshot = self.frame.geometry_snapshot()
+        self.assertNotIn(label, snapshot)
+        self.assertIn(self.labels[1], snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for bulk grid placement (``grid_many``, ``grid_weights``)."""
+
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class GridManyTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.frame = tkinter.Frame(self.root)
+
+    def tearDown(self):
+        self.frame.destroy()
+        super().tearDown()
+
+    def matrix(self, rows, columns):
+        return [[tkinter.Entry(self.frame) for _ in range(columns)]
+                for _ in range(rows)]
+
+    def test_places_every_cell(self):
+        rows = self.matrix(4, 3)
+        result = self.frame.grid_many(rows, sticky='ew', padx=(1, 2))
+        self.assertIs(result, self.frame)
+        for r, cells in enumerate(rows):
+            for c, entry in enumerate(cells):
+                info = entry.grid_info()
+                self.assertEqual((info['row'], info['column']), (r, c))
+                self.assertEqual(info['sticky'], 'ew')
+                self.assertEqual(info['padx'], (1, 2))
+                self.assertIs(info['in'], self.frame)
+        self.assertEqual(self.frame.grid_size(), (3, 4))
+
+    def test_offset(self):
+        rows = self.matrix(2, 2)
+        self.frame.grid_many(rows, row=5, column=2)
+        info = rows[1][1].grid_info()
+        self.assertEqual((info['row'], info['column']), (6, 3))
+
+    def test_placeholders(self):
+        a, b, c = (tkinter.Label(self.frame) for _ in range(3))
+        self.frame.grid_many([[a, '-', None, b], [None, None, None, '^'],
+                              [None, 'x'], [c]])
+        self.assertEqual(a.grid_info()['columnspan'], 2)
+        self.assertEqual(b.grid_info()['column'], 3)
+        self.assertEqual(b.grid_info()['rowspan'], 2)
+        self.assertEqual(c.grid_info()['row'], 3)
+
+    def test_invalid_cell(self):
+        with self.assertRaises(TypeError):
+            self.frame.grid_many([[object()]])
+
+    def test_other_master(self):
+        inner = tkinter.Frame(self.frame)
+        label = tkinter.Label(self.frame)
+        inner.grid_many([[label]])
+        self.assertIs(label.grid_info()['in'], inner)
+
+    def test_weights_sequence_and_mapping(self):
+        self.frame.grid_many(self.matrix(3, 4))
+        result = self.frame.grid_weights(columns=[1, 1, 0, 2],
+                                          rows={0: 3, 2: 3}, uniform='u')
+        self.assertIs(result, self.frame)
+        weights = [self.frame.grid_columnconfigure(i, 'weight')
+                   for i in range(4)]
+        self.assertEqual(weights, [1, 1, 0, 2])
+        self.assertEqual(self.frame.grid_rowconfigure(2, 'weight'), 3)
+        self.assertEqual(self.frame.grid_rowconfigure(1, 'weight'), 0)
+        self.assertEqual(self.frame.grid_rowconfigure(0, 'uniform'), 'u')
+
+    def test_weights_all(self):
+        self.frame.grid_many(self.matrix(2, 3))
+        self.frame.grid_weights(columns=1, rows=[None, 4])
+        self.assertEqual([self.frame.grid_columnconfigure(i, 'weight')
+                          for i in range(3)], [1, 1, 1])
+        self.assertEqual(self.frame.grid_rowconfigure(0, 'weight'), 0)
+        self.assertEqual(self.frame.grid_rowconfigure(1, 'weight'), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for ``Misc.idle_work``."""
+
+import time
+import unittest
+from concurrent.futures import Future
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class IdleWorkTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.log = []
+
+    def job(self, name, steps, cost=0.001):
+        for i in range(steps):
+            self.log.append(name)
+            time.sleep(cost)
+            yield
+        return f'{name} done'
+
+    def wait(self, *futures):
+        deadline = time.monotonic() + 5
+        while not all(f.done() for f in futures):
+            self.assertLess(time.monotonic(), deadline)
+            self.root.update()
+
+    def test_result(self):
+        future = self.root.idle_work(self.job('a', 3))
+        self.assertIsInstance(future, Future)
+        self.assertFalse(future.done())
+        self.wait(future)
+        self.assertEqual(future.result(), 'a done')
+        self.assertEqual(self.log, ['a'] * 3)
+
+    def test_slices_yield_to_event_loop(self):
+        ticks = []
+        self.root.after(1, ticks.append, 'timer')
+        future = self.root.idle_work(self.job('a', 50), budget_ms=5)
+        self.wait(future)
+        # The timer ran between slices, long before the job ended.
+        self.assertEqual(ticks, ['timer'])
+        self.assertLess(self.log.index('a'), 10)
+
+    def test_priority_and_turns(self):
+        low = self.root.idle_work(self.job('a', 10), budget_ms=3)
+        same = self.root.idle_work(self.job('b', 10), budget_ms=3)
+        high = self.root.idle_work(self.job('h', 3), priority=1)
+        self.wait(low, same, high)
+        self.assertEqual(self.log[:3], ['h'] * 3)
+        rest = ''.join(self.log[3:])
+        self.assertRegex(rest, '^a+b+a+b')
+
+    def test_nested_submit(self):
+        inner = []
+
+        def outer():
+            self.log.append('o')
+            inner.append(self.root.idle_work(self.job('i', 3), priority=10))
+            time.sleep(0.002)   # end the slice here
+            yield
+            yield from self.job('o', 3)
+
+        future = self.root.idle_work(outer(), budget_ms=1, priority=-10)
+        self.wait(future, *inner)
+        self.assertEqual(''.join(self.log), 'oiiiooo')
+        self.assertEqual(inner[0].result(), 'i done')
+        self.assertEqual(self.root._fluent_idle_worker._jobs, [])
+
+    def test_exception(self):
+        def failing():
+            yield
+            raise ValueError('boom')
+        future = self.root.idle_work(failing())
+        self.wait(future)
+        self.assertIsInstance(future.exception(), ValueError)
+
+    def test_cancel_closes_generator(self):
+        closed = []
+
+        def endless():
+            try:
+                while True:
+                    yield
+            finally:
+                closed.append(True)
+        future = self.root.idle_work(endless(), budget_ms=1)
+        self.root.update()
+        self.assertTrue(future.cancel())
+        self.root.update()
+        self.assertEqual(closed, [True])
+
+    def test_cancel_while_running(self):
+        closed = []
+        futures = []
+
+        def cancelling():
+            try:
+                yield
+                futures[0].cancel()
+                while True:
+                    yield
+            finally:
+                closed.append(True)
+
+        def finishing():
+            yield
+            futures[1].cancel()
+            return 'ignored'
+
+        futures.append(self.root.idle_work(cancelling()))
+        futures.append(self.root.idle_work(finishing()))
+        self.wait(*futures)
+        self.assertTrue(all(f.cancelled() for f in futures))
+        self.assertEqual(closed, [True])
+        self.assertEqual(self.root._fluent_idle_worker._jobs, [])
+
+    def test_iterable(self):
+        future = self.root.idle_work(map(self.log.append, 'xyz'))
+        self.wait(future)
+        self.assertIsNone(future.result())
+        self.assertEqual(self.log, ['x', 'y', 'z'])
+
+
+if __name__ == '__main__':
+    unittest.main()
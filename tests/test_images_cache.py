@@ -0,0 +1,125 @@
+"""Tests for the shared decoded-image cache (``fluent_tkinter.images``)."""
+
+import os
+import shutil
+import tempfile
+import unittest
+import tkinter
+from test.support import requires
+
+from fluent_tkinter import images
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'imghdrdata')
+
+
+def data_file(name):
+    return os.path.join(DATA_DIR, name)
+
+
+class ImageCacheTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = images.ImageCache(self.root)
+
+    def test_load_is_shared(self):
+        a = self.cache.load(data_file('python.png'))
+        b = self.cache.load(data_file('python.png'))
+        self.assertIsInstance(a, tkinter.PhotoImage)
+        self.assertIs(a, b)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.count), (1, 1, 1))
+        self.assertEqual(stats.nbytes, a.width() * a.height() * 4)
+
+    def test_formats(self):
+        for name in ('python.png', 'python.gif', 'python.ppm',
+                     'python.pgm'):
+            with self.subTest(name=name):
+                image = self.cache.load(data_file(name))
+                self.assertGreater(image.width(), 0)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(tkinter.TclError):
+            self.cache.load(data_file('python.webp'))
+        with self.assertRaises(OSError):
+            self.cache.load(data_file('missing.png'))
+
+    def test_transforms_are_separate_entries(self):
+        full = self.cache.load(data_file('python.png'))
+        half = self.cache.load(data_file('python.png'), subsample=2)
+        double = self.cache.load(data_file('python.png'), zoom=(2, 2))
+        self.assertIsNot(full, half)
+        self.assertEqual(half.width(), (full.width() + 1) // 2)
+        self.assertEqual(double.width(), full.width() * 2)
+        self.assertIs(self.cache.load(data_file('python.png'),
+                                      subsample=(2, 2)), half)
+        # subsample=1 is the identity transform.
+        self.assertIs(self.cache.load(data_file('python.png'),
+                                      subsample=1), full)
+
+    def test_modified_file_is_reloaded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'icon.png')
+            shutil.copy(data_file('python.png'), path)
+            first = self.cache.load(path)
+            shutil.copy(data_file('python.gif'), path)
+            os.utime(path, ns=(0, 10**9))
+            second = self.cache.load(path)
+            self.assertIsNot(first, second)
+
+    def test_eviction_respects_budget(self):
+        self.cache.budget = 0
+        self.cache.load(data_file('python.png'))
+        self.cache.load(data_file('python.gif'))
+        # Neither image is referenced any more, so both are evicted.
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats().evictions, 2)
+
+    def test_images_in_use_are_kept(self):
+        self.cache.budget = 0
+        held = self.cache.load(data_file('python.png'))
+        label = tkinter.Label(self.root,
+                              image=self.cache.load(data_file('python.gif')))
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 2)
+        del held
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 1)
+        label.destroy()
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_displayed_image_outlives_python_references(self):
+        label = tkinter.Label(self.root,
+                              image=self.cache.load(data_file('python.png')))
+        name = str(label['image'])
+        self.cache.clear()
+        self.assertIn(name, self.root.image_names())
+        image = self.cache.load(data_file('python.png'))
+        self.assertEqual(image.name, name)
+        self.assertTrue(self.cache.in_use(image))
+        label.destroy()
+
+    def test_evicted_image_is_deleted(self):
+        image = self.cache.load(data_file('python.png'))
+        name = image.name
+        del image
+        self.cache.clear()
+        self.assertNotIn(name, self.root.image_names())
+
+    def test_module_level_load(self):
+        image = images.load(data_file('python.png'), master=self.root)
+        self.assertIs(images.cache(self.root).load(data_file('python.png')),
+                      image)
+        frame = tkinter.Frame(self.root)
+        self.assertIs(images.cache(frame), images.cache(self.root))
+        del image
+        images.clear(self.root)
+        self.assertEqual(len(images.cache(self.root)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for background image loading (``images.ThumbnailLoader``)."""
+
+import os
+import time
+import unittest
+import tkinter
+from test.support import requires
+
+from fluent_tkinter import images
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'imghdrdata')
+
+
+def data_file(name):
+    return os.path.join(DATA_DIR, name)
+
+
+class ThumbnailLoaderTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        images.clear(self.root)
+        self.loader = images.ThumbnailLoader(self.root, workers=2)
+        self.addCleanup(self.loader.shutdown)
+
+    def wait(self, *futures, timeout=10):
+        deadline = time.monotonic() + timeout
+        while not all(f.done() for f in futures):
+            if time.monotonic() > deadline:
+                self.fail('thumbnails were not loaded')
+            self.root.update()
+
+    def test_applies_to_widget(self):
+        label = tkinter.Label(self.root)
+        future = self.loader.load(data_file('python.png'), label,
+                                  relief='sunken')
+        self.wait(future)
+        image = future.result()
+        self.assertIsInstance(image, tkinter.PhotoImage)
+        self.assertEqual(label.cget('image'), image.name)
+        self.assertEqual(label.cget('relief'), 'sunken')
+
+    def test_matches_synchronous_decode(self):
+        for name in ('python.png', 'python.gif', 'python.ppm', 'python.pgm'):
+            for subsample in (None, 2, (3, 2)):
+                with self.subTest(name=name, subsample=subsample):
+                    future = self.loader.load(data_file(name),
+                                              subsample=subsample, zoom=2)
+                    self.wait(future)
+                    image = future.result()
+                    expected = tkinter.PhotoImage(master=self.root,
+                                                  file=data_file(name))
+                    if subsample is not None:
+                        expected = expected.subsample(*(
+                            (subsample, subsample)
+                            if isinstance(subsample, int) else subsample))
+                    expected = expected.zoom(2)
+                    self.assertEqual((image.width(), image.height()),
+                                     (expected.width(), expected.height()))
+                    self.assertEqual(image.get(1, 1), expected.get(1, 1))
+
+    def test_mmap(self):
+        self.loader.use_mmap = True
+        future = self.loader.load(data_file('python.ppm'), subsample=2)
+        self.wait(future)
+        self.assertEqual(future.result().width(), 8)
+
+    def test_shares_cache(self):
+        cached = images.load(data_file('python.gif'), master=self.root)
+        future = self.loader.load(data_file('python.gif'))
+        self.wait(future)
+        self.assertIs(future.result(), cached)
+        future = self.loader.load(data_file('python.ppm'))
+        self.wait(future)
+        self.assertIs(images.load(data_file('python.ppm'), master=self.root),
+                      future.result())
+
+    def test_missing_file(self):
+        reported = []
+        self.root.report_callback_exception = (
+            lambda *args: reported.append(args[1]))
+        future = self.loader.load(data_file('missing.png'))
+        self.wait(future)
+        self.assertIsInstance(future.exception(), FileNotFoundError)
+        self.assertEqual(len(reported), 1)
+
+    def test_cancel(self):
+        label = tkinter.Label(self.root)
+        future = self.loader.load(data_file('python.png'), label)
+        future.cancel()
+        other = self.loader.load(data_file('python.gif'))
+        self.wait(other)
+        self.assertTrue(future.cancelled())
+        self.assertEqual(label.cget('image'), '')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for ``Misc.layout_batch``."""
+
+import unittest
+from unittest import mock
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class LayoutBatchTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.root.deiconify()
+        self.container = tkinter.Frame(self.root)
+
+    def tearDown(self):
+        self.container.destroy()
+        super().tearDown()
+
+    def test_context_value_and_propagation(self):
+        with self.container.layout_batch() as frame:
+            self.assertIs(frame, self.container)
+            self.assertFalse(frame.pack_propagate())
+            self.assertFalse(frame.grid_propagate())
+        self.assertTrue(self.container.pack_propagate())
+        self.assertTrue(self.container.grid_propagate())
+
+    def test_propagation_off_is_kept(self):
+        self.container.grid_propagate(False)
+        with self.container.layout_batch():
+            pass
+        self.assertFalse(self.container.grid_propagate())
+        self.assertTrue(self.container.pack_propagate())
+
+    def test_pack_position_restored(self):
+        before = tkinter.Frame(self.root).pack()
+        self.container.pack(side='left', padx=3)
+        after = tkinter.Frame(self.root).pack()
+        with self.container.layout_batch():
+            self.assertEqual(self.container.winfo_manager(), '')
+            tkinter.Label(self.container, text='x').pack()
+        self.assertEqual(self.root.pack_slaves()[-3:],
+                         [before, self.container, after])
+        info = self.container.pack_info()
+        self.assertEqual((info['side'], str(info['padx'])), ('left', '3'))
+        for widget in before, after:
+            widget.destroy()
+
+    def test_grid_and_place_restored(self):
+        self.container.grid(row=2, column=1, sticky='n')
+        with self.container.layout_batch():
+            self.assertEqual(self.container.winfo_manager(), '')
+        info = self.container.grid_info()
+        self.assertEqual((info['row'], info['column'], info['sticky']),
+                         (2, 1, 'n'))
+        self.container.grid_forget()
+        self.container.place(x=5, relwidth=0.5)
+        with self.container.layout_batch():
+            self.assertEqual(self.container.winfo_manager(), '')
+        info = self.container.place_info()
+        self.assertEqual((str(info['x']), str(info['relwidth'])), ('5', '0.5'))
+
+    def test_toplevel(self):
+        top = tkinter.Toplevel(self.root)
+        self.addCleanup(top.destroy)
+        top.update()
+        with top.layout_batch():
+            self.assertEqual(top.wm_state(), 'withdrawn')
+        self.assertEqual(top.wm_state(), 'normal')
+        top.withdraw()
+        with top.layout_batch():
+            pass
+        self.assertEqual(top.wm_state(), 'withdrawn')
+
+    def test_nesting(self):
+        self.container.pack()
+        with self.container.layout_batch():
+            with self.container.layout_batch():
+                pass
+            self.assertEqual(self.container.winfo_manager(), '')
+            self.assertFalse(self.container.pack_propagate())
+        self.assertEqual(self.container.winfo_manager(), 'pack')
+        self.assertTrue(self.container.pack_propagate())
+
+    def test_nesting_across_widgets_updates_once(self):
+        self.container.pack()
+        inner = tkinter.Frame(self.container)
+        inner.pack()
+        with mock.patch.object(tkinter.Misc, 'update_idletasks',
+                               autospec=True) as update:
+            with self.container.layout_batch():
+                with inner.layout_batch():
+                    self.assertEqual(inner.winfo_manager(), '')
+                self.assertEqual(inner.winfo_manager(), 'pack')
+                update.assert_not_called()
+            update.assert_called_once_with(self.container)
+        self.assertEqual(self.container.winfo_manager(), 'pack')
+
+    def test_restored_on_error(self):
+        self.container.pack()
+        with self.assertRaises(ZeroDivisionError):
+            with self.container.layout_batch():
+                1 / 0
+        self.assertEqual(self.container.winfo_manager(), 'pack')
+        with self.container.layout_batch():
+            self.assertEqual(self.container.winfo_manager(), '')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Tests for ``Menu.build``."""
+
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class MenuBuildTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.menu = tkinter.Menu(self.root, tearoff=0)
+        self.calls = []
+
+    def tearDown(self):
+        self.menu.destroy()
+        super().tearDown()
+
+    def callback(self, name):
+        return lambda: self.calls.append(name)
+
+    def test_entries(self):
+        var = tkinter.BooleanVar(self.root)
+        result = self.menu.build([
+            ('Open', self.callback('open'), {'accelerator': 'Ctrl+O'}),
+            None,
+            {'type': 'checkbutton', 'label': 'Wrap', 'variable': var},
+            '-',
+            {'label': 'Quit $now [x]', 'command': self.callback('quit'),
+             'underline': 0},
+        ])
+        self.assertIs(result, self.menu)
+        self.assertEqual(self.menu.index('end'), 4)
+        self.assertEqual([self.menu.type(i) for i in range(5)],
+                         ['command', 'separator', 'checkbutton',
+                          'separator', 'command'])
+        self.assertEqual(self.menu.entrycget(0, 'accelerator'), 'Ctrl+O')
+        self.assertEqual(self.menu.entrycget(4, 'label'), 'Quit $now [x]')
+        self.menu.invoke(0)
+        self.menu.invoke(4)
+        self.menu.invoke(2)
+        self.assertEqual(self.calls, ['open', 'quit'])
+        self.assertTrue(var.get())
+
+    def test_cascades_share_one_command(self):
+        before = self.root.command_report().total
+        self.menu.build([
+            ('File', [('New', self.callback('new')),
+                      ('Recent', [(f'file{i}', self.callback(i))
+                                  for i in range(100)])]),
+            ('Edit', [('Undo', self.callback('undo'))]),
+        ])
+        self.assertEqual(self.root.command_report().total, before + 1)
+        file_menu = self.menu.nametowidget(self.menu.entrycget(0, 'menu'))
+        self.assertIsInstance(file_menu, tkinter.Menu)
+        self.assertEqual(file_menu.cget('tearoff'), 0)
+        recent = self.menu.nametowidget(file_menu.entrycget(1, 'menu'))
+        self.assertEqual(recent.index('end'), 99)
+        recent.invoke(42)
+        file_menu.invoke(0)
+        self.assertEqual(self.calls, [42, 'new'])
+        # Building more entries into a submenu reuses the dispatcher.
+        recent.build([('more', self.callback('more'))])
+        recent.invoke('end')
+        self.assertEqual(self.calls[-1], 'more')
+        self.assertEqual(self.root.command_report().total, before + 1)
+
+    def test_lazy_cascade(self):
+        built = []
+
+        def children():
+            built.append(1)
+            return [('Plugin', self.callback('plugin'))]
+
+        self.menu.build([{'label': 'Plugins', 'children': children}])
+        plugins = self.menu.nametowidget(self.menu.entrycget(0, 'menu'))
+        self.assertEqual(plugins.index('end'), None)
+        plugins.tk.eval(plugins.cget('postcommand'))
+        self.assertEqual(built, [1])
+        self.assertEqual(plugins.cget('postcommand'), '')
+        plugins.invoke(0)
+        self.assertEqual(self.calls, ['plugin'])
+
+    def test_reconfiguring_an_entry_keeps_dispatcher(self):
+        self.menu.build([('A', self.callback('a')), ('B', self.callback('b'))])
+        self.menu.entryconfigure(0, command=self.callback('a2'))
+        self.menu.invoke(0)
+        self.menu.invoke(1)
+        self.assertEqual(self.calls, ['a2', 'b'])
+
+    def test_destroy_deletes_dispatcher(self):
+        menu = tkinter.Menu(self.root)
+        before = self.root.command_report().total
+        menu.build([('A', [('B', self.callback('b'))])])
+        menu.destroy()
+        self.assertEqual(self.root.command_report().total, before)
+
+    def test_delete_forgets_callbacks(self):
+        def spec():
+            return [('A', self.callback('a')),
+                    ('Sub', [('B', self.callback('b'))]),
+                    {'label': 'Lazy', 'children': lambda: []}]
+
+        self.menu.build(spec())
+        dispatcher = self.menu._fluent_menu_dispatcher
+        sub = self.menu.nametowidget(self.menu.entrycget(1, 'menu'))
+        self.menu.add_command(label='Plain', command=self.callback('plain'))
+        before = self.root.command_report().total
+        self.menu.delete(0, 'end')
+        self.assertEqual(dispatcher.callbacks, {})
+        self.assertFalse(sub.winfo_exists())
+        self.assertEqual(self.root.command_report().total, before - 1)
+        for _ in range(5):
+            self.menu.delete(0, 'end')
+            self.menu.build(spec())
+        self.assertEqual(len(dispatcher.callbacks), 3)
+        self.assertEqual(len(self.menu.winfo_children()), 2)
+        self.menu.invoke(0)
+        self.assertEqual(self.calls, ['a'])
+
+    def test_invalid_type(self):
+        with self.assertRaises(ValueError):
+            self.menu.build([{'type': 'bogus'}])
+
+
+if __name__ == "__main__":
+    unittest.main()
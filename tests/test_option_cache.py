@@ -0,0 +1,66 @@
+"""Tests for the cached ``configure()`` and ``keys()``."""
+
+import unittest
+import tkinter
+import tkinter.ttk as ttk
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class OptionCacheTest(AbstractTkTest, unittest.TestCase):
+
+    def stock_configure(self, widget):
+        return widget._getconfigure(widget._w, 'configure')
+
+    def stock_keys(self, widget):
+        splitlist = widget.tk.splitlist
+        return [splitlist(x)[0][1:]
+                for x in splitlist(widget.tk.call(widget._w, 'configure'))]
+
+    def test_matches_stock_tkinter(self):
+        for cls in (tkinter.Button, tkinter.Canvas, tkinter.Text,
+                    tkinter.Entry, ttk.Button, ttk.Treeview, ttk.Frame):
+            with self.subTest(cls=cls.__name__):
+                first = cls(self.root)
+                second = cls(self.root)
+                self.assertEqual(first.configure(),
+                                 self.stock_configure(first))
+                self.assertEqual(second.keys(), self.stock_keys(second))
+                self.assertEqual(second.config(),
+                                 self.stock_configure(second))
+                first.destroy()
+                second.destroy()
+
+    def test_current_values(self):
+        button = tkinter.Button(self.root, text='one')
+        self.assertEqual(button.configure()['text'][4], 'one')
+        button.configure(text='two', bd=5)
+        cnf = button.configure()
+        self.assertEqual(cnf['text'][4], 'two')
+        self.assertEqual(cnf['bd'], ('bd', '-borderwidth'))
+        self.assertEqual(cnf['borderwidth'][4], 5)
+        self.assertEqual(button.configure('text'),
+                         ('text', 'text', 'Text', '', 'two'))
+        self.assertEqual(button.configure('bd'),
+                         button._getconfigure1(button._w, 'configure',
+                                               '-bd'))
+        button.destroy()
+
+    def test_keys_is_a_copy(self):
+        label = tkinter.Label(self.root)
+        label.keys().clear()
+        self.assertIn('text', label.keys())
+        label.destroy()
+
+    def test_root(self):
+        self.assertEqual(self.root.configure(),
+                         self.stock_configure(self.root))
+        self.assertEqual(self.root.keys(), self.stock_keys(self.root))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for ``PhotoImage.put_buffer``."""
+
+import array
+import unittest
+import tkinter
+from test.support import requires
+
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+def gradient(width, height, channels):
+    data = bytearray()
+    for y in range(height):
+        for x in range(width):
+            pixel = [x * 10, y * 10, 200, 128][:channels]
+            data.extend(pixel)
+    return data
+
+
+class PutBufferTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.image = tkinter.PhotoImage(master=self.root, width=8, height=6)
+
+    def test_rgb(self):
+        data = gradient(8, 6, 3)
+        result = self.image.put_buffer(bytes(data), 8, 6)
+        self.assertIs(result, self.image)
+        self.assertEqual(self.image.get(0, 0), (0, 0, 200))
+        self.assertEqual(self.image.get(7, 5), (70, 50, 200))
+
+    def test_grey(self):
+        data = bytes(range(0, 48 * 5, 5))
+        self.image.put_buffer(data, 8, 6, mode='L')
+        self.assertEqual(self.image.get(1, 0), (5, 5, 5))
+        self.assertEqual(self.image.get(0, 1), (40, 40, 40))
+
+    def test_rgba(self):
+        data = gradient(8, 6, 4)
+        data[3] = 0     # first pixel fully transparent
+        self.image.put_buffer(data, 8, 6, mode='RGBA')
+        self.assertEqual(self.image.get(3, 2), (30, 20, 200))
+        self.assertTrue(self.image.transparency_get(0, 0))
+        self.assertFalse(self.image.transparency_get(1, 0))
+
+    def test_buffer_protocol_objects(self):
+        data = gradient(8, 6, 3)
+        for buf in (data, memoryview(data), array.array('B', data)):
+            self.image.blank()
+            self.image.put_buffer(buf, 8, 6)
+            self.assertEqual(self.image.get(2, 3), (20, 30, 200))
+
+    def test_box_and_to(self):
+        data = gradient(8, 6, 3)
+        self.image.put_buffer(data, 8, 6, box=(2, 1, 5, 4))
+        # Only the box is uploaded, at its own position.
+        self.assertEqual(self.image.get(2, 1), (20, 10, 200))
+        self.assertEqual(self.image.get(4, 3), (40, 30, 200))
+        self.assertEqual(self.image.get(0, 0), (0, 0, 0))
+        self.image.put_buffer(data, 8, 6, box=(2, 1, 5, 4), to=(0, 0))
+        self.assertEqual(self.image.get(0, 0), (20, 10, 200))
+
+    def test_rgba_box(self):
+        data = gradient(8, 6, 4)
+        self.image.put_buffer(data, 8, 6, mode='RGBA', box=(1, 1, 3, 3),
+                              to=(6, 4))
+        self.assertEqual(self.image.get(7, 5), (20, 20, 200))
+
+    def test_grows_image(self):
+        image = tkinter.PhotoImage(master=self.root)
+        image.put_buffer(gradient(4, 3, 3), 4, 3)
+        self.assertEqual((image.width(), image.height()), (4, 3))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.image.put_buffer(b'\0' * 10, 8, 6)
+        with self.assertRaises(ValueError):
+            self.image.put_buffer(b'\0' * 48, 8, 6, mode='CMYK')
+        with self.assertRaises(ValueError):
+            self.image.put_buffer(b'\0' * 144, 8, 6, box=(0, 0, 9, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for ``fluent_tkinter.WidgetPool``."""
+
+import time
+import unittest
+import tkinter
+from test.support import requires
+
+from fluent_tkinter import WidgetPool
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class WidgetPoolTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.frame = tkinter.Frame(self.root)
+        self.pool = WidgetPool(lambda: tkinter.Label(self.frame))
+        self.addCleanup(self.pool.clear)
+
+    def tearDown(self):
+        self.frame.destroy()
+        super().tearDown()
+
+    def test_reuse(self):
+        label = self.pool.acquire(text='a').pack()
+        self.assertEqual(label.cget('text'), 'a')
+        self.assertIs(self.pool.release(label), self.pool)
+        self.assertEqual(label.winfo_manager(), '')
+        self.assertEqual(len(self.pool), 1)
+        again = self.pool.acquire(text='b')
+        self.assertIs(again, label)
+        self.assertEqual(again.cget('text'), 'b')
+        self.assertEqual((self.pool.created, self.pool.reused), (1, 1))
+
+    def test_double_release(self):
+        label = self.pool.acquire()
+        self.pool.release(label).release(label)
+        self.assertEqual(len(self.pool), 1)
+        self.assertIs(self.pool.acquire(), label)
+        self.assertIsNot(self.pool.acquire(), label)
+
+    def test_grid_release_remembers_options(self):
+        label = self.pool.acquire().grid(row=3, column=2)
+        self.pool.release(label)
+        self.assertEqual(label.winfo_manager(), '')
+        self.pool.acquire().grid()
+        self.assertEqual(label.grid_info()['row'], 3)
+
+    def test_reset(self):
+        calls = []
+        pool = WidgetPool(lambda: tkinter.Frame(self.frame),
+                          reset=lambda w, *a, **kw: calls.append((w, a, kw)))
+        widget = pool.acquire(1, x=2)
+        self.assertEqual(calls, [(widget, (1,), {'x': 2})])
+        with self.assertRaises(TypeError):
+            self.pool.acquire(1)
+
+    def test_maxsize(self):
+        pool = WidgetPool(lambda: tkinter.Label(self.frame), maxsize=1)
+        a, b = pool.acquire(), pool.acquire()
+        pool.release(a).release(b)
+        self.assertEqual(len(pool), 1)
+        self.assertFalse(b.winfo_exists())
+
+    def test_no_command_growth(self):
+        pool = WidgetPool(lambda: tkinter.Button(self.frame))
+        pool.release(pool.acquire(command=lambda: None))
+        before = self.root.command_report().total
+        for i in range(50):
+            pool.release(pool.acquire(command=lambda: None).pack())
+        self.assertEqual(self.root.command_report().total, before)
+
+    def test_destroyed_widget_is_skipped(self):
+        label = self.pool.acquire()
+        self.pool.release(label)
+        label.destroy()
+        self.assertIsNot(self.pool.acquire(), label)
+
+    def test_idle_trimming(self):
+        pool = WidgetPool(lambda: tkinter.Label(self.frame), trim_after=20)
+        widgets = [pool.acquire() for _ in range(3)]
+        for widget in widgets:
+            pool.release(widget)
+        deadline = time.monotonic() + 5
+        while len(pool) and time.monotonic() < deadline:
+            self.root.update()
+        self.assertEqual(len(pool), 0)
+        self.assertFalse(any(w.winfo_exists() for w in widgets))
+
+    def test_clear(self):
+        label = self.pool.acquire()
+        self.pool.release(label)
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        self.assertFalse(label.winfo_exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for ``InputReplay``."""
+
+import unittest
+import tkinter
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from fluent_tkinter import InputReplay, LatencyReport
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class LatencyReportTest(unittest.TestCase):
+
+    def test_statistics(self):
+        report = LatencyReport(tuple(float(i) for i in range(1, 101)), 2)
+        self.assertEqual(report.count, 100)
+        self.assertEqual(report.p50, 51.0)
+        self.assertEqual(report.p99, 99.0)
+        self.assertEqual(report.max, 100.0)
+        self.assertIn('2 missed', str(report))
+
+    def test_check(self):
+        report = LatencyReport((1.0, 2.0, 30.0), 0)
+        self.assertIs(report.check(p50=5, max=30), report)
+        with self.assertRaisesRegex(AssertionError, 'max 30.00 ms > 20'):
+            report.check(p50=5, max=20)
+
+
+class InputReplayTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.canvas = tkinter.Canvas(self.root, width=200, height=200)
+        self.canvas.pack()
+        self.root.update()
+        self.events = []
+
+    def tearDown(self):
+        self.canvas.destroy()
+        super().tearDown()
+
+    def test_replay(self):
+        self.canvas.bind('<ButtonPress>',
+                         lambda e: self.events.append(('press', e.num)))
+        self.canvas.bind('<B1-Motion>',
+                         lambda e: self.events.append((e.x, e.y)))
+        self.canvas.bind('<ButtonRelease>',
+                         lambda e: self.events.append('release'))
+        tags = self.canvas.bindtags()
+        replay = (InputReplay(self.canvas)
+                  .click(5, 5)
+                  .drag([(10, 10), (20, 20), (30, 30)]))
+        self.assertEqual(len(replay), 6)
+        report = replay.run(rate_hz=500)
+        self.assertIsInstance(report, LatencyReport)
+        self.assertEqual(report.count, 6)
+        self.assertEqual(report.missed, 0)
+        self.assertTrue(all(sample >= 0 for sample in report.samples))
+        self.assertEqual(self.events, [('press', 1), 'release',
+                                       ('press', 1), (20, 20), (30, 30),
+                                       'release'])
+        self.assertEqual(self.canvas.bindtags(), tags)
+
+    def test_keys_and_warmup(self):
+        entry = tkinter.Entry(self.root)
+        entry.pack()
+        report = InputReplay(entry).text('hi there').run(warmup=2)
+        self.assertEqual(entry.get(), 'hi there')
+        self.assertEqual(report.count, 14)
+        entry.destroy()
+
+    def test_recorded_timing(self):
+        replay = InputReplay(self.canvas).extend([
+            (0, '<Motion>', {'x': 1, 'y': 1}),
+            (30, '<Motion>', {'x': 2, 'y': 2}),
+        ])
+        self.canvas.bind('<Motion>', lambda e: self.events.append(e.x))
+        report = replay.pause(20).motion(3, 3).run()
+        self.assertEqual(self.events, [1, 2, 3])
+        self.assertEqual(report.count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Tests for the multiplexing timer scheduler."""
+
+import time
+import unittest
+import tkinter
+from test.support import requires
+
+from fluent_tkinter import Scheduler, TimerHandle
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class SchedulerTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.sched = self.root.scheduler()
+
+    def tearDown(self):
+        self.sched.cancel_all()
+        super().tearDown()
+
+    def pump(self, seconds):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.root.update()
+            time.sleep(0.001)
+
+    def test_scheduler_is_shared_per_root(self):
+        f = tkinter.Frame(self.root)
+        self.assertIsInstance(self.sched, Scheduler)
+        self.assertIs(f.scheduler(), self.sched)
+
+    def test_call_later_fires_in_order(self):
+        out = []
+        self.sched.call_later(30, out.append, 'c')
+        self.sched.call_later(10, out.append, 'a')
+        self.sched.call_later(20, out.append, 'b')
+        self.assertEqual(len(self.sched), 3)
+        self.pump(0.1)
+        self.assertEqual(out, ['a', 'b', 'c'])
+        self.assertEqual(len(self.sched), 0)
+
+    def test_cancel(self):
+        out = []
+        handle = self.sched.call_later(10, out.append, 'x')
+        self.assertIsInstance(handle, TimerHandle)
+        self.assertTrue(handle.active)
+        handle.cancel()
+        handle.cancel()
+        self.assertFalse(handle.active)
+        self.pump(0.05)
+        self.assertEqual(out, [])
+        self.assertEqual(len(self.sched), 0)
+
+    def test_no_tcl_commands_created(self):
+        before = len(self.root.tk.call('info', 'commands'))
+        handles = [self.sched.call_later(1000, print) for _ in range(1000)]
+        after = len(self.root.tk.call('info', 'commands'))
+        self.assertEqual(before, after)
+        for handle in handles:
+            handle.cancel()
+        self.assertIsNone(self.sched._timer)
+
+    def test_callback_can_schedule(self):
+        out = []
+
+        def tick(n):
+            out.append(n)
+            if n < 3:
+                self.sched.call_later(1, tick, n + 1)
+        self.sched.call_later(1, tick, 0)
+        self.pump(0.1)
+        self.assertEqual(out, [0, 1, 2, 3])
+
+    def test_exception_is_reported(self):
+        errors = []
+        out = []
+        self.root.report_callback_exception = lambda *a: errors.append(a[0])
+        try:
+            self.sched.call_later(1, lambda: 1 / 0)
+            self.sched.call_later(1, out.append, 'after')
+            self.pump(0.05)
+        finally:
+            del self.root.report_callback_exception
+        self.assertEqual(errors, [ZeroDivisionError])
+        self.assertEqual(out, ['after'])
+
+    def test_debounce(self):
+        out = []
+        debounced = self.sched.debounce(20, out.append)
+        for i in range(5):
+            debounced(i)
+        self.assertTrue(debounced.pending)
+        self.pump(0.08)
+        self.assertEqual(out, [4])
+        self.assertFalse(debounced.pending)
+
+    def test_debounce_flush_and_cancel(self):
+        out = []
+        debounced = self.sched.debounce(1000, out.append)
+        debounced('flushed')
+        debounced.flush()
+        self.assertEqual(out, ['flushed'])
+        debounced('dropped')
+        debounced.cancel()
+        self.pump(0.02)
+        self.assertEqual(out, ['flushed'])
+
+    def test_throttle(self):
+        out = []
+        throttled = self.sched.throttle(20, out.append)
+        for i in range(5):
+            throttled(i)
+        # Leading call runs immediately.
+        self.assertEqual(out, [0])
+        self.pump(0.08)
+        self.assertEqual(out, [0, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
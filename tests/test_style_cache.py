@@ -0,0 +1,134 @@
+"""Tests for ``ttk.Style.apply`` and the style query cache."""
+
+import unittest
+from tkinter import ttk
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class StyleCacheTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.style = ttk.Style(self.root)
+        self.theme = self.style.theme_use()
+        self.addCleanup(self.style.theme_use, self.theme)
+
+    def calls(self):
+        """Record the ttk::style commands run by self.style from now on."""
+        counter = []
+        self.addCleanup(setattr, self.style, 'tk', self.style.tk)
+        self.style.tk = _Counting(self.style.tk, counter)
+        return counter
+
+    def test_apply(self):
+        result = self.style.apply({
+            'Apply.TButton': {
+                'configure': {'padding': 7, 'foreground': 'blue'},
+                'map': {'foreground': [('active', 'red')]},
+            },
+            'Apply.TLabel': {'layout': [('Label.label', {'sticky': 'nswe'})]},
+        })
+        self.assertIs(result, self.style)
+        self.assertEqual(self.style.lookup('Apply.TButton', 'foreground'),
+                         'blue')
+        self.assertEqual(str(self.style.configure('Apply.TButton',
+                                                  'padding')), '7')
+        self.assertEqual(self.style.map('Apply.TButton', 'foreground'),
+                         [('active', 'red')])
+        self.assertEqual(self.style.layout('Apply.TLabel'),
+                         [('Label.label', {'sticky': 'nswe'})])
+        self.assertIs(self.style.apply({}), self.style)
+
+    def test_queries_are_cached(self):
+        self.style.configure('Cache.TButton', foreground='green')
+        calls = self.calls()
+        for _ in range(3):
+            self.assertEqual(
+                self.style.lookup('Cache.TButton', 'foreground'), 'green')
+            self.style.configure('Cache.TButton', 'foreground')
+            self.style.map('Cache.TButton', 'foreground')
+            self.style.layout('TButton')
+        self.assertEqual(len(calls), 4)
+
+    def test_shared_between_style_objects(self):
+        self.style.lookup('TButton', 'padding')
+        other = ttk.Style(self.root)
+        other.configure('TButton', padding=3)
+        self.assertEqual(str(self.style.lookup('TButton', 'padding')), '3')
+
+    def test_writes_invalidate(self):
+        self.style.configure('W.TButton', foreground='green')
+        self.assertEqual(self.style.lookup('W.TButton', 'foreground'),
+                         'green')
+        self.style.configure('W.TButton', foreground='red')
+        self.assertEqual(self.style.lookup('W.TButton', 'foreground'), 'red')
+        self.style.map('W.TButton', foreground=[('active', 'blue')])
+        self.assertEqual(self.style.map('W.TButton', 'foreground'),
+                         [('active', 'blue')])
+        self.style.layout('W.TButton', [('Button.label', {})])
+        self.assertEqual(self.style.layout('W.TButton'),
+                         [('Button.label', {})])
+        self.style.apply({'W.TButton': {'configure': {'foreground': 'x1'}}})
+        self.assertEqual(self.style.lookup('W.TButton', 'foreground'), 'x1')
+
+    def test_theme_use_invalidates(self):
+        themes = self.style.theme_names()
+        other = next(t for t in themes if t != self.theme)
+        self.style.layout('TButton')
+        self.style.lookup('TButton', 'padding')
+        self.style.theme_use(other)
+        self.assertEqual(self.style.layout('TButton'),
+                         ttk.Style.layout.__wrapped__(self.style, 'TButton'))
+        self.assertEqual(
+            self.style.lookup('TButton', 'padding'),
+            ttk.Style.lookup.__wrapped__(self.style, 'TButton', 'padding'))
+
+    def test_theme_change_from_tcl_invalidates(self):
+        other = next(t for t in self.style.theme_names() if t != self.theme)
+        self.style.layout('TButton')
+        self.root.tk.call('ttk::style', 'theme', 'use', other)
+        self.root.update()
+        self.assertEqual(self.style.layout('TButton'),
+                         ttk.Style.layout.__wrapped__(self.style, 'TButton'))
+
+    def test_clear_cache(self):
+        self.style.configure('C.TButton', foreground='green')
+        self.style.lookup('C.TButton', 'foreground')
+        self.root.tk.call('ttk::style', 'configure', 'C.TButton',
+                          '-foreground', 'red')
+        self.assertEqual(self.style.lookup('C.TButton', 'foreground'),
+                         'green')
+        self.assertIs(self.style.clear_cache(), self.style)
+        self.assertEqual(self.style.lookup('C.TButton', 'foreground'), 'red')
+
+    def test_results_are_copies(self):
+        layout = self.style.layout('TButton')
+        layout.append(('bogus', {}))
+        layout[0][1]['sticky'] = 'bogus'
+        self.assertNotIn(('bogus', {}), self.style.layout('TButton'))
+        self.assertNotEqual(self.style.layout('TButton')[0][1].get('sticky'),
+                            'bogus')
+
+
+class _Counting:
+
+    def __init__(self, tk, counter):
+        self._tk = tk
+        self._counter = counter
+
+    def call(self, *args):
+        if args and args[0] == 'ttk::style':
+            self._counter.append(args)
+        return self._tk.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for widget-tree templates (``fluent_tkinter.Template``)."""
+
+import unittest
+import tkinter
+from tkinter import ttk
+from test.support import requires
+
+from fluent_tkinter import Param, Template
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class TemplateTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = Template(self.root)
+        frame = self.form.widget(tkinter.Frame, padx=Param('pad', 4))
+        self.form.widget(tkinter.Label, frame, name='title',
+                         text=Param('title')).grid(row=0, column=0)
+        self.form.widget(ttk.Entry, frame, name='entry').grid(
+            row=1, column=0, padx=(Param('indent'), 2))
+        self.form.widget(tkinter.Button, frame, name='ok', text='OK',
+                         command=Param('on_ok')).grid(row=2, column=0)
+
+    def make(self, **params):
+        params.setdefault('title', 'Title')
+        params.setdefault('indent', 0)
+        params.setdefault('on_ok', lambda: None)
+        instance = self.form.instantiate(self.root, **params)
+        self.addCleanup(instance.root.destroy)
+        return instance
+
+    def test_instantiate(self):
+        instance = self.make(title='Hello')
+        frame = instance.root
+        self.assertIsInstance(frame, tkinter.Frame)
+        self.assertTrue(frame.winfo_exists())
+        self.assertIs(self.root.nametowidget(frame._w), frame)
+        self.assertEqual(str(frame.cget('padx')), '4')
+        title = instance['title']
+        self.assertIsInstance(title, tkinter.Label)
+        self.assertIs(title.master, frame)
+        self.assertEqual(title.cget('text'), 'Hello')
+        self.assertEqual(title.grid_info()['row'], 0)
+        self.assertIsInstance(instance['entry'], ttk.Entry)
+        self.assertEqual(instance['entry'].grid_info()['padx'], (0, 2))
+
+    def test_instances_are_independent(self):
+        a = self.make(title='a', pad=1)
+        b = self.make(title='b', pad=2)
+        self.assertNotEqual(a.root._w, b.root._w)
+        self.assertEqual(a['title'].cget('text'), 'a')
+        self.assertEqual(b['title'].cget('text'), 'b')
+        # Automatic names continue the tkinter sequence.
+        frame = tkinter.Frame(self.root)
+        self.addCleanup(frame.destroy)
+        self.assertNotIn(frame._w, (a.root._w, b.root._w))
+
+    def test_special_characters(self):
+        text = 'Price: $5 [net] {x} "q"\\ \n'
+        instance = self.make(title=text)
+        self.assertEqual(instance['title'].cget('text'), text)
+
+    def test_callback_params(self):
+        calls = []
+        instance = self.make(on_ok=lambda: calls.append(1))
+        instance['ok'].invoke()
+        self.assertEqual(calls, [1])
+
+    def test_recorded_callbacks_and_bindings(self):
+        events = []
+        form = Template(self.root)
+        button = form.widget(tkinter.Button, name='b',
+                             command=lambda: events.append('command'))
+        button.bind('<<Ping>>', lambda e: events.append(e.widget))
+        instance = form.instantiate(self.root)
+        widget = instance['b']
+        self.addCleanup(widget.destroy)
+        widget.invoke()
+        widget.event_generate('<<Ping>>')
+        self.assertEqual(events, ['command', widget])
+        self.assertEqual(len(widget._tclCommands), 2)
+
+    def test_children_can_be_added(self):
+        instance = self.make()
+        label = tkinter.Label(instance.root)
+        self.assertTrue(instance['title'].winfo_exists())
+        self.assertIn(label, instance.root.winfo_children())
+
+    def test_missing_and_unknown_params(self):
+        with self.assertRaises(TypeError):
+            self.form.instantiate(self.root, indent=0, on_ok=print)
+        with self.assertRaises(TypeError):
+            self.form.instantiate(self.root, title='', indent=0,
+                                  on_ok=print, bogus=1)
+
+    def test_failed_instantiation_cleans_up(self):
+        form = Template(self.root)
+        frame = form.widget(tkinter.Frame)
+        form.widget(tkinter.Label, frame, relief=Param('relief'))
+        before = self.root.winfo_children()
+        with self.assertRaises(tkinter.TclError):
+            form.instantiate(self.root, relief='bogus')
+        self.assertEqual(self.root.winfo_children(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
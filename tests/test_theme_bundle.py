@@ -0,0 +1,146 @@
+"""Tests for cached theme bundles (``ttk.Style.load_theme``)."""
+
+import os
+import tempfile
+import unittest
+import tkinter
+import tkinter.font
+from tkinter import ttk
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+def settings():
+    return {
+        'Bundle.TButton': {
+            'configure': {'padding': 9, 'foreground': 'navy'},
+            'map': {'foreground': [('active', 'red')]},
+            'layout': [('Button.label', {'sticky': 'nswe'})],
+        },
+    }
+
+
+class ThemeBundleTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+        self.style = ttk.Style(self.root)
+        self.addCleanup(self.style.theme_use, self.style.theme_use())
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return settings()
+
+    def load(self, style, name, **kw):
+        kw.setdefault('version', '1')
+        return style.load_theme(name, self.build, 'default',
+                                cache_dir=self.cache_dir, **kw)
+
+    def check_theme(self, style, name):
+        style.theme_use(name)
+        self.assertEqual(str(style.lookup('Bundle.TButton', 'padding')), '9')
+        self.assertEqual(style.map('Bundle.TButton', 'foreground'),
+                         [('active', 'red')])
+        self.assertEqual(style.layout('Bundle.TButton'),
+                         [('Button.label', {'sticky': 'nswe'})])
+        # Inherited from the parent theme.
+        self.assertIn('Button.border', style.element_names())
+
+    def test_cold_then_warm(self):
+        self.assertIs(self.load(self.style, 'bundle1'), self.style)
+        self.assertEqual(self.builds, 1)
+        self.check_theme(self.style, 'bundle1')
+        files = os.listdir(self.cache_dir)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].startswith('bundle1-'))
+
+        other = tkinter.Tk()
+        self.addCleanup(other.destroy)
+        style = ttk.Style(other)
+        self.load(style, 'bundle1')
+        self.assertEqual(self.builds, 1)
+        self.check_theme(style, 'bundle1')
+
+    def test_existing_theme_is_kept(self):
+        self.load(self.style, 'bundle2')
+        self.load(self.style, 'bundle2')
+        self.assertEqual(self.builds, 1)
+
+    def test_version_invalidates(self):
+        self.load(self.style, 'bundle3')
+        other = tkinter.Tk()
+        self.addCleanup(other.destroy)
+        self.load(ttk.Style(other), 'bundle3', version='2')
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_default_version_hashes_source(self):
+        self.style.load_theme('bundle4', settings, cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_damaged_file_is_rebuilt(self):
+        self.load(self.style, 'bundle5')
+        path = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(path, 'w') as f:
+            f.write('this is not {valid')
+        other = tkinter.Tk()
+        self.addCleanup(other.destroy)
+        style = ttk.Style(other)
+        self.load(style, 'bundle5')
+        self.assertEqual(self.builds, 2)
+        self.check_theme(style, 'bundle5')
+
+    def test_images_are_not_cached(self):
+        image = tkinter.PhotoImage(master=self.root, width=4, height=4)
+        self.style.load_theme(
+            'bundle6',
+            lambda: {'img': {'element create': ['image', image]}},
+            cache_dir=self.cache_dir)
+        self.assertIn('bundle6', self.style.theme_names())
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_image_names_are_not_cached(self):
+        image = tkinter.PhotoImage(master=self.root, width=4, height=4)
+        self.style.load_theme(
+            'bundle7',
+            lambda: {'img': {'element create': ('image', image.name)},
+                     'Img.TLabel': {'configure': {'image': image.name}}},
+            cache_dir=self.cache_dir)
+        self.assertIn('bundle7', self.style.theme_names())
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_named_fonts_are_not_cached(self):
+        fonts = []
+
+        def build():
+            fonts.append(tkinter.font.Font(self.root, size=15))
+            return {'Font.TLabel': {'configure': {'font': fonts[-1]}},
+                    'Name.TLabel': {'configure': {'font': str(fonts[-1])}}}
+
+        self.style.load_theme('bundle9', build, cache_dir=self.cache_dir)
+        self.assertIn('bundle9', self.style.theme_names())
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        # Tk's standard fonts exist in every process.
+        self.style.load_theme(
+            'bundle10',
+            lambda: {'Std.TLabel': {'configure': {'font': 'TkFixedFont'}}},
+            cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_theme_name_is_not_a_path(self):
+        self.load(self.style, '../bundle 8/x')
+        names = os.listdir(self.cache_dir)
+        self.assertEqual(len(names), 1)
+        self.assertTrue(names[0].startswith('.._bundle_8_x-'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests for cross-thread call marshaling (``from_thread``)."""
+
+import threading
+import time
+import unittest
+import tkinter
+import _tkinter
+from test.support import requires
+
+from fluent_tkinter import ThreadProxy
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class FromThreadTest(AbstractTkTest, unittest.TestCase):
+
+    def run_worker(self, target):
+        thread = threading.Thread(target=target)
+        thread.start()
+        # The worker blocks until the Tk thread has drained its calls.
+        deadline = time.monotonic() + 5
+        while thread.is_alive() and time.monotonic() < deadline:
+            self.root.update()
+        thread.join(0)
+        self.assertFalse(thread.is_alive())
+
+    def test_from_thread_returns_proxy(self):
+        f = tkinter.Frame(self.root)
+        self.assertIsInstance(f.from_thread(), ThreadProxy)
+
+    def test_chain_runs_on_tk_thread(self):
+        f = tkinter.Frame(self.root)
+        results = []
+
+        def worker():
+            proxy = f.from_thread().configure(width=77).pack(side='left')
+            results.append(proxy.result(5))
+
+        self.run_worker(worker)
+        self.assertEqual(results, [f])
+        self.assertEqual(f['width'], 77)
+        self.assertEqual(f.winfo_manager(), 'pack')
+
+    def test_chain_passes_values_through(self):
+        f = tkinter.Frame(self.root, width=42)
+        results = []
+
+        def worker():
+            results.append(f.from_thread().cget('width').result(5))
+
+        self.run_worker(worker)
+        self.assertEqual(results, [42])
+
+    def test_calls_keep_submission_order(self):
+        f = tkinter.Frame(self.root)
+        seen = []
+
+        def worker():
+            for i in range(100):
+                f.call_from_thread(seen.append, i)
+            f.call_from_thread(lambda: None).result(5)
+
+        self.run_worker(worker)
+        self.assertEqual(seen, list(range(100)))
+
+    def test_call_from_thread_runs_on_tk_thread(self):
+        tk_thread = threading.get_ident()
+        threads = []
+
+        def worker():
+            future = self.root.call_from_thread(threading.get_ident)
+            threads.append(future.result(5))
+
+        self.run_worker(worker)
+        self.assertEqual(threads, [tk_thread])
+
+    def test_error_propagates_along_chain(self):
+        f = tkinter.Frame(self.root)
+        errors = []
+        self.root.report_callback_exception = lambda *args: errors.append(args)
+
+        def worker():
+            proxy = f.from_thread().configure(nosuchoption=1).pack()
+            try:
+                proxy.result(5)
+            except tkinter.TclError as exc:
+                errors.append(exc)
+
+        try:
+            self.run_worker(worker)
+        finally:
+            del self.root.report_callback_exception
+        # Reported once by the Tk thread, then raised to the worker.
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(errors[1], tkinter.TclError)
+        self.assertEqual(f.winfo_manager(), '')
+
+    def test_budget_yields_to_event_loop(self):
+        dispatcher = self.root.from_thread()._dispatcher
+        old_budget = dispatcher.budget
+        dispatcher.budget = 0
+        counter = []
+        try:
+            for _ in range(10):
+                self.root.call_from_thread(counter.append, 1)
+            # A zero budget runs one call per wake-up.
+            self.root.tk.dooneevent(_tkinter.DONT_WAIT)
+            self.assertLess(len(counter), 10)
+            deadline = time.monotonic() + 5
+            while len(counter) < 10 and time.monotonic() < deadline:
+                self.root.update()
+        finally:
+            dispatcher.budget = old_budget
+        self.assertEqual(len(counter), 10)
+
+    def test_destroy_cancels_pending_calls(self):
+        root = tkinter.Tk()
+        root.withdraw()
+        future = root.call_from_thread(print)
+        root.destroy()
+        self.assertTrue(future.cancelled())
+        self.assertTrue(root.call_from_thread(print).cancelled())
+
+
+if __name__ == "__main__":
+    unittest.main()
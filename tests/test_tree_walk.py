@@ -0,0 +1,70 @@
+"""Tests for ``Misc.walk``, ``Misc.descendants`` and
+``Misc.find_widget``."""
+
+import unittest
+import tkinter
+import tkinter.ttk as ttk
+from test.support import requires
+
+import fluent_tkinter  # noqa: F401
+from tests.cpython_test_tkinter.support import AbstractTkTest
+
+requires('gui')
+
+
+class TreeWalkTest(AbstractTkTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.top = tkinter.Frame(self.root)
+        self.a = tkinter.Frame(self.top, name='a')
+        self.a1 = tkinter.Label(self.a, name='a1')
+        self.a2 = ttk.Button(self.a, name='a2')
+        self.b = ttk.Frame(self.top, name='b')
+        self.b1 = tkinter.Label(self.b, name='b1')
+
+    def tearDown(self):
+        self.top.destroy()
+        super().tearDown()
+
+    def test_walk(self):
+        self.assertEqual(list(self.top.walk()),
+                         [self.top, self.a, self.a1, self.a2, self.b,
+                          self.b1])
+        self.assertEqual(list(self.a1.walk()), [self.a1])
+
+    def test_walk_matches_winfo_children(self):
+        def recurse(widget):
+            yield widget
+            for child in widget.winfo_children():
+                yield from recurse(child)
+        self.assertCountEqual(self.top.walk(), recurse(self.top))
+
+    def test_descendants(self):
+        self.assertEqual(list(self.top.descendants()),
+                         [self.a, self.a1, self.a2, self.b, self.b1])
+        self.assertEqual(list(self.top.descendants(tkinter.Label)),
+                         [self.a1, self.b1])
+        self.assertEqual(list(self.top.descendants((ttk.Button, ttk.Frame))),
+                         [self.a2, self.b])
+        self.assertEqual(
+            list(self.top.descendants(lambda w: w._name.endswith('2'))),
+            [self.a2])
+
+    def test_destroy_while_walking(self):
+        seen = []
+        for widget in self.top.descendants():
+            seen.append(widget)
+            if widget is self.a:
+                widget.destroy()
+        self.assertEqual(seen, [self.a, self.b, self.b1])
+
+    def test_find_widget(self):
+        self.assertIs(self.top.find_widget('b1'), self.b1)
+        self.assertIs(self.a.find_widget('a2'), self.a2)
+        self.assertIsNone(self.a.find_widget('b1'))
+        self.assertIsNone(self.top.find_widget('missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()